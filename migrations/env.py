@@ -20,9 +20,11 @@ load_dotenv()
 from src.infrastructure.database.models.base import Base
 from src.infrastructure.database.models.athlete import Athlete
 from src.infrastructure.database.models.group import Group, AthleteGroup
-from src.infrastructure.database.models.test import TestDefinition, TestResult, TestAnalysis
+from src.infrastructure.database.models.test import TestDefinition, TestResult, TestResultSummary, TestAnalysis, TestSignal
 from src.infrastructure.database.models.anthropometric import AnthropometricData
 from src.infrastructure.database.models.batch import BatchOperation
+from src.infrastructure.database.models.cache_version import CacheVersion
+from src.infrastructure.database.models.leaderboard import LeaderboardEntry
 
 # this is the Alembic Config object
 config = context.config
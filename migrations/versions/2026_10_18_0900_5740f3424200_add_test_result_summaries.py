@@ -0,0 +1,54 @@
+"""Add test result summaries
+
+Revision ID: 5740f3424200
+Revises: 83e8d2b2ae1d
+Create Date: 2026-10-18 09:00:12.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5740f3424200'
+down_revision: Union[str, None] = '83e8d2b2ae1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('test_result_summaries',
+    sa.Column('athlete_id', sa.UUID(), nullable=False),
+    sa.Column('test_definition_id', sa.UUID(), nullable=False),
+    sa.Column('result_count', sa.Integer(), nullable=False),
+    sa.Column('value_sum', sa.Float(), nullable=False),
+    sa.Column('min_value', sa.Float(), nullable=False),
+    sa.Column('max_value', sa.Float(), nullable=False),
+    sa.Column('latest_value', sa.Float(), nullable=False),
+    sa.Column('first_test_date', sa.DateTime(), nullable=False),
+    sa.Column('latest_test_date', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athletes.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['test_definition_id'], ['test_definitions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('athlete_id', 'test_definition_id')
+    )
+
+    # Backfill from existing results
+    op.execute("""
+        INSERT INTO test_result_summaries (
+            athlete_id, test_definition_id, result_count, value_sum,
+            min_value, max_value, latest_value, first_test_date, latest_test_date
+        )
+        SELECT athlete_id, test_definition_id, count(*), sum(primary_value),
+               min(primary_value), max(primary_value),
+               (array_agg(primary_value ORDER BY test_date DESC))[1],
+               min(test_date), max(test_date)
+        FROM test_results
+        GROUP BY athlete_id, test_definition_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('test_result_summaries')
@@ -0,0 +1,119 @@
+"""Partition test_results by season
+
+Revision ID: 323af7a21507
+Revises: 5740f3424200
+Create Date: 2026-10-18 09:30:41.771052
+
+"""
+import os
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '323af7a21507'
+down_revision: Union[str, None] = '5740f3424200'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEASON_START_MONTH = int(os.getenv('SEASON_START_MONTH', '1'))
+
+
+def _season_for(moment: datetime) -> int:
+    return moment.year if moment.month >= SEASON_START_MONTH else moment.year - 1
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+
+    # test_results.id stops being unique on its own, so the reference from
+    # test_analyses can no longer be a foreign key
+    op.drop_constraint('test_analyses_test_result_id_fkey', 'test_analyses', type_='foreignkey')
+    op.create_index('ix_test_analyses_test_result_id', 'test_analyses', ['test_result_id'])
+
+    op.rename_table('test_results', 'test_results_unpartitioned')
+    op.execute("""
+        CREATE TABLE test_results (
+            test_definition_id UUID NOT NULL REFERENCES test_definitions (id),
+            athlete_id UUID NOT NULL REFERENCES athletes (id),
+            test_date TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            primary_value DOUBLE PRECISION NOT NULL,
+            additional_values JSON,
+            conditions JSON,
+            validated BOOLEAN,
+            id UUID NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, test_date)
+        ) PARTITION BY RANGE (test_date)
+    """)
+
+    # One partition per season from the oldest result through next season
+    oldest = connection.execute(sa.text("SELECT min(test_date) FROM test_results_unpartitioned")).scalar()
+    now = datetime.utcnow()
+    for season in range(_season_for(oldest or now), _season_for(now) + 2):
+        start = datetime(season, SEASON_START_MONTH, 1)
+        end = datetime(season + 1, SEASON_START_MONTH, 1)
+        op.execute(
+            f"CREATE TABLE test_results_{season} PARTITION OF test_results "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute("CREATE TABLE test_results_default PARTITION OF test_results DEFAULT")
+
+    op.execute("""
+        INSERT INTO test_results (
+            test_definition_id, athlete_id, test_date, primary_value,
+            additional_values, conditions, validated, id, created_at, updated_at
+        )
+        SELECT test_definition_id, athlete_id, test_date, primary_value,
+               additional_values, conditions, validated, id, created_at, updated_at
+        FROM test_results_unpartitioned
+    """)
+    op.drop_table('test_results_unpartitioned')
+
+    # Created on the parent, so every partition gets its own local index
+    op.execute("DROP INDEX IF EXISTS idx_test_results_date")
+    op.execute("DROP INDEX IF EXISTS idx_test_results_athlete_test")
+    op.create_index('idx_test_results_date', 'test_results', [sa.text('test_date DESC')])
+    op.create_index('idx_test_results_athlete_test', 'test_results',
+                    ['athlete_id', 'test_definition_id', sa.text('test_date DESC')])
+
+
+def downgrade() -> None:
+    op.rename_table('test_results', 'test_results_partitioned')
+    op.create_table('test_results',
+    sa.Column('test_definition_id', sa.UUID(), nullable=False),
+    sa.Column('athlete_id', sa.UUID(), nullable=False),
+    sa.Column('test_date', sa.DateTime(), nullable=False),
+    sa.Column('primary_value', sa.Float(), nullable=False),
+    sa.Column('additional_values', sa.JSON(), nullable=True),
+    sa.Column('conditions', sa.JSON(), nullable=True),
+    sa.Column('validated', sa.Boolean(), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athletes.id'], ),
+    sa.ForeignKeyConstraint(['test_definition_id'], ['test_definitions.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("""
+        INSERT INTO test_results (
+            test_definition_id, athlete_id, test_date, primary_value,
+            additional_values, conditions, validated, id, created_at, updated_at
+        )
+        SELECT test_definition_id, athlete_id, test_date, primary_value,
+               additional_values, conditions, validated, id, created_at, updated_at
+        FROM test_results_partitioned
+    """)
+    # Dropping the parent drops every attached partition with it
+    op.drop_table('test_results_partitioned')
+    op.create_index('idx_test_results_date', 'test_results', [sa.text('test_date DESC')])
+    op.create_index('idx_test_results_athlete_test', 'test_results',
+                    ['athlete_id', 'test_definition_id', sa.text('test_date DESC')])
+
+    op.drop_index('ix_test_analyses_test_result_id', 'test_analyses')
+    op.create_foreign_key('test_analyses_test_result_id_fkey', 'test_analyses',
+                          'test_results', ['test_result_id'], ['id'])
@@ -0,0 +1,31 @@
+"""Add cache versions
+
+Revision ID: 2537f163cca8
+Revises: 323af7a21507
+Create Date: 2026-10-18 10:00:03.118934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2537f163cca8'
+down_revision: Union[str, None] = '323af7a21507'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    cache_versions = op.create_table('cache_versions',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(cache_versions, [{'name': 'test_definitions', 'version': 0}])
+
+
+def downgrade() -> None:
+    op.drop_table('cache_versions')
@@ -0,0 +1,49 @@
+"""JSONB result values and promoted metric slots
+
+Revision ID: 4cf19a844cd2
+Revises: 2537f163cca8
+Create Date: 2026-10-18 10:30:27.540391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4cf19a844cd2'
+down_revision: Union[str, None] = '2537f163cca8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROMOTED_SLOTS = 4
+
+
+def upgrade() -> None:
+    op.alter_column('test_results', 'additional_values',
+                    type_=postgresql.JSONB(), postgresql_using='additional_values::jsonb')
+    op.alter_column('test_results', 'conditions',
+                    type_=postgresql.JSONB(), postgresql_using='conditions::jsonb')
+    op.create_index('idx_test_results_additional_values', 'test_results',
+                    ['additional_values'], postgresql_using='gin')
+
+    op.add_column('test_definitions', sa.Column('promoted_variables', sa.JSON(), nullable=True))
+    for slot in range(1, PROMOTED_SLOTS + 1):
+        op.add_column('test_results', sa.Column(f'metric_{slot}', sa.Float(), nullable=True))
+        op.create_index(f'idx_test_results_test_metric_{slot}', 'test_results',
+                        ['test_definition_id', f'metric_{slot}'])
+
+
+def downgrade() -> None:
+    for slot in range(1, PROMOTED_SLOTS + 1):
+        op.drop_index(f'idx_test_results_test_metric_{slot}', 'test_results')
+        op.drop_column('test_results', f'metric_{slot}')
+    op.drop_column('test_definitions', 'promoted_variables')
+
+    op.drop_index('idx_test_results_additional_values', 'test_results')
+    op.alter_column('test_results', 'conditions',
+                    type_=sa.JSON(), postgresql_using='conditions::json')
+    op.alter_column('test_results', 'additional_values',
+                    type_=sa.JSON(), postgresql_using='additional_values::json')
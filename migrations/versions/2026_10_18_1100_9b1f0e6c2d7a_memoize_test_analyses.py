@@ -0,0 +1,43 @@
+"""Memoize test analyses by result and analyzer version
+
+Revision ID: 9b1f0e6c2d7a
+Revises: 4cf19a844cd2
+Create Date: 2026-10-18 11:00:41.502817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1f0e6c2d7a'
+down_revision: Union[str, None] = '4cf19a844cd2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('test_analyses', sa.Column('analyzer_version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('test_analyses', sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    # Analyses are written with Core upserts, so timestamps come from the server
+    op.alter_column('test_analyses', 'created_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=sa.text('now()'))
+    op.alter_column('test_analyses', 'updated_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=sa.text('now()'))
+    # Existing rows predate memoization and carry no full payload
+    op.execute('DELETE FROM test_analyses')
+    op.create_unique_constraint('uq_test_analyses_result_analyzer', 'test_analyses',
+                                ['test_result_id', 'analyzer_type', 'analyzer_version'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_test_analyses_result_analyzer', 'test_analyses', type_='unique')
+    op.alter_column('test_analyses', 'updated_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=None)
+    op.alter_column('test_analyses', 'created_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=None)
+    op.drop_column('test_analyses', 'payload')
+    op.drop_column('test_analyses', 'analyzer_version')
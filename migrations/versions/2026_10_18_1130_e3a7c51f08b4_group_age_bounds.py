@@ -0,0 +1,47 @@
+"""Integer age bounds on groups
+
+Revision ID: e3a7c51f08b4
+Revises: 9b1f0e6c2d7a
+Create Date: 2026-10-18 11:30:12.094517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a7c51f08b4'
+down_revision: Union[str, None] = '9b1f0e6c2d7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('groups', sa.Column('min_age', sa.Integer(), nullable=True))
+    op.add_column('groups', sa.Column('max_age', sa.Integer(), nullable=True))
+    op.execute("""
+        UPDATE groups
+        SET min_age = (age_range->>'min')::integer,
+            max_age = (age_range->>'max')::integer
+        WHERE age_range IS NOT NULL
+    """)
+    op.create_index('idx_group_natural_age', 'groups',
+                    ['sport', 'gender', 'min_age', 'max_age'],
+                    postgresql_where=sa.text('NOT is_custom'))
+    # Regrouping inserts groups and memberships set-based, without timestamps
+    for table in ('groups', 'athlete_groups'):
+        for column in ('created_at', 'updated_at'):
+            op.alter_column(table, column, existing_type=sa.DateTime(),
+                            existing_nullable=False, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    for table in ('groups', 'athlete_groups'):
+        for column in ('created_at', 'updated_at'):
+            op.alter_column(table, column, existing_type=sa.DateTime(),
+                            existing_nullable=False, server_default=None)
+    op.drop_index('idx_group_natural_age', 'groups')
+    op.drop_column('groups', 'max_age')
+    op.drop_column('groups', 'min_age')
@@ -0,0 +1,60 @@
+"""Add leaderboard entries
+
+Revision ID: 6d2c8e4b7a15
+Revises: e3a7c51f08b4
+Create Date: 2026-10-18 12:00:37.661204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d2c8e4b7a15'
+down_revision: Union[str, None] = 'e3a7c51f08b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('leaderboard_entries',
+    sa.Column('group_id', sa.UUID(), nullable=False),
+    sa.Column('test_definition_id', sa.UUID(), nullable=False),
+    sa.Column('athlete_id', sa.UUID(), nullable=False),
+    sa.Column('max_value', sa.Float(), nullable=False),
+    sa.Column('min_value', sa.Float(), nullable=False),
+    sa.Column('latest_value', sa.Float(), nullable=False),
+    sa.Column('latest_test_date', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['group_id'], ['groups.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['test_definition_id'], ['test_definitions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athletes.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('group_id', 'test_definition_id', 'athlete_id')
+    )
+    op.create_index('idx_leaderboard_max', 'leaderboard_entries',
+                    ['group_id', 'test_definition_id', 'max_value', 'athlete_id'])
+    op.create_index('idx_leaderboard_min', 'leaderboard_entries',
+                    ['group_id', 'test_definition_id', 'min_value', 'athlete_id'])
+    op.create_index('idx_leaderboard_latest', 'leaderboard_entries',
+                    ['group_id', 'test_definition_id', 'latest_value', 'athlete_id'])
+
+    # Backfill from the result rollups of current members
+    op.execute("""
+        INSERT INTO leaderboard_entries (
+            group_id, test_definition_id, athlete_id,
+            max_value, min_value, latest_value, latest_test_date
+        )
+        SELECT ag.group_id, s.test_definition_id, s.athlete_id,
+               s.max_value, s.min_value, s.latest_value, s.latest_test_date
+        FROM test_result_summaries s
+        JOIN athlete_groups ag ON ag.athlete_id = s.athlete_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_leaderboard_latest', 'leaderboard_entries')
+    op.drop_index('idx_leaderboard_min', 'leaderboard_entries')
+    op.drop_index('idx_leaderboard_max', 'leaderboard_entries')
+    op.drop_table('leaderboard_entries')
@@ -0,0 +1,39 @@
+"""Add test signals
+
+Revision ID: b84f1d2c9e60
+Revises: 6d2c8e4b7a15
+Create Date: 2026-10-18 12:30:12.418530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b84f1d2c9e60'
+down_revision: Union[str, None] = '6d2c8e4b7a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('test_signals',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('test_result_id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('sample_rate', sa.Float(), nullable=False),
+    sa.Column('sample_count', sa.Integer(), nullable=False),
+    sa.Column('storage_key', sa.String(), nullable=False),
+    sa.Column('byte_size', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('test_result_id', 'name', name='uq_test_signals_result_name')
+    )
+    op.create_index(op.f('ix_test_signals_test_result_id'), 'test_signals', ['test_result_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_test_signals_test_result_id'), table_name='test_signals')
+    op.drop_table('test_signals')
@@ -0,0 +1,34 @@
+"""Result timestamp defaults
+
+Revision ID: f1c94a7d3e28
+Revises: b84f1d2c9e60
+Create Date: 2026-10-18 13:00:27.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c94a7d3e28'
+down_revision: Union[str, None] = 'b84f1d2c9e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Results are written without timestamps, both through the ORM and by
+    # the bulk Core insert, so the database fills them in
+    op.alter_column('test_results', 'created_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=sa.text('now()'))
+    op.alter_column('test_results', 'updated_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    op.alter_column('test_results', 'updated_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=None)
+    op.alter_column('test_results', 'created_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=None)
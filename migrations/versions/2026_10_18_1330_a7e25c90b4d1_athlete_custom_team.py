@@ -0,0 +1,37 @@
+"""Athlete custom team
+
+Revision ID: a7e25c90b4d1
+Revises: f1c94a7d3e28
+Create Date: 2026-10-18 13:30:08.215394
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e25c90b4d1'
+down_revision: Union[str, None] = 'f1c94a7d3e28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('athletes', sa.Column('custom_team', sa.String(), nullable=True))
+    op.create_index('idx_athlete_custom_team', 'athletes', ['custom_team'])
+    # Athletes are written without timestamps, so the database fills them in
+    op.alter_column('athletes', 'created_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=sa.text('now()'))
+    op.alter_column('athletes', 'updated_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    op.alter_column('athletes', 'updated_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=None)
+    op.alter_column('athletes', 'created_at', existing_type=sa.DateTime(),
+                    existing_nullable=False, server_default=None)
+    op.drop_index('idx_athlete_custom_team', table_name='athletes')
+    op.drop_column('athletes', 'custom_team')
@@ -0,0 +1,102 @@
+"""Natural groups follow age groups
+
+Revision ID: c3d9f2a61e57
+Revises: a7e25c90b4d1
+Create Date: 2026-10-18 14:00:45.310822
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d9f2a61e57'
+down_revision: Union[str, None] = 'a7e25c90b4d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Natural group brackets moved from U12 (0-12) ... Senior (21+) to the
+# AgeGroup names: U12 splits into U8 (0-8), U10 (9-10) and U12 (11-12),
+# Senior becomes 20+, and U14 to U20 are unchanged
+NEW_BRACKETS = [('U8', 0, 8), ('U10', 9, 10)]
+
+ATHLETE_AGE = "date_part('year', age(current_date, a.birthdate))::integer"
+
+REBUILD_LEADERBOARDS = """
+    DELETE FROM leaderboard_entries;
+    INSERT INTO leaderboard_entries (
+        group_id, test_definition_id, athlete_id,
+        max_value, min_value, latest_value, latest_test_date
+    )
+    SELECT ag.group_id, s.test_definition_id, s.athlete_id,
+           s.max_value, s.min_value, s.latest_value, s.latest_test_date
+    FROM test_result_summaries s
+    JOIN athlete_groups ag ON ag.athlete_id = s.athlete_id
+"""
+
+
+def upgrade() -> None:
+    # Same bounds, new name; members and boards stay with the group
+    op.execute("""
+        UPDATE groups SET name = regexp_replace(name, 'Senior$', '20+')
+        WHERE NOT is_custom AND name LIKE '% Senior'
+          AND NOT EXISTS (
+              SELECT 1 FROM groups renamed
+              WHERE renamed.sport = groups.sport AND renamed.gender = groups.gender
+                AND renamed.name = regexp_replace(groups.name, 'Senior$', '20+')
+          )
+    """)
+    op.execute("""
+        UPDATE groups SET min_age = 11, age_range = '{"min": 11, "max": 12}'
+        WHERE NOT is_custom AND min_age = 0 AND max_age = 12
+    """)
+
+    for name, min_age, max_age in NEW_BRACKETS:
+        # A group per sport and gender with athletes of that age today
+        op.execute(f"""
+            INSERT INTO groups (id, name, type, sport, gender, age_range, min_age, max_age, is_custom)
+            SELECT DISTINCT ON (a.sport, a.gender)
+                   gen_random_uuid(), concat_ws(' ', a.sport, a.gender, '{name}'), 'natural',
+                   a.sport, a.gender, json_build_object('min', {min_age}, 'max', {max_age}),
+                   {min_age}, {max_age}, false
+            FROM athletes a
+            WHERE {ATHLETE_AGE} BETWEEN {min_age} AND {max_age}
+            ON CONFLICT ON CONSTRAINT unq_group_sport_gender_name DO NOTHING
+        """)
+        # Move their primary membership over from the old 0-12 group
+        op.execute(f"""
+            UPDATE athlete_groups ag SET group_id = target.id
+            FROM athletes a, groups old, groups target
+            WHERE ag.athlete_id = a.id AND ag.is_primary AND ag.group_id = old.id
+              AND NOT old.is_custom AND old.min_age = 11 AND old.max_age = 12
+              AND NOT target.is_custom AND target.sport = a.sport AND target.gender = a.gender
+              AND target.min_age = {min_age} AND target.max_age = {max_age}
+              AND {ATHLETE_AGE} BETWEEN {min_age} AND {max_age}
+        """)
+
+    op.execute(REBUILD_LEADERBOARDS)
+
+
+def downgrade() -> None:
+    # Fold U8 and U10 back into a 0-12 U12 group
+    op.execute("""
+        UPDATE groups SET min_age = 0, age_range = '{"min": 0, "max": 12}'
+        WHERE NOT is_custom AND min_age = 11 AND max_age = 12
+    """)
+    op.execute("""
+        UPDATE athlete_groups ag SET group_id = target.id
+        FROM groups old, groups target
+        WHERE ag.group_id = old.id AND ag.is_primary
+          AND NOT old.is_custom AND old.max_age <= 10
+          AND NOT target.is_custom AND target.sport = old.sport AND target.gender = old.gender
+          AND target.min_age = 0 AND target.max_age = 12
+    """)
+    op.execute("DELETE FROM groups WHERE NOT is_custom AND max_age <= 10")
+    op.execute("""
+        UPDATE groups SET name = regexp_replace(name, '20\\+$', 'Senior')
+        WHERE NOT is_custom AND name LIKE '% 20+'
+    """)
+
+    op.execute(REBUILD_LEADERBOARDS)
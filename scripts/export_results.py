@@ -0,0 +1,44 @@
+import argparse
+import sys
+from datetime import datetime
+from uuid import UUID
+from src.app import create_app
+from src.application.test.queries.export_results import (
+    CONTENT_TYPES,
+    ExportResultsHandler,
+    ExportResultsQuery
+)
+from src.infrastructure.database.repositories.async_test_repository import read_repository_factory
+
+def main():
+    parser = argparse.ArgumentParser(description="Export test results as CSV or NDJSON")
+    parser.add_argument('--format', choices=sorted(CONTENT_TYPES), default='csv')
+    parser.add_argument('--group-id', type=UUID)
+    parser.add_argument('--test-id', type=UUID)
+    parser.add_argument('--sport')
+    parser.add_argument('--start-date', type=datetime.fromisoformat)
+    parser.add_argument('--end-date', type=datetime.fromisoformat)
+    parser.add_argument('--output', help="File to write (default: stdout)")
+    args = parser.parse_args()
+
+    app = create_app('default')
+    query = ExportResultsQuery(
+        format=args.format,
+        group_id=args.group_id,
+        test_id=args.test_id,
+        sport=args.sport,
+        start_date=args.start_date,
+        end_date=args.end_date
+    )
+    chunks = ExportResultsHandler(read_repository_factory(app.db)).handle(query)
+
+    output = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        for chunk in chunks:
+            output.write(chunk)
+    finally:
+        if args.output:
+            output.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
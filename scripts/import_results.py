@@ -0,0 +1,138 @@
+import argparse
+import json
+import os
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from uuid import UUID
+from src.app import create_app
+from src.application.test.commands.import_results import (
+    IMPORT_CHUNK_SIZE,
+    ImportResultsCommand,
+    ImportResultsHandler
+)
+from src.domain.testing.service.test_management_service import TestManagementService
+from src.infrastructure.database.repositories.async_test_repository import (
+    async_repository_factory,
+    read_repository_factory
+)
+from src.infrastructure.database.repositories.test_repository import SQLAlchemyTestRepository
+
+# Hot-folder subdirectories; a file lives in exactly one of them at a time
+PROCESSING_DIR = 'processing'
+PROCESSED_DIR = 'processed'
+FAILED_DIR = 'failed'
+
+_worker_app = None
+
+def import_results(app, command: ImportResultsCommand) -> dict:
+    with app.app_context():
+        with app.db.session() as session:
+            service = TestManagementService(
+                SQLAlchemyTestRepository(session),
+                async_repository_factory=async_repository_factory(app.db),
+                analysis_repository_factory=read_repository_factory(app.db)
+            )
+            return ImportResultsHandler(service).handle(command)
+
+def _init_worker(config_name: str):
+    # One app, and so one connection pool, per worker process
+    global _worker_app
+    _worker_app = create_app(config_name)
+
+def _import_file(path: str, test_id, test_name, column_map, chunk_size) -> dict:
+    command = ImportResultsCommand(
+        path=path,
+        test_id=test_id,
+        test_name=test_name,
+        column_map=column_map,
+        chunk_size=chunk_size
+    )
+    return import_results(_worker_app, command)
+
+def _ready_files(directory: str, settle_seconds: float):
+    """CSV files not modified for settle_seconds, so not still being copied in"""
+    now = time.time()
+    for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+        if (entry.is_file() and entry.name.lower().endswith('.csv')
+                and now - entry.stat().st_mtime >= settle_seconds):
+            yield entry.path
+
+def _finish(path: str, directory: str, target: str, report: dict):
+    destination = os.path.join(directory, target, os.path.basename(path))
+    shutil.move(path, destination)
+    with open(destination + '.json', 'w') as handle:
+        json.dump(report, handle, default=str, indent=2)
+
+def watch(directory: str, config_name: str, workers: int, poll_interval: float, **options):
+    """
+    Import every CSV dropped into directory, several files in parallel.
+
+    Files are claimed by moving them into processing/, then moved to
+    processed/ or failed/ next to a JSON report once their import ends.
+    """
+    for name in (PROCESSING_DIR, PROCESSED_DIR, FAILED_DIR):
+        os.makedirs(os.path.join(directory, name), exist_ok=True)
+
+    # Files left in processing/ by a previous run are imported again
+    backlog = list(_ready_files(os.path.join(directory, PROCESSING_DIR), 0))
+    running = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(config_name,)) as executor:
+        while True:
+            for source in list(_ready_files(directory, poll_interval)):
+                claimed = os.path.join(directory, PROCESSING_DIR, os.path.basename(source))
+                os.replace(source, claimed)
+                backlog.append(claimed)
+            while backlog and len(running) < workers:
+                path = backlog.pop(0)
+                running[executor.submit(_import_file, path, **options)] = path
+
+            if not running:
+                time.sleep(poll_interval)
+                continue
+            done, _ = wait(running, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = running.pop(future)
+                try:
+                    summary = future.result()
+                except Exception as e:
+                    _finish(path, directory, FAILED_DIR, {"error": str(e)})
+                    print(f"{os.path.basename(path)}: failed: {e}")
+                else:
+                    _finish(path, directory, PROCESSED_DIR, summary)
+                    print(f"{os.path.basename(path)}: saved {summary['saved_items']}, "
+                          f"rejected {summary['failed_items']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import test results from CSV files")
+    parser.add_argument("paths", nargs='*', help="CSV files to import")
+    parser.add_argument("--test-id", type=UUID)
+    parser.add_argument("--test-name")
+    parser.add_argument("--column", action='append', default=[], metavar="HEADER=TARGET",
+                        help="Map a CSV header to athlete_id, test_date, primary_value or a variable")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--watch", metavar="DIRECTORY",
+                        help="Import files dropped into DIRECTORY until interrupted")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--poll-interval", type=float, default=5.0)
+    args = parser.parse_args()
+    if not args.test_id and not args.test_name:
+        parser.error("--test-id or --test-name is required")
+
+    options = dict(
+        test_id=args.test_id,
+        test_name=args.test_name,
+        column_map=dict(mapping.split('=', 1) for mapping in args.column),
+        chunk_size=args.chunk_size
+    )
+    if args.watch:
+        watch(args.watch, 'default', args.workers, args.poll_interval, **options)
+    else:
+        app = create_app('default')
+        for path in args.paths:
+            summary = import_results(app, ImportResultsCommand(path=path, **options))
+            print(f"{path}: saved {summary['saved_items']} of {summary['total_items']} "
+                  f"in {len(summary['batch_ids'])} batches")
+            for error in summary['errors'][:20]:
+                print(f"  line {error['line']}: {error['error']}")
\ No newline at end of file
@@ -0,0 +1,36 @@
+import argparse
+from src.app import create_app
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Manage season partitions of test_results",
+        epilog="Season partitions are not created as results come in; schedule "
+               "'ensure' ahead of each season, e.g. monthly from cron: "
+               "0 3 1 * * python -m scripts.manage_partitions ensure"
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ensure = subparsers.add_parser('ensure', help="Create partitions for upcoming seasons")
+    ensure.add_argument('--ahead', type=int, default=1, help="Seasons to create past the current one")
+    subparsers.add_parser('list', help="List attached partitions")
+    detach = subparsers.add_parser('detach', help="Detach an old season's partition")
+    detach.add_argument('season', type=int)
+    attach = subparsers.add_parser('attach', help="Re-attach a detached season's partition")
+    attach.add_argument('season', type=int)
+
+    args = parser.parse_args()
+    partitions = create_app('default').db.partitions
+
+    if args.command == 'ensure':
+        created = partitions.ensure_partitions(ahead=args.ahead)
+        print(f"Created partitions: {', '.join(created) or 'none'}")
+    elif args.command == 'list':
+        for name in partitions.existing_partitions():
+            print(name)
+    elif args.command == 'detach':
+        print(f"Detached {partitions.detach_season(args.season)}")
+    elif args.command == 'attach':
+        print(f"Attached {partitions.attach_season(args.season)}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,17 @@
+from src.app import create_app
+from src.application.test.commands.rebuild_result_summaries import (
+    RebuildResultSummariesCommand,
+    RebuildResultSummariesHandler
+)
+from src.infrastructure.database.repositories.test_repository import SQLAlchemyTestRepository
+
+def rebuild_result_summaries(app) -> int:
+    with app.app_context():
+        with app.db.session() as session:
+            handler = RebuildResultSummariesHandler(SQLAlchemyTestRepository(session))
+            return handler.handle(RebuildResultSummariesCommand())
+
+if __name__ == "__main__":
+    app = create_app('default')
+    count = rebuild_result_summaries(app)
+    print(f"Rebuilt {count} result summaries")
\ No newline at end of file
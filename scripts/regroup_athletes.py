@@ -0,0 +1,27 @@
+import argparse
+from datetime import date
+from src.app import create_app
+from src.application.groups.commands.regroup_athletes import (
+    RegroupAthletesCommand,
+    RegroupAthletesHandler
+)
+from src.domain.groups.service.group_service import GroupService
+from src.infrastructure.database.repositories.group_repository import GroupRepository
+
+def regroup_athletes(app, as_of: date = None) -> dict:
+    with app.app_context():
+        with app.db.session() as session:
+            handler = RegroupAthletesHandler(GroupService(GroupRepository(session)))
+            return handler.handle(RegroupAthletesCommand(as_of=as_of))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reassign athletes to natural age groups")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None,
+                        help="Date ages are computed on, e.g. the season start (default: today)")
+    args = parser.parse_args()
+
+    app = create_app('default')
+    counts = regroup_athletes(app, args.as_of)
+    print(f"Created {counts['groups_created']} groups, "
+          f"removed {counts['memberships_removed']} and assigned "
+          f"{counts['memberships_assigned']} memberships")
\ No newline at end of file
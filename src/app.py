@@ -1,6 +1,7 @@
 from config.settings import Settings
 from infrastructure.database import Database
-from flask import Flask
+from infrastructure.signals import SignalStore
+from flask import Flask, jsonify
 from interfaces.web.blueprints.testing.routes import setup_routes
 
 def create_app(environment: str = 'default') -> Flask:
@@ -11,8 +12,20 @@ def create_app(environment: str = 'default') -> Flask:
     
     # Initialize database
     db_config = Settings.get_database_config(environment)
-    database = Database(db_config['url'])
+    database = Database(
+        db_config['url'],
+        replica_urls=db_config.get('replica_urls'),
+        season_start_month=Settings.SEASON_START_MONTH,
+        pool_options=Settings.DATABASE_POOL_OPTIONS
+    )
+    database.init_app(app)
     app.db = database
+    app.signal_store = SignalStore(Settings.SIGNAL_STORE_PATH)
+
+    @app.route('/api/health/db-pool', methods=['GET'])
+    def db_pool_statistics():
+        """Live connection pool usage for this worker"""
+        return jsonify(app.db.pool_statistics())
     
     # Register blueprints and setup routes
     setup_routes(app)
@@ -23,6 +36,8 @@ def init_database(app: Flask):
     """Initialize database tables"""
     with app.app_context():
         app.db.create_database()
+        if app.db.is_postgresql:
+            app.db.partitions.ensure_partitions()
 
 if __name__ == "__main__":
     app = create_app()
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Optional
+from domain.groups.service.group_service import GroupService
+
+@dataclass
+class RegroupAthletesCommand:
+    """Move every athlete into the natural group for their age"""
+    as_of: Optional[date] = None
+
+class RegroupAthletesHandler:
+    def __init__(self, group_service: GroupService):
+        self._group_service = group_service
+
+    def handle(self, command: RegroupAthletesCommand) -> Dict[str, int]:
+        return self._group_service.regroup_natural_groups(as_of=command.as_of)
\ No newline at end of file
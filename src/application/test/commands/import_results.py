@@ -0,0 +1,154 @@
+import csv
+import os
+import re
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+from uuid import UUID
+from domain.testing.entity.test import Test
+from domain.testing.service.test_management_service import TestManagementService
+
+# Rows validated and bulk-inserted per batch operation
+IMPORT_CHUNK_SIZE = 5000
+
+# Header names recognised for the fixed fields, after normalisation
+FIELD_ALIASES = {
+    'athlete_id': ('athlete_id', 'athlete', 'athlete_uuid'),
+    'test_date': ('test_date', 'date', 'datetime', 'timestamp'),
+    'primary_value': ('primary_value', 'value', 'result')
+}
+
+@dataclass
+class ImportResultsCommand:
+    """
+    Import a CSV export from force-plate or timing-gate software.
+
+    The test is given by test_id or test_name. column_map maps CSV headers
+    to athlete_id, test_date, primary_value or a variable name; headers not
+    in it are matched to those names case- and punctuation-insensitively.
+    """
+    path: str
+    test_id: Optional[UUID] = None
+    test_name: Optional[str] = None
+    column_map: Optional[Dict[str, str]] = None
+    chunk_size: int = IMPORT_CHUNK_SIZE
+
+class ImportResultsHandler:
+    """
+    Stream a CSV file through validation and the bulk-ingest path.
+
+    The file is read chunk_size rows at a time; each chunk becomes one batch
+    operation, so memory use is bounded by the chunk, not the file.
+    """
+
+    def __init__(self, test_service: TestManagementService):
+        self._test_service = test_service
+
+    def handle(self, command: ImportResultsCommand) -> Dict:
+        test = self._resolve_test(command)
+        filename = os.path.basename(command.path)
+
+        summary = {
+            "file": filename,
+            "test_id": test.id,
+            "batch_ids": [],
+            "total_items": 0,
+            "saved_items": 0,
+            "failed_items": 0,
+            "errors": []
+        }
+        with open(command.path, newline='', encoding='utf-8-sig') as handle:
+            sample = handle.read(4096)
+            handle.seek(0)
+            dialect = csv.Sniffer().sniff(sample, delimiters=',;\t') if sample else csv.excel
+            reader = csv.reader(handle, dialect)
+
+            header = next(reader, None)
+            if not header:
+                raise ValueError(f"{filename} is empty")
+            columns, ignored = self._map_columns(header, test, command.column_map or {})
+            summary["ignored_columns"] = ignored
+
+            first_line = 2
+            for chunk in self._chunks(reader, command.chunk_size):
+                items = [self._to_item(row, columns, test) for row in chunk]
+                result = self._test_service.process_batch_upload(
+                    upload_type='test_results',
+                    data=items,
+                    metadata={"source": filename, "first_line": first_line}
+                )
+                summary["batch_ids"].append(result["batch_id"])
+                summary["total_items"] += result["total_items"]
+                summary["saved_items"] += result["saved_items"]
+                summary["failed_items"] += result["failed_items"]
+                summary["errors"].extend(
+                    {"line": first_line + error["item_index"], "error": error["error"]}
+                    for error in result["errors"]
+                )
+                first_line += len(chunk)
+
+        return summary
+
+    def _resolve_test(self, command: ImportResultsCommand) -> Test:
+        if command.test_id:
+            test = self._test_service.get_test(command.test_id)
+        elif command.test_name:
+            test = self._test_service.get_test_by_name(command.test_name)
+        else:
+            raise ValueError("A test_id or test_name is required")
+        if not test:
+            raise ValueError(f"Test not found: {command.test_id or command.test_name}")
+        return test
+
+    def _map_columns(self, header: List[str], test: Test, column_map: Dict[str, str]):
+        """Column index -> target field, plus the headers that map to nothing"""
+        targets = {_normalise(name): name for name in (var.name for var in test.additional_variables)}
+        for field, aliases in FIELD_ALIASES.items():
+            targets.update({alias: field for alias in aliases})
+        targets.setdefault(_normalise(test.name), 'primary_value')
+
+        columns, ignored = {}, []
+        for index, name in enumerate(header):
+            target = column_map.get(name) or targets.get(_normalise(name))
+            if target:
+                columns[index] = target
+            else:
+                ignored.append(name)
+
+        missing = {'athlete_id', 'primary_value'} - set(columns.values())
+        if missing:
+            raise ValueError(f"No column for: {', '.join(sorted(missing))}")
+        return columns, ignored
+
+    @staticmethod
+    def _to_item(row: List[str], columns: Dict[int, str], test: Test) -> Dict:
+        item = {"test_id": test.id, "additional_values": {}}
+        for index, target in columns.items():
+            value = row[index].strip() if index < len(row) else ''
+            if value == '':
+                continue
+            if target == 'primary_value':
+                item[target] = _number(value)
+            elif target in FIELD_ALIASES:
+                item[target] = value
+            else:
+                # Left as text when not numeric so validation reports it
+                item["additional_values"][target] = _number(value)
+        return item
+
+    @staticmethod
+    def _chunks(reader, size: int) -> Iterator[List[List[str]]]:
+        while True:
+            chunk = list(islice(reader, size))
+            if not chunk:
+                return
+            yield chunk
+
+def _normalise(name: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '_', name.strip().lower()).strip('_')
+
+def _number(value: str):
+    try:
+        return float(value.replace(',', '.')) if value.count(',') == 1 and '.' not in value else float(value)
+    except ValueError:
+        return value
\ No newline at end of file
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from infrastructure.database.repositories.test_repository import SQLAlchemyTestRepository
+
+@dataclass
+class RebuildResultSummariesCommand:
+    """Recompute every per athlete/test rollup from test_results"""
+
+class RebuildResultSummariesHandler:
+    def __init__(self, test_repository: SQLAlchemyTestRepository):
+        self._test_repository = test_repository
+
+    def handle(self, command: RebuildResultSummariesCommand) -> int:
+        return self._test_repository.rebuild_result_summaries()
\ No newline at end of file
@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, Iterator, Optional
+from uuid import UUID
+
+EXPORT_COLUMNS = [
+    'result_id', 'athlete_id', 'first_name', 'last_name', 'sport',
+    'test_id', 'test_name', 'test_date', 'primary_value', 'additional_values'
+]
+
+CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
+# Rows written into one chunk of the output stream
+ROWS_PER_CHUNK = 500
+
+@dataclass
+class ExportResultsQuery:
+    """Test results matching all given filters, as CSV or NDJSON"""
+    format: str = 'csv'
+    group_id: Optional[UUID] = None
+    test_id: Optional[UUID] = None
+    sport: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+class ExportResultsHandler:
+    """
+    Produce an export as an iterator of text chunks.
+
+    repository_factory returns a context manager yielding a test repository
+    on its own session (e.g. read_repository_factory). The session is opened
+    when iteration starts and closed when it ends, so the export can outlive
+    the request's unit of work while the response is streamed.
+    """
+
+    def __init__(self, repository_factory: Callable):
+        self._repository_factory = repository_factory
+
+    def handle(self, query: ExportResultsQuery) -> Iterator[str]:
+        if query.format not in CONTENT_TYPES:
+            raise ValueError(f"Unsupported export format: {query.format}")
+        return self._export(query)
+
+    def _export(self, query: ExportResultsQuery) -> Iterator[str]:
+        if query.format == 'csv':
+            # Header goes out before the query starts executing
+            yield _csv_line(EXPORT_COLUMNS)
+
+        with self._repository_factory() as repository:
+            rows = repository.iter_results(
+                group_id=query.group_id,
+                test_id=query.test_id,
+                sport=query.sport,
+                time_period=(query.start_date, query.end_date)
+            )
+            yield from (_csv_chunks(rows) if query.format == 'csv' else _ndjson_chunks(rows))
+
+def _csv_line(values: Iterable) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+def _csv_chunks(rows: Iterable[Dict]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for row in rows:
+        writer.writerow([
+            json.dumps(row[column], default=_json_default) if column == 'additional_values'
+            else _csv_value(row[column])
+            for column in EXPORT_COLUMNS
+        ])
+        count += 1
+        if count % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def _ndjson_chunks(rows: Iterable[Dict]) -> Iterator[str]:
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({column: row[column] for column in EXPORT_COLUMNS}, default=_json_default))
+        if len(lines) == ROWS_PER_CHUNK:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+def _csv_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return '' if value is None else value
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
\ No newline at end of file
@@ -2,7 +2,7 @@ from datetime import date
 from typing import Optional, List
 from uuid import UUID
 from domain.core.aggregate_root import AggregateRoot
-from .value_objects import Name, EmailAddress, Gender
+from .value_objects import Name, EmailAddress, Gender, AgeGroup
 
 class Athlete(AggregateRoot):
     def __init__(
@@ -26,23 +26,18 @@ class Athlete(AggregateRoot):
 
     @property
     def age(self) -> int:
-        today = date.today()
-        return today.year - self._birthdate.year - (
-            (today.month, today.day) < (self._birthdate.month, self._birthdate.day)
+        return self.age_on(date.today())
+
+    def age_on(self, as_of: date) -> int:
+        """Age in completed years on the given date"""
+        return as_of.year - self._birthdate.year - (
+            (as_of.month, as_of.day) < (self._birthdate.month, self._birthdate.day)
         )
 
     @property
     def age_group(self) -> str:
         """Dynamically calculate age group based on current date"""
-        age = self.age
-        if age <= 8: return 'U8'
-        elif age <= 10: return 'U10'
-        elif age <= 12: return 'U12'
-        elif age <= 14: return 'U14'
-        elif age <= 16: return 'U16'
-        elif age <= 18: return 'U18'
-        elif age <= 20: return 'U20'
-        return '20+'
+        return AgeGroup.for_age(self.age).name
 
     @property
     def competitive_age_group(self) -> str:
@@ -51,7 +46,7 @@ class Athlete(AggregateRoot):
 
     def set_custom_team(self, age_group: str) -> None:
         """Assign athlete to a custom age group team"""
-        valid_age_groups = ['U8', 'U10', 'U12', 'U14', 'U16', 'U18', 'U20', '20+']
+        valid_age_groups = [group.name for group in AgeGroup.all()]
         if age_group not in valid_age_groups:
             raise ValueError(f"Invalid age group. Must be one of {valid_age_groups}")
         self._custom_team = age_group
@@ -81,6 +76,10 @@ class Athlete(AggregateRoot):
     def name(self) -> Name:
         return self._name
     
+    @property
+    def birthdate(self) -> date:
+        return self._birthdate
+
     @property
     def email(self) -> Optional[EmailAddress]:
         return self._email
@@ -91,4 +90,8 @@ class Athlete(AggregateRoot):
     
     @property
     def sport(self) -> str:
-        return self._sport
\ No newline at end of file
+        return self._sport
+
+    @property
+    def custom_team(self) -> Optional[str]:
+        return self._custom_team
\ No newline at end of file
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import date
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
 from domain.core.value_object import ValueObject
 
 @dataclass(frozen=True)
@@ -23,4 +23,52 @@ class EmailAddress(ValueObject):
 
     def __post_init__(self):
         if self.value and '@' not in self.value:
-            raise ValueError("Invalid email address")
\ No newline at end of file
+            raise ValueError("Invalid email address")
+
+def years_before(day: date, years: int) -> date:
+    """Same calendar day a number of years earlier (Feb 29 maps to Feb 28)"""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+@dataclass(frozen=True)
+class AgeGroup(ValueObject):
+    name: str
+    min_age: int
+    max_age: Optional[int] = None
+
+    @classmethod
+    def all(cls) -> Tuple['AgeGroup', ...]:
+        return AGE_GROUPS
+
+    @classmethod
+    def from_name(cls, name: str) -> Optional['AgeGroup']:
+        return next((group for group in AGE_GROUPS if group.name == name), None)
+
+    @classmethod
+    def for_age(cls, age: int) -> 'AgeGroup':
+        return next(group for group in AGE_GROUPS
+                    if group.max_age is None or age <= group.max_age)
+
+    def birthdate_range(self, as_of: date) -> Tuple[Optional[date], date]:
+        """
+        Birthdates that fall in this age group on the as_of date.
+
+        Returns (born_after, born_on_or_before); born_after is None for the
+        open-ended senior group.
+        """
+        born_on_or_before = years_before(as_of, self.min_age)
+        born_after = years_before(as_of, self.max_age + 1) if self.max_age is not None else None
+        return born_after, born_on_or_before
+
+AGE_GROUPS: Tuple[AgeGroup, ...] = (
+    AgeGroup('U8', 0, 8),
+    AgeGroup('U10', 9, 10),
+    AgeGroup('U12', 11, 12),
+    AgeGroup('U14', 13, 14),
+    AgeGroup('U16', 15, 16),
+    AgeGroup('U18', 17, 18),
+    AgeGroup('U20', 19, 20),
+    AgeGroup('20+', 21),
+)
\ No newline at end of file
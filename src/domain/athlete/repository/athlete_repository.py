@@ -1,5 +1,6 @@
 from abc import abstractmethod
 from typing import List, Optional
+from datetime import date
 from uuid import UUID
 from domain.core.repository import Repository
 from ..entity.athlete import Athlete
@@ -21,8 +22,9 @@ class AthleteRepository(Repository[Athlete]):
                         age_group: Optional[str] = None,
                         gender: Optional[Gender] = None,
                         sport: Optional[str] = None,
-                        custom_team: Optional[str] = None) -> List[Athlete]:
-        """Find athletes matching specified criteria"""
+                        custom_team: Optional[str] = None,
+                        as_of: Optional[date] = None) -> List[Athlete]:
+        """Find athletes matching specified criteria, with ages taken on as_of (default today)"""
         pass
 
     @abstractmethod
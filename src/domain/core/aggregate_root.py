@@ -1,14 +1,18 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 from typing import List
 from datetime import datetime
 
 class AggregateRoot:
     def __init__(self, id: UUID = None):
-        self._id = id or UUID()
+        self._id = id or uuid4()
         self._created_at = datetime.now()
         self._updated_at = datetime.now()
         self._domain_events: List = []
 
+    @property
+    def id(self) -> UUID:
+        return self._id
+
     def add_domain_event(self, event: 'DomainEvent'):
         self._domain_events.append(event)
 
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Generic, Optional, TypeVar
+from uuid import UUID
+
+T = TypeVar('T')
+
+class Repository(ABC, Generic[T]):
+    @abstractmethod
+    def get(self, id: UUID) -> Optional[T]:
+        """Find an aggregate by id"""
+        pass
+
+    @abstractmethod
+    def save(self, aggregate: T) -> T:
+        """Add or update an aggregate"""
+        pass
+
+    @abstractmethod
+    def delete(self, id: UUID) -> None:
+        """Remove an aggregate if it exists"""
+        pass
\ No newline at end of file
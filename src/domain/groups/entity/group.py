@@ -0,0 +1,57 @@
+from typing import Optional
+from uuid import UUID
+from ...core.aggregate_root import AggregateRoot
+
+class Group(AggregateRoot):
+    """
+    A set of athletes ranked together: a natural sport/gender/age bracket
+    group, or a custom group such as a squad.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        type: str,
+        sport: str,
+        gender: str,
+        min_age: Optional[int] = None,
+        max_age: Optional[int] = None,
+        is_custom: bool = False,
+        id: Optional[UUID] = None
+    ):
+        super().__init__(id)
+        self._name = name
+        self._type = type
+        self._sport = sport
+        self._gender = gender
+        self._min_age = min_age
+        self._max_age = max_age
+        self._is_custom = is_custom
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self) -> str:
+        return self._type
+
+    @property
+    def sport(self) -> str:
+        return self._sport
+
+    @property
+    def gender(self) -> str:
+        return self._gender
+
+    @property
+    def min_age(self) -> Optional[int]:
+        return self._min_age
+
+    @property
+    def max_age(self) -> Optional[int]:
+        return self._max_age
+
+    @property
+    def is_custom(self) -> bool:
+        return self._is_custom
\ No newline at end of file
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, List, Optional
+from uuid import UUID
+from domain.athlete.entity.athlete import Athlete
+from ..entity.group import Group
+
+class GroupRepository(ABC):
+    @abstractmethod
+    def find_natural_group(self, sport: str, gender: str, age: int) -> Optional[Group]:
+        """Find the natural group for a sport, gender and age"""
+        pass
+
+    @abstractmethod
+    def create_group(self,
+                    name: str,
+                    type: str,
+                    sport: str,
+                    gender: str,
+                    age_range: dict,
+                    is_custom: bool = False) -> Group:
+        """Create a new group"""
+        pass
+
+    @abstractmethod
+    def add_to_group(self, athlete_id: UUID, group_id: UUID, is_primary: bool = True) -> None:
+        """Add athlete to group"""
+        pass
+
+    @abstractmethod
+    def remove_primary_group(self, athlete_id: UUID) -> None:
+        """Remove athlete from their primary group"""
+        pass
+
+    @abstractmethod
+    def get_athlete_groups(self, athlete_id: UUID) -> List[Group]:
+        """Get all groups for an athlete"""
+        pass
+
+    @abstractmethod
+    def get_group_athletes(self, group_id: UUID) -> List[Athlete]:
+        """Get all athletes in a group"""
+        pass
+
+    @abstractmethod
+    def reassign_natural_groups(self, age_ranges: List[Dict], as_of: date) -> Dict[str, int]:
+        """Move every athlete into the natural group matching their age on as_of"""
+        pass
\ No newline at end of file
@@ -1,19 +1,34 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 from datetime import date
 from domain.athlete.entity.athlete import Athlete
-from infrastructure.database.repositories.group_repository import GroupRepository
+from domain.athlete.entity.value_objects import AgeGroup, Gender
+from ..entity.group import Group
+from ..repository.group_repository import GroupRepository
+
+# Groups store integer age bounds, so the open-ended senior bracket is capped
+OPEN_MAX_AGE = 99
 
 class GroupService:
+    # Natural groups follow the age groups used for normative cohorts
+    NATURAL_AGE_RANGES = [
+        {"min": group.min_age,
+         "max": group.max_age if group.max_age is not None else OPEN_MAX_AGE,
+         "name": group.name}
+        for group in AgeGroup.all()
+    ]
+
     def __init__(self, group_repository: GroupRepository):
         self._repository = group_repository
 
     def assign_natural_group(self, athlete: Athlete) -> Group:
         """Assign athlete to their natural age/sport/gender group"""
         age = athlete.age
+        # Groups store the gender's value, e.g. "male"
+        gender = Gender(athlete.gender).value
         group = self._repository.find_natural_group(
             sport=athlete.sport,
-            gender=athlete.gender,
+            gender=gender,
             age=age
         )
         
@@ -21,10 +36,10 @@ class GroupService:
             # Create new group if doesn't exist
             age_range = self._get_age_range(age)
             group = self._repository.create_group(
-                name=f"{athlete.sport} {athlete.gender} {age_range['name']}",
+                name=f"{athlete.sport} {gender} {age_range['name']}",
                 type="natural",
                 sport=athlete.sport,
-                gender=athlete.gender,
+                gender=gender,
                 age_range={"min": age_range["min"], "max": age_range["max"]},
                 is_custom=False
             )
@@ -44,19 +59,17 @@ class GroupService:
         # Add to custom group
         self._repository.add_to_group(athlete_id, group_id, is_primary=False)
 
+    def regroup_natural_groups(self, as_of: Optional[date] = None) -> Dict[str, int]:
+        """Reassign all athletes to the natural group for their age on as_of"""
+        return self._repository.reassign_natural_groups(
+            age_ranges=self.NATURAL_AGE_RANGES,
+            as_of=as_of or date.today()
+        )
+
     def _get_age_range(self, age: int) -> dict:
         """Get age range and group name for given age"""
-        ranges = [
-            {"min": 0, "max": 12, "name": "U12"},
-            {"min": 13, "max": 14, "name": "U14"},
-            {"min": 15, "max": 16, "name": "U16"},
-            {"min": 17, "max": 18, "name": "U18"},
-            {"min": 19, "max": 20, "name": "U20"},
-            {"min": 21, "max": 99, "name": "Senior"}
-        ]
-        
-        for range_info in ranges:
+        for range_info in self.NATURAL_AGE_RANGES:
             if range_info["min"] <= age <= range_info["max"]:
                 return range_info
         
-        return ranges[-1]  # Default to Senior
\ No newline at end of file
+        return self.NATURAL_AGE_RANGES[-1]  # Default to the senior group
\ No newline at end of file
@@ -53,6 +53,13 @@ class TestEnvironment(Enum):
     OUTDOOR = "Outdoor"
     BOTH = "Both"
 
+@dataclass(frozen=True)
+class SignalFilter(ValueObject):
+    """Zero-phase Butterworth filter applied to a raw signal before analysis"""
+    cutoff: float  # Hz
+    order: int = 4
+    filter_type: str = "lowpass"  # lowpass or highpass
+
 @dataclass(frozen=True)
 class TestProtocol(ValueObject):
     name: str
@@ -63,6 +70,26 @@ class TestProtocol(ValueObject):
     required_equipment: List[str] = None
     environment: TestEnvironment = TestEnvironment.BOTH
     warmup_protocol: Optional[str] = None
+    # Signal name (force, velocity, ...) -> filter for raw traces of this test
+    signal_filters: Optional[Dict[str, SignalFilter]] = None
+
+    def __post_init__(self):
+        # Filters loaded from JSON arrive as plain dicts
+        if self.signal_filters:
+            object.__setattr__(self, 'signal_filters', {
+                name: value if isinstance(value, SignalFilter) else SignalFilter(**value)
+                for name, value in self.signal_filters.items()
+            })
+
+    def get_signal_filter(self, signal: str) -> Optional[SignalFilter]:
+        return (self.signal_filters or {}).get(signal)
+
+    def to_dict(self) -> Dict:
+        data = dict(self.__dict__)
+        if self.signal_filters:
+            data['signal_filters'] = {name: dict(value.__dict__)
+                                      for name, value in self.signal_filters.items()}
+        return data
 
 @dataclass(frozen=True)
 class AdditionalVariable:
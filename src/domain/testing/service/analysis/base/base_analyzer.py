@@ -4,10 +4,14 @@ from datetime import datetime
 from uuid import UUID
 import numpy as np
 from scipy import stats
+from ..common.metrics import NormativeDistribution
 
 class BaseAnalyzer(ABC):
     """Base class for all performance analyzers"""
 
+    # Bump when an analyzer's output changes so stored analyses are recomputed
+    VERSION = 1
+
     def __init__(self, result_repository):
         self._result_repository = result_repository
 
@@ -29,6 +33,34 @@ class BaseAnalyzer(ABC):
             limit=limit
         )
 
+    def get_results_matrix(self,
+                           athlete_ids: List[UUID],
+                           test_ids: List[UUID],
+                           time_period: Optional[tuple] = None,
+                           max_results: Optional[int] = None):
+        """Fetch athletes x tests x results arrays in a single query"""
+        return self._result_repository.get_results_matrix(
+            athlete_ids=athlete_ids,
+            test_ids=test_ids,
+            time_period=time_period,
+            max_results=max_results
+        )
+
+    def get_variable_statistics(self,
+                                test_id: UUID,
+                                variable_name: str,
+                                athlete_ids: Optional[List[UUID]] = None,
+                                time_period: Optional[tuple] = None,
+                                value_range: Optional[tuple] = None) -> Dict[str, float]:
+        """Aggregate a secondary test variable in the database"""
+        return self._result_repository.aggregate_variable(
+            test_id=test_id,
+            variable_name=variable_name,
+            athlete_ids=athlete_ids,
+            time_period=time_period,
+            value_range=value_range
+        )
+
     def calculate_basic_statistics(self, values: List[float]) -> Dict[str, float]:
         """Calculate basic statistical measures"""
         if not values:
@@ -51,6 +83,34 @@ class BaseAnalyzer(ABC):
             return 0.0
         return stats.percentileofscore(reference_values, value)
 
+    def calculate_percentile_ranks(self,
+                                   values: List[float],
+                                   reference_values: List[float]) -> np.ndarray:
+        """Percentile ranks of many values, sorting the reference group once"""
+        return NormativeDistribution(reference_values).percentiles(values)
+
+    def get_normative_distribution(self,
+                                   test_id: UUID,
+                                   sport: str,
+                                   gender: str,
+                                   age_group: str) -> NormativeDistribution:
+        """Cached sorted reference values of a sport/gender/age group cohort"""
+        return self._result_repository.get_normative_distribution(
+            test_id=test_id,
+            sport=sport,
+            gender=gender,
+            age_group=age_group
+        )
+
+    def get_normative_percentiles(self,
+                                  test_id: UUID,
+                                  sport: str,
+                                  gender: str,
+                                  age_group: str,
+                                  values: List[float]) -> np.ndarray:
+        """Rank values against the cached normative distribution of a cohort"""
+        return self.get_normative_distribution(test_id, sport, gender, age_group).percentiles(values)
+
     def analyze_trend(self, 
                      values: List[float], 
                      dates: List[datetime]) -> Dict[str, Any]:
@@ -1,7 +1,9 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 import numpy as np
 from ..base.base_analyzer import BaseAnalyzer
+from .metrics import NormativeDistribution
+from domain.athlete.entity.value_objects import AgeGroup
 
 class ComparativeAnalyzer(BaseAnalyzer):
     def __init__(self, result_repository, group_repository):
@@ -15,70 +17,178 @@ class ComparativeAnalyzer(BaseAnalyzer):
         """
         Compare athlete's performance with a group
         comparison_type can be: 'age_group', 'team', 'custom_group', 'sport'
+
+        The athlete's latest result on each test is ranked against the
+        latest results of group_id's members, or without a group against
+        the cached normative distribution of the athlete's sport, gender
+        and age group cohort.
         """
-        # Get athlete's results
-        athlete_results = self._result_repository.get_athlete_results(athlete_id)
-        
-        # Get comparison group results
+        # Get athlete's latest value per test
+        athlete_results = {
+            summary["test_id"]: summary["latest_value"]
+            for summary in self._result_repository.get_athlete_summaries(athlete_id)
+        }
+
+        # Get comparison group distributions, one per test
         if group_id:
-            group_results = self._get_group_results(group_id)
+            distributions = self._group_distributions(group_id, list(athlete_results))
         else:
-            group_results = self._get_comparison_group_results(
-                athlete_id, comparison_type
-            )
+            distributions = self._cohort_distributions(athlete_id, list(athlete_results))
 
         # Calculate percentile ranks and z-scores
-        rankings = self._calculate_rankings(athlete_results, group_results)
-        
-        # Identify strengths and weaknesses
-        analysis = self._analyze_performance_profile(rankings)
-        
-        # Generate specific recommendations
-        recommendations = self._generate_recommendations(analysis)
+        rankings = self._calculate_rankings(athlete_results, distributions)
+
+        return {
+            "rankings": rankings,
+            "group_statistics": self._calculate_group_statistics(distributions)
+        }
+
+    def _group_distributions(self,
+                             group_id: UUID,
+                             test_ids: List[UUID]) -> Dict[UUID, NormativeDistribution]:
+        """Distribution of the group members' latest results on each test"""
+        athlete_ids = [athlete.id for athlete in self._group_repository.get_group_athletes(group_id)]
+        values = self.get_results_matrix(athlete_ids, test_ids, max_results=1).latest()
+        distributions = {}
+        for j, test_id in enumerate(test_ids):
+            column = values[:, j]
+            column = column[~np.isnan(column)]
+            if len(column):
+                distributions[test_id] = NormativeDistribution(column)
+        return distributions
+
+    def _cohort_distributions(self,
+                              athlete_id: UUID,
+                              test_ids: List[UUID]) -> Dict[UUID, NormativeDistribution]:
+        """Cached normative distributions of the athlete's natural group cohort"""
+        natural = next((group for group in self._group_repository.get_athlete_groups(athlete_id)
+                        if not group.is_custom and group.min_age is not None), None)
+        if natural is None:
+            return {}
+
+        age_group = AgeGroup.for_age(natural.min_age).name
+        distributions = {}
+        for test_id in test_ids:
+            distribution = self.get_normative_distribution(test_id, natural.sport, natural.gender, age_group)
+            if distribution.size:
+                distributions[test_id] = distribution
+        return distributions
+
+    @staticmethod
+    def _calculate_group_statistics(distributions: Dict[UUID, NormativeDistribution]) -> Dict:
+        """Count, mean, spread and range of each test's comparison values"""
+        return {
+            test_id: {
+                "count": distribution.size,
+                "mean": float(np.mean(distribution.values)),
+                "std": float(np.std(distribution.values)),
+                "min": float(distribution.values[0]),
+                "max": float(distribution.values[-1])
+            }
+            for test_id, distribution in distributions.items()
+        }
+
+    def analyze_group(self,
+                      group_id: UUID,
+                      test_ids: List[UUID]) -> Dict:
+        """
+        Rank every member of a group on every test at once.
+
+        Uses each member's most recent result. Percentiles, z-scores and
+        relative-performance bands are computed over a members x tests
+        matrix, sorting each test column once. Athletes and tests are keyed
+        by their id strings, so the result serializes as JSON as is.
+        """
+        athlete_ids = [athlete.id for athlete in self._group_repository.get_group_athletes(group_id)]
+        matrix = self.get_results_matrix(athlete_ids, test_ids, max_results=1)
+        values = matrix.latest()
+
+        percentiles, z_scores = self._rank_matrix(values)
+        bands = self._performance_bands(z_scores)
+        present = ~np.isnan(values)
+
+        rankings = {}
+        for i, athlete_id in enumerate(matrix.athlete_ids):
+            rankings[str(athlete_id)] = {
+                str(test_id): {
+                    "value": float(values[i, j]),
+                    "percentile": float(percentiles[i, j]),
+                    "z_score": float(z_scores[i, j]),
+                    "relative_performance": str(bands[i, j])
+                }
+                for j, test_id in enumerate(matrix.test_ids) if present[i, j]
+            }
+
+        counts = present.sum(axis=0)
+        group_statistics = {}
+        for j, test_id in enumerate(matrix.test_ids):
+            if counts[j]:
+                column = values[present[:, j], j]
+                group_statistics[str(test_id)] = {
+                    "count": int(counts[j]),
+                    "mean": float(np.mean(column)),
+                    "std": float(np.std(column)),
+                    "min": float(np.min(column)),
+                    "max": float(np.max(column))
+                }
 
         return {
+            "group_id": str(group_id),
             "rankings": rankings,
-            "analysis": analysis,
-            "recommendations": recommendations,
-            "group_statistics": self._calculate_group_statistics(group_results)
+            "group_statistics": group_statistics
         }
 
-    def _calculate_rankings(self, 
-                          athlete_results: Dict, 
-                          group_results: Dict) -> Dict:
+    @staticmethod
+    def _rank_matrix(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-column percentile ranks and z-scores; NaN marks missing results"""
+        percentiles = np.full(values.shape, np.nan)
+        z_scores = np.full(values.shape, np.nan)
+        for j in range(values.shape[1]):
+            present = ~np.isnan(values[:, j])
+            column = values[present, j]
+            if not len(column):
+                continue
+            distribution = NormativeDistribution(column)
+            percentiles[present, j] = distribution.percentiles(column)
+            std = np.std(column)
+            z_scores[present, j] = (column - np.mean(column)) / std if std > 0 else 0.0
+        return percentiles, z_scores
+
+    @staticmethod
+    def _performance_bands(z_scores: np.ndarray) -> np.ndarray:
+        """Relative-performance label for each z-score"""
+        return np.select(
+            [z_scores > 2, z_scores > 1, z_scores > -1, z_scores > -2],
+            ["Exceptional", "Above Average", "Average", "Below Average"],
+            default="Needs Improvement"
+        )
+
+    def _calculate_rankings(self,
+                          athlete_results: Dict[UUID, float],
+                          distributions: Dict[UUID, NormativeDistribution]) -> Dict:
         """Calculate percentile ranks and z-scores for each test"""
         rankings = {}
-        
-        for test_id, result in athlete_results.items():
-            group_values = group_results.get(test_id, [])
-            if group_values:
+
+        for test_id, value in athlete_results.items():
+            distribution = distributions.get(test_id)
+            if distribution is not None:
+                z_score = self._calculate_z_score(value, distribution.values)
                 rankings[test_id] = {
-                    "percentile": self._calculate_percentile(
-                        result.value, group_values
-                    ),
-                    "z_score": self._calculate_z_score(
-                        result.value, group_values
-                    ),
-                    "relative_performance": self._evaluate_relative_performance(
-                        result.value, group_values
-                    )
+                    "percentile": distribution.percentile(value),
+                    "z_score": z_score,
+                    "relative_performance": str(self._performance_bands(np.array(z_score)))
                 }
 
         return rankings
 
+    def _calculate_z_score(self, value: float, group_values: List[float]) -> float:
+        """Standard score of a value within the group"""
+        std = np.std(group_values)
+        return float((value - np.mean(group_values)) / std) if std > 0 else 0.0
+
     def _evaluate_relative_performance(self, 
                                     value: float, 
                                     group_values: List[float]) -> str:
         """Evaluate performance relative to the group"""
         z_score = self._calculate_z_score(value, group_values)
-        
-        if z_score > 2:
-            return "Exceptional"
-        elif z_score > 1:
-            return "Above Average"
-        elif z_score > -1:
-            return "Average"
-        elif z_score > -2:
-            return "Below Average"
-        else:
-            return "Needs Improvement"
\ No newline at end of file
+        return str(self._performance_bands(np.array(z_score)))
\ No newline at end of file
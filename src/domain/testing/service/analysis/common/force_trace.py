@@ -0,0 +1,49 @@
+from typing import Iterator, Sequence, Tuple
+import numpy as np
+
+GRAVITY = 9.81  # m/s^2
+
+# Trials padded into one matrix at a time; bounds memory for long sessions
+TRACE_BLOCK_SIZE = 64
+
+def pad_traces(traces: Sequence[Sequence[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack ragged traces into a NaN-padded (trials, samples) matrix"""
+    lengths = np.array([len(trace) for trace in traces], dtype=np.intp)
+    matrix = np.full((len(traces), int(lengths.max(initial=0))), np.nan)
+    for row, trace in enumerate(traces):
+        matrix[row, :lengths[row]] = trace
+    return matrix, lengths
+
+def iter_trace_blocks(traces: Sequence[Sequence[float]],
+                      block_size: int = TRACE_BLOCK_SIZE) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """Yield (first trial index, padded matrix, lengths) per block of trials"""
+    for start in range(0, len(traces), block_size):
+        matrix, lengths = pad_traces(traces[start:start + block_size])
+        yield start, matrix, lengths
+
+def baseline(force: np.ndarray, samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean and SD of each trial's quiet-standing period"""
+    window = force[:, :samples]
+    return np.nanmean(window, axis=1), np.nanstd(window, axis=1)
+
+def first_crossing(mask: np.ndarray, start: np.ndarray = None) -> np.ndarray:
+    """Index of the first True per row at or after start; -1 where there is none"""
+    if start is not None:
+        columns = np.arange(mask.shape[1])
+        mask = mask & (columns[None, :] >= start[:, None])
+    index = np.argmax(mask, axis=1)
+    return np.where(mask.any(axis=1), index, -1)
+
+def sample_at(force: np.ndarray, index: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """force[row, index[row, ...]], NaN where the index falls outside the trace"""
+    index = np.asarray(index)
+    valid = (index >= 0) & (index < lengths.reshape((-1,) + (1,) * (index.ndim - 1)))
+    flat = np.clip(index, 0, max(force.shape[1] - 1, 0)).reshape(len(force), -1)
+    values = np.take_along_axis(force, flat, axis=1).reshape(index.shape)
+    return np.where(valid, values, np.nan)
+
+def cumulative_impulse(net_force: np.ndarray, sample_rate: float) -> np.ndarray:
+    """Trapezoidal running integral of net force (N·s), starting at 0"""
+    impulse = np.zeros_like(net_force)
+    np.cumsum((net_force[:, 1:] + net_force[:, :-1]) * (0.5 / sample_rate), axis=1, out=impulse[:, 1:])
+    return impulse
\ No newline at end of file
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+from uuid import UUID
+import numpy as np
 
 class TrendDirection(Enum):
     IMPROVING = "Improving"
@@ -24,4 +26,91 @@ class TrendAnalysis:
     slope: float
     r_squared: float
     prediction_next: float
-    confidence_band: tuple
\ No newline at end of file
+    confidence_band: tuple
+
+@dataclass
+class ResultsMatrix:
+    """
+    Athletes x tests x results pivot of primary values.
+
+    values, dates and mask share the shape (len(athlete_ids), len(test_ids),
+    depth). Along the last axis slot 0 is the most recent result; empty slots
+    are NaN / NaT and False in mask.
+    """
+    athlete_ids: List[UUID]
+    test_ids: List[UUID]
+    values: np.ndarray
+    dates: np.ndarray
+    mask: np.ndarray
+
+    def latest(self) -> np.ndarray:
+        """Most recent value per athlete and test (NaN where missing)"""
+        return self.values[:, :, 0] if self.values.shape[2] else np.full(self.values.shape[:2], np.nan)
+
+    def series(self, athlete_index: int, test_index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Chronological values and dates for one athlete and test"""
+        present = self.mask[athlete_index, test_index]
+        return (self.values[athlete_index, test_index][present][::-1],
+                self.dates[athlete_index, test_index][present][::-1])
+
+
+class NormativeDistribution:
+    """
+    Sorted reference values for percentile ranking with binary search.
+
+    Percentiles follow scipy.stats.percentileofscore(kind='rank'). With
+    fewer than min_samples values, a published (values, percentiles) curve
+    is interpolated instead when one is available.
+    """
+
+    def __init__(self,
+                 values: Optional[np.ndarray] = None,
+                 reference: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                 min_samples: int = 20):
+        self._values = np.sort(np.asarray(values if values is not None else [], dtype=float))
+        self._reference = None
+        if reference is not None and len(reference[0]):
+            order = np.argsort(reference[0])
+            self._reference = (np.asarray(reference[0], dtype=float)[order],
+                               np.asarray(reference[1], dtype=float)[order])
+        self._min_samples = min_samples
+
+    @property
+    def size(self) -> int:
+        return len(self._values)
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    def add(self, values) -> None:
+        """Insert values keeping the array sorted"""
+        values = np.sort(np.atleast_1d(np.asarray(values, dtype=float)))
+        if len(values):
+            self._values = np.insert(self._values, np.searchsorted(self._values, values), values)
+
+    def remove(self, values) -> None:
+        """Remove one occurrence of each value present"""
+        values = np.sort(np.atleast_1d(np.asarray(values, dtype=float)))
+        if not len(values) or not self.size:
+            return
+        # Repeated values take successive slots of their run in the array
+        _, first, counts = np.unique(values, return_index=True, return_counts=True)
+        positions = np.searchsorted(self._values, values) + np.arange(len(values)) - np.repeat(first, counts)
+        present = positions < self.size
+        present[present] = self._values[positions[present]] == values[present]
+        self._values = np.delete(self._values, positions[present])
+
+    def percentiles(self, values) -> np.ndarray:
+        """Percentile rank of every value, in one vectorized pass"""
+        values = np.asarray(values, dtype=float)
+        if self.size < self._min_samples and self._reference is not None:
+            return np.interp(values, *self._reference)
+        if not self.size:
+            return np.zeros_like(values)
+        left = np.searchsorted(self._values, values, side='left')
+        right = np.searchsorted(self._values, values, side='right')
+        return (left + right + (right > left)) * 50.0 / self.size
+
+    def percentile(self, value: float) -> float:
+        return float(self.percentiles([value])[0])
\ No newline at end of file
@@ -25,8 +25,12 @@ class PerformanceAnalyzer(BaseAnalyzer):
         values = [r.value for r in results]
         dates = [r.test_date for r in results]
 
+        # All-time latest value and best come from the rollup row rather
+        # than the limited window of results fetched above
+        summary = self._result_repository.get_result_summary(athlete_id, test_id)
+
         # Basic performance metrics
-        performance_metrics = self._analyze_performance(values, dates)
+        performance_metrics = self._analyze_performance(values, dates, summary)
         
         # Trend analysis
         trend_analysis = self._analyze_trends(values, dates)
@@ -41,13 +45,16 @@ class PerformanceAnalyzer(BaseAnalyzer):
             )
         }
 
-    def _analyze_performance(self, values: List[float], dates: List[datetime]) -> PerformanceMetrics:
+    def _analyze_performance(self,
+                             values: List[float],
+                             dates: List[datetime],
+                             summary: Optional[Dict] = None) -> PerformanceMetrics:
         """Analyze current performance status"""
         trend_analysis = self.analyze_trend(values, dates)
         
         return PerformanceMetrics(
-            current_value=values[-1],
-            personal_best=max(values),
+            current_value=summary["latest_value"] if summary else values[-1],
+            personal_best=summary["max"] if summary else max(values),
             improvement_rate=self._calculate_improvement_rate(values),
             percentile_rank=self._calculate_percentile_rank(values[-1]),
             relative_to_benchmark=self._calculate_benchmark_comparison(values[-1]),
@@ -0,0 +1,49 @@
+from functools import lru_cache
+from typing import List, Sequence
+import numpy as np
+from scipy import signal
+from ....entity.value_objects import SignalFilter
+from .force_trace import TRACE_BLOCK_SIZE, iter_trace_blocks
+
+@lru_cache(maxsize=64)
+def butterworth_sos(cutoff: float, sample_rate: float, order: int = 4,
+                    filter_type: str = 'lowpass') -> np.ndarray:
+    """Second-order sections of a Butterworth filter, designed once per setting"""
+    if not 0 < cutoff < sample_rate / 2:
+        raise ValueError(f"Cutoff {cutoff} Hz must be below the Nyquist frequency of {sample_rate} Hz")
+    return signal.butter(order, cutoff, btype=filter_type, fs=sample_rate, output='sos')
+
+def filter_matrix(matrix: np.ndarray,
+                  lengths: np.ndarray,
+                  sample_rate: float,
+                  signal_filter: SignalFilter) -> np.ndarray:
+    """
+    Zero-phase filter every row of a NaN-padded (trials, samples) matrix.
+
+    Padding is replaced by each trial's last sample for the backward pass,
+    so it does not bleed NaN into the trial, and restored afterwards.
+    """
+    if matrix.size == 0:
+        return matrix
+    sos = butterworth_sos(signal_filter.cutoff, sample_rate, signal_filter.order,
+                          signal_filter.filter_type)
+    columns = np.arange(matrix.shape[1])
+    padding = columns[None, :] >= lengths[:, None]
+    last = matrix[np.arange(len(matrix)), np.maximum(lengths - 1, 0)]
+    filled = np.where(padding, last[:, None], matrix)
+
+    # sosfiltfilt's default edge padding, capped for short sessions
+    padlen = min(3 * (2 * len(sos) + 1), matrix.shape[1] - 1)
+    filtered = signal.sosfiltfilt(sos, filled, axis=1, padlen=padlen)
+    return np.where(padding, np.nan, filtered)
+
+def filter_traces(traces: Sequence[Sequence[float]],
+                  sample_rate: float,
+                  signal_filter: SignalFilter,
+                  block_size: int = TRACE_BLOCK_SIZE) -> List[np.ndarray]:
+    """Filter equal-rate trials of any lengths, block_size trials per call"""
+    filtered = []
+    for _, matrix, lengths in iter_trace_blocks(traces, block_size):
+        block = filter_matrix(matrix, lengths, sample_rate, signal_filter)
+        filtered.extend(row[:length] for row, length in zip(block, lengths))
+    return filtered
\ No newline at end of file
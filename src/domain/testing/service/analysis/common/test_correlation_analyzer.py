@@ -35,6 +35,29 @@ class TestCorrelationAnalyzer(BaseAnalyzer):
             )
         }
 
+    def _get_multi_test_results(self,
+                                athlete_id: UUID,
+                                primary_test: str,
+                                related_tests: List[str]) -> Dict[str, List[float]]:
+        """Fetch paired result series for the primary and related tests"""
+        tests = {}
+        for name in [primary_test, *related_tests]:
+            test = self._result_repository.find_by_name(name)
+            if test:
+                tests[name] = test.id
+
+        matrix = self.get_results_matrix(
+            athlete_ids=[athlete_id],
+            test_ids=list(tests.values())
+        )
+
+        # Pair the n most recent results of every test, oldest first
+        depth = int(matrix.mask[0].sum(axis=1).min()) if tests else 0
+        return {
+            name: matrix.values[0, i, :depth][::-1].tolist()
+            for i, name in enumerate(tests)
+        }
+
     def _calculate_test_correlations(self, results: Dict) -> Dict:
         """Calculate correlations between tests"""
         correlations = {}
@@ -1,6 +1,7 @@
 from .jump_profile_analyzer import JumpProfileAnalyzer
 from .force_velocity_analyzer import ForceVelocityAnalyzer
 from .metrics import JumpMetricsCalculator, RSIMetrics, JumpMetrics, ForceVelocityMetrics
+from .jump_trace import JumpTraceProcessor, JumpTraceResults
 
 __all__ = [
     'JumpProfileAnalyzer',
@@ -8,5 +9,7 @@ __all__ = [
     'JumpMetricsCalculator',
     'RSIMetrics',
     'JumpMetrics',
-    'ForceVelocityMetrics'
+    'ForceVelocityMetrics',
+    'JumpTraceProcessor',
+    'JumpTraceResults'
 ]
\ No newline at end of file
@@ -1,6 +1,7 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
 import numpy as np
+from scipy import stats
 from ..base.base_analyzer import BaseAnalyzer
 from .metrics import (
     JumpMetricsCalculator,
@@ -9,6 +10,8 @@ from .metrics import (
     ReactiveStrengthLevel,
     ForceVelocityMetrics
 )
+from ....entity.value_objects import SignalFilter
+from .jump_trace import DROP_JUMP, JumpTraceProcessor
 
 class JumpProfileAnalyzer(BaseAnalyzer):
     def __init__(self, result_repository):
@@ -68,6 +71,72 @@ class JumpProfileAnalyzer(BaseAnalyzer):
 
         return profile
 
+    def analyze_traces(self,
+                       sample_rate: float,
+                       cmj_traces: Sequence[Sequence[float]],
+                       drop_jump_traces: Optional[Sequence[Sequence[float]]] = None,
+                       drop_heights: Optional[Sequence[float]] = None,
+                       body_mass: Optional[float] = None,
+                       loaded_jump_traces: Optional[Sequence[Sequence[float]]] = None,
+                       added_weights: Optional[Sequence[float]] = None,
+                       signal_filter: Optional[SignalFilter] = None) -> Dict:
+        """
+        Analyze one session of raw force-plate jump traces.
+
+        Heights and contact times come from JumpTraceProcessor; the best CMJ
+        is the reference for the drop jumps, and the loaded countermovement
+        jumps (with their added weights, kg) build the force-velocity profile.
+        signal_filter is applied to every trace before phase detection.
+        """
+        processor = JumpTraceProcessor(sample_rate=sample_rate, signal_filter=signal_filter)
+        cmj = processor.process(cmj_traces, 'CMJ')
+        if not cmj.valid.any():
+            raise ValueError("No complete countermovement jump detected")
+        cmj_height = float(np.nanmax(cmj.jump_height))
+        if body_mass is None:
+            body_mass = float(np.nanmedian(cmj.body_weight) / 9.81)
+
+        analysis = {
+            "cmj": {
+                "best_height": cmj_height,
+                "trials": self._trace_trials(cmj)
+            }
+        }
+
+        if drop_jump_traces:
+            drop_jumps = processor.process(
+                drop_jump_traces,
+                DROP_JUMP,
+                body_masses=[body_mass] * len(drop_jump_traces),
+                drop_heights=drop_heights
+            )
+            analysis["drop_jumps"] = {"trials": self._trace_trials(drop_jumps)}
+            trials = drop_jumps.to_drop_jumps(drop_heights)
+            if trials:
+                analysis["reactive_strength"] = self.analyze_reactive_strength(trials, cmj_height)
+
+        if loaded_jump_traces:
+            if (not added_weights or len(added_weights) != len(loaded_jump_traces)
+                    or any(weight is None for weight in added_weights)):
+                raise ValueError("Each loaded jump needs an added weight")
+            loaded = processor.process(loaded_jump_traces, 'CMJ')
+            analysis["force_velocity_profile"] = self._analyze_force_velocity(
+                loaded.to_force_velocity_data(added_weights, body_mass)
+            )
+
+        return analysis
+
+    def _trace_trials(self, results) -> List[Dict]:
+        """Per-trial phase timings and heights, None where not detected"""
+        fields = ("movement_onset", "takeoff_time", "landing_time", "contact_time", "flight_time",
+                  "takeoff_velocity", "jump_height_impulse", "jump_height_flight", "peak_force", "rsi")
+        columns = {name: getattr(results, name) for name in fields}
+        return [
+            {name: None if np.isnan(values[trial]) else round(float(values[trial]), 4)
+             for name, values in columns.items()}
+            for trial in range(len(results))
+        ]
+
     def analyze_reactive_strength(self, 
                                 drop_jumps: List[Dict],
                                 cmj_height: float) -> Dict:
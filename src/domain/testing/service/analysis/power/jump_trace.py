@@ -0,0 +1,231 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from ....entity.value_objects import SignalFilter
+from ..common.force_trace import (
+    GRAVITY,
+    TRACE_BLOCK_SIZE,
+    baseline,
+    cumulative_impulse,
+    first_crossing,
+    iter_trace_blocks,
+    sample_at
+)
+from ..common.signal_filter import filter_matrix
+from .metrics import JumpMetrics
+
+COUNTERMOVEMENT_JUMPS = ('CMJ', 'Abalakov')
+DROP_JUMP = 'Drop Jump'
+
+@dataclass
+class JumpTraceResults:
+    """
+    Per-trial jump metrics as arrays; NaN where a phase was not found.
+
+    For countermovement jumps contact_time is the time from the start of
+    unweighting to takeoff, and rsi is the modified RSI (height / time to
+    takeoff). For drop jumps they are ground contact time and RSI.
+    """
+    jump_type: str
+    body_weight: np.ndarray         # N, weighing period (CMJ) or body mass (drop jump)
+    movement_onset: np.ndarray      # s, unweighting (CMJ) or touchdown (drop jump)
+    takeoff_time: np.ndarray        # s
+    landing_time: np.ndarray        # s
+    contact_time: np.ndarray        # s
+    flight_time: np.ndarray         # s
+    takeoff_velocity: np.ndarray    # m/s, impulse-momentum
+    jump_height_impulse: np.ndarray # m, from takeoff velocity
+    jump_height_flight: np.ndarray  # m, from flight time
+    peak_force: np.ndarray          # N, between movement onset and takeoff
+    rsi: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.jump_height_flight)
+
+    @property
+    def jump_height(self) -> np.ndarray:
+        """Impulse-momentum height for countermovement jumps, flight time for drop jumps"""
+        if self.jump_type == DROP_JUMP:
+            return self.jump_height_flight
+        return np.where(np.isnan(self.jump_height_impulse),
+                        self.jump_height_flight, self.jump_height_impulse)
+
+    @property
+    def valid(self) -> np.ndarray:
+        return ~np.isnan(self.jump_height) & ~np.isnan(self.contact_time)
+
+    def to_jump_metrics(self,
+                        trial: int,
+                        drop_height: Optional[float] = None,
+                        added_weight: Optional[float] = None) -> JumpMetrics:
+        if not self.valid[trial]:
+            raise ValueError(f"No complete jump detected in trial {trial}")
+        return JumpMetrics(
+            height=float(self.jump_height[trial]),
+            type=self.jump_type,
+            contact_time=float(self.contact_time[trial]),
+            drop_height=drop_height,
+            added_weight=added_weight
+        )
+
+    def to_drop_jumps(self, drop_heights: Optional[Sequence[float]] = None) -> List[Dict]:
+        """Valid trials in the form JumpProfileAnalyzer.analyze_reactive_strength takes"""
+        heights, valid = self.jump_height, self.valid
+        return [
+            {
+                "trial": int(trial),
+                "height": float(heights[trial]),
+                "contact_time": float(self.contact_time[trial]),
+                "drop_height": drop_heights[trial] if drop_heights is not None else None
+            }
+            for trial in np.flatnonzero(valid)
+        ]
+
+    def to_force_velocity_data(self,
+                               added_weights: Sequence[float],
+                               body_mass: Optional[float] = None) -> List[Dict]:
+        """
+        Valid trials in the form JumpProfileAnalyzer._analyze_force_velocity
+        takes. Body mass defaults to the weighing period minus the added load.
+        """
+        heights, valid = self.jump_height, self.valid
+        return [
+            {
+                "trial": int(trial),
+                "height": float(heights[trial]),
+                "added_weight": added_weights[trial],
+                "body_mass": body_mass if body_mass is not None
+                             else float(self.body_weight[trial] / GRAVITY - added_weights[trial])
+            }
+            for trial in np.flatnonzero(valid)
+        ]
+
+@dataclass
+class JumpTraceProcessor:
+    """
+    Derive jump phases and heights from raw vertical force-time traces.
+
+    Countermovement jumps must start with the athlete standing still for
+    weighing_period seconds; unweighting begins when force drops onset_sds
+    SDs (at least min_onset_force N) below body weight, and integration
+    starts onset_backtrack seconds earlier. Drop jump traces start with the
+    athlete off the plate. In both, the athlete is airborne while force is
+    below flight_threshold. With a signal_filter, flight is still detected
+    on the raw force, where the filter cannot ring around the threshold.
+    """
+    sample_rate: float                      # Hz
+    weighing_period: float = 1.0            # s
+    onset_sds: float = 5.0
+    min_onset_force: float = 20.0           # N
+    onset_backtrack: float = 0.03           # s
+    flight_threshold: float = 20.0          # N
+    block_size: int = TRACE_BLOCK_SIZE
+    # Applied to each block before any phase detection
+    signal_filter: Optional[SignalFilter] = None
+
+    def process(self,
+                traces: Sequence[Sequence[float]],
+                jump_type: str = 'CMJ',
+                body_masses: Optional[Sequence[Optional[float]]] = None,
+                drop_heights: Optional[Sequence[Optional[float]]] = None) -> JumpTraceResults:
+        """
+        Process many trials of one jump type and sample rate in one call.
+
+        Drop jump heights from impulse-momentum need each trial's body mass
+        and drop height; without them only the flight-time height is set.
+        """
+        if jump_type not in COUNTERMOVEMENT_JUMPS + (DROP_JUMP,):
+            raise ValueError(f"Unsupported jump type: {jump_type}")
+
+        count = len(traces)
+        results = JumpTraceResults(jump_type, *(np.full(count, np.nan) for _ in range(11)))
+        for start, force, lengths in iter_trace_blocks(traces, self.block_size):
+            rows = slice(start, start + len(force))
+            filtered = force
+            if self.signal_filter:
+                filtered = filter_matrix(force, lengths, self.sample_rate, self.signal_filter)
+            if jump_type == DROP_JUMP:
+                phases = self._drop_jump_phases(
+                    filtered, force, lengths,
+                    self._optional(body_masses, rows, len(force)),
+                    self._optional(drop_heights, rows, len(force))
+                )
+            else:
+                phases = self._countermovement_phases(filtered, force, lengths)
+            self._store(results, rows, filtered, *phases)
+
+        results.rsi[:] = results.jump_height / results.contact_time
+        return results
+
+    def _countermovement_phases(self, force: np.ndarray, raw: np.ndarray, lengths: np.ndarray):
+        weighing_samples = max(int(self.weighing_period * self.sample_rate), 1)
+        weight, noise = baseline(force, weighing_samples)
+        threshold = weight - np.maximum(self.onset_sds * noise, self.min_onset_force)
+
+        onset = first_crossing(force < threshold[:, None], start=np.full(len(force), weighing_samples))
+        takeoff, landing = self._flight(raw, onset)
+        integration_start = np.maximum(onset - int(round(self.onset_backtrack * self.sample_rate)), 0)
+
+        mass = weight / GRAVITY
+        impulse = cumulative_impulse(force - weight[:, None], self.sample_rate)
+        velocity = (sample_at(impulse, takeoff, lengths)
+                    - sample_at(impulse, integration_start, lengths)) / mass
+        return weight, onset, takeoff, landing, np.where(onset >= 0, velocity, np.nan)
+
+    def _drop_jump_phases(self,
+                          force: np.ndarray,
+                          raw: np.ndarray,
+                          lengths: np.ndarray,
+                          body_mass: np.ndarray,
+                          drop_height: np.ndarray):
+        touchdown = first_crossing(raw >= self.flight_threshold)
+        takeoff, landing = self._flight(raw, touchdown)
+
+        weight = body_mass * GRAVITY
+        impulse = cumulative_impulse(force - weight[:, None], self.sample_rate)
+        touchdown_velocity = -np.sqrt(2 * GRAVITY * drop_height)
+        velocity = touchdown_velocity + (sample_at(impulse, takeoff, lengths)
+                                         - sample_at(impulse, touchdown, lengths)) / body_mass
+        return weight, touchdown, takeoff, landing, velocity
+
+    def _flight(self, force: np.ndarray, after: np.ndarray):
+        """First takeoff after the given sample and the landing that follows it"""
+        takeoff = first_crossing(force < self.flight_threshold, start=after)
+        takeoff = np.where(after >= 0, takeoff, -1)
+        landing = first_crossing(force >= self.flight_threshold, start=takeoff)
+        return takeoff, np.where(takeoff >= 0, landing, -1)
+
+    def _store(self, results: JumpTraceResults, rows: slice, force: np.ndarray,
+               weight, onset, takeoff, landing, takeoff_velocity):
+        """Derive timings and heights from phase indices and write them to rows"""
+        found = (onset >= 0) & (takeoff >= 0)
+        landed = found & (landing >= 0)
+
+        columns = np.arange(force.shape[1])
+        propulsion = (columns[None, :] >= onset[:, None]) & (columns[None, :] < takeoff[:, None])
+        peak_force = np.max(np.where(propulsion, force, -np.inf), axis=1, initial=-np.inf)
+
+        contact_time = np.where(found, (takeoff - onset) / self.sample_rate, np.nan)
+        flight_time = np.where(landed, (landing - takeoff) / self.sample_rate, np.nan)
+        height_flight = GRAVITY * flight_time ** 2 / 8
+        velocity = np.where(found, takeoff_velocity, np.nan)
+        height_impulse = np.where(velocity > 0, velocity ** 2 / (2 * GRAVITY),
+                                  np.where(np.isnan(velocity), np.nan, 0.0))
+
+        results.body_weight[rows] = weight
+        results.movement_onset[rows] = np.where(onset >= 0, onset / self.sample_rate, np.nan)
+        results.takeoff_time[rows] = np.where(found, takeoff / self.sample_rate, np.nan)
+        results.landing_time[rows] = np.where(landed, landing / self.sample_rate, np.nan)
+        results.contact_time[rows] = contact_time
+        results.flight_time[rows] = flight_time
+        results.takeoff_velocity[rows] = velocity
+        results.jump_height_impulse[rows] = height_impulse
+        results.jump_height_flight[rows] = height_flight
+        results.peak_force[rows] = np.where(found, peak_force, np.nan)
+
+    @staticmethod
+    def _optional(values: Optional[Sequence[Optional[float]]], rows: slice, count: int) -> np.ndarray:
+        """A per-trial input as floats, NaN where it is missing"""
+        if values is None:
+            return np.full(count, np.nan)
+        return np.array([np.nan if value is None else value for value in values[rows]], dtype=float)
\ No newline at end of file
@@ -22,8 +22,8 @@ class RSIMetrics:
     contact_time: float
     drop_height: float
     rsi_value: float
-    rsi_modified: Optional[float] = None
     quality: str
+    rsi_modified: Optional[float] = None
 
 @dataclass
 class ForceVelocityMetrics:
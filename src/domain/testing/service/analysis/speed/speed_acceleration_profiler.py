@@ -1,6 +1,6 @@
 # src/domain/testing/service/analysis/speed_acceleration_profiler.py
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 from enum import Enum
 import numpy as np
 
@@ -56,6 +56,89 @@ class SpeedAccelerationProfiler:
 
         return profile
 
+    # Band edges for the array classification, worst to best; values on an
+    # edge fall in the better band, as in the _evaluate_* methods
+    _QUALITY_BANDS = np.array([
+        SpeedQuality.NEEDS_IMPROVEMENT,
+        SpeedQuality.AVERAGE,
+        SpeedQuality.GOOD,
+        SpeedQuality.EXCELLENT
+    ], dtype=object)
+    VELOCITY_DROP_EDGES = (5, 10, 15)       # %, lower is better
+    ACCELERATION_DEFICIT_EDGES = (15, 20, 25)
+
+    def profile_squad(self,
+                      sprint_10m: Sequence[float],
+                      sprint_20m: Sequence[float],
+                      flying_10m: Optional[Sequence[float]] = None) -> Dict[str, np.ndarray]:
+        """
+        The metrics of analyze_acceleration_profile for a whole squad at once.
+
+        Takes one time per athlete (NaN where missing) and returns arrays
+        aligned with the input; qualities are SpeedQuality values binned with
+        np.digitize against the same thresholds as the single-athlete path.
+        """
+        sprint_10m = np.asarray(sprint_10m, dtype=float)
+        sprint_20m = np.asarray(sprint_20m, dtype=float)
+        flying_10m = (np.full(sprint_10m.shape, np.nan) if flying_10m is None
+                      else np.asarray(flying_10m, dtype=float))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            velocity_10m = 10 / sprint_10m
+            acceleration = velocity_10m ** 2 / (2 * 10)
+            second_10m = sprint_20m - sprint_10m
+            final_velocity = 10 / second_10m
+            velocity_drop = (velocity_10m - final_velocity) / velocity_10m * 100
+            velocity_20m = 20 / sprint_20m
+            acceleration_10_20 = (velocity_20m ** 2 - velocity_10m ** 2) / (2 * 10)
+            acceleration_decrease = (acceleration - acceleration_10_20) / acceleration * 100
+            max_velocity = 10 / flying_10m
+            deficit = (max_velocity - velocity_10m) / max_velocity * 100
+
+        thresholds = self.ACCELERATION_THRESHOLDS
+        speed_thresholds = self.MAX_SPEED_THRESHOLDS
+        return {
+            "acceleration": acceleration,
+            "acceleration_quality": self._bin_higher_better(acceleration, thresholds),
+            "acceleration_score": self._relative_scores(acceleration, thresholds),
+            "initial_velocity": velocity_10m,
+            "second_10m_time": second_10m,
+            "final_velocity": final_velocity,
+            "velocity_drop": velocity_drop,
+            "speed_maintenance_quality": self._bin_lower_better(velocity_drop, self.VELOCITY_DROP_EDGES),
+            "acceleration_10_20": acceleration_10_20,
+            "acceleration_decrease": acceleration_decrease,
+            "velocity_20m": velocity_20m,
+            "max_velocity": max_velocity,
+            "max_speed_quality": self._bin_higher_better(max_velocity, speed_thresholds),
+            "max_speed_score": self._relative_scores(max_velocity, speed_thresholds),
+            "acceleration_deficit": deficit,
+            "deficit_quality": self._bin_lower_better(deficit, self.ACCELERATION_DEFICIT_EDGES)
+        }
+
+    def _bin_higher_better(self, values: np.ndarray, thresholds: Dict[str, float]) -> np.ndarray:
+        edges = [thresholds["average"], thresholds["good"], thresholds["excellent"]]
+        return self._bands(values, np.digitize(values, edges))
+
+    def _bin_lower_better(self, values: np.ndarray, edges: Sequence[float]) -> np.ndarray:
+        # right=True so a value equal to an edge counts as the better band
+        worst_first = len(edges) - np.digitize(values, edges, right=True)
+        return self._bands(values, worst_first)
+
+    def _bands(self, values: np.ndarray, band: np.ndarray) -> np.ndarray:
+        qualities = self._QUALITY_BANDS[np.clip(band, 0, len(self._QUALITY_BANDS) - 1)]
+        qualities[np.isnan(values)] = None
+        return qualities
+
+    @staticmethod
+    def _relative_scores(values: np.ndarray, thresholds: Dict[str, float]) -> np.ndarray:
+        """_calculate_relative_score for an array: piecewise linear 0-50-75-100"""
+        return np.interp(
+            values,
+            [0, thresholds["average"], thresholds["good"], thresholds["excellent"]],
+            [0, 50, 75, 100]
+        )
+
     def _analyze_initial_acceleration(self, sprint_10m: float) -> Dict:
         """Analyze initial acceleration phase (0-10m)"""
         velocity = 10 / sprint_10m
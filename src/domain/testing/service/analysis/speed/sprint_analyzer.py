@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from enum import Enum
+import numpy as np
 from ..base.base_analyzer import BaseAnalyzer
 from .speed_acceleration_profiler import SpeedAccelerationProfiler, SpeedQuality
 
@@ -27,6 +28,58 @@ class SprintResults:
     flying_10m: Optional[float] = None
     historical_results: Optional[List[Dict]] = None
 
+# Program per training focus, chosen from the 20m/10m time ratio
+TRAINING_PROGRAMS = {
+    TrainingFocus.STRENGTH: TrainingRecommendation(
+        focus="Acceleration and Force Production",
+        key_exercises=[
+            "Heavy Squats (3-5 reps)",
+            "Deadlifts (3-5 reps)",
+            "Power Cleans (3-5 reps)",
+            "Weighted Jumps",
+            "Hill Sprints"
+        ],
+        training_emphasis="Focus on maximal strength and explosive power",
+        volume="3-4 sets per exercise, 2-3 times per week",
+        rest="2-3 minutes between sets",
+        progression_notes="Increase weight when 3x5 is achieved with good form"
+    ),
+    TrainingFocus.POWER: TrainingRecommendation(
+        focus="Speed-Strength Development",
+        key_exercises=[
+            "Jump Squats",
+            "Trap Bar Jumps",
+            "Olympic Lifts",
+            "Resisted Sprints",
+            "Plyometric Combinations"
+        ],
+        training_emphasis="Focus on explosive power and rate of force development",
+        volume="4-6 sets per exercise, 2-3 times per week",
+        rest="2 minutes between sets",
+        progression_notes="Progress by increasing movement velocity"
+    ),
+    TrainingFocus.SPEED: TrainingRecommendation(
+        focus="Speed and Technique",
+        key_exercises=[
+            "Sprint Technique Drills",
+            "Flying Sprints",
+            "Rolling Starts",
+            "Sprint Bounds",
+            "Light Plyometrics"
+        ],
+        training_emphasis="Focus on sprint mechanics and neural activation",
+        volume="5-8 sets per exercise, 2-3 times per week",
+        rest="Full recovery (2-3 minutes)",
+        progression_notes="Focus on quality and technical execution"
+    )
+}
+
+# Upper bounds of the normalized 20m time for the strength and power programs
+TRAINING_FOCUS_EDGES = (1.79, 1.82)
+_TRAINING_FOCI = np.array([TrainingFocus.STRENGTH, TrainingFocus.POWER, TrainingFocus.SPEED], dtype=object)
+
+SPRINT_TEST_NAMES = ("10M Sprint", "20M Sprint", "Flying 10M")
+
 class SprintAnalyzer(BaseAnalyzer):  # Changed to inherit from BaseAnalyzer
     def __init__(self, result_repository):
         super().__init__(result_repository)  # Add this line to initialize BaseAnalyzer
@@ -53,6 +106,102 @@ class SprintAnalyzer(BaseAnalyzer):  # Changed to inherit from BaseAnalyzer
 
         return basic_analysis
 
+    def analyze_squad(self,
+                      athlete_ids: List[UUID],
+                      test_date: Optional[datetime] = None) -> Dict:
+        """
+        Sprint profiles for a whole squad from one results query.
+
+        Uses each athlete's latest 10m, 20m and flying 10m times on or before
+        test_date. Metrics and qualities are computed over squad-wide arrays;
+        athletes without both a 10m and a 20m time are listed as incomplete.
+        Historical trends are left out; use analyze per athlete for those.
+        Athletes are keyed by their id strings so the result serializes as JSON.
+        """
+        tests = [self._result_repository.find_by_name(name) for name in SPRINT_TEST_NAMES]
+        if not tests[0] or not tests[1]:
+            raise ValueError("10M Sprint and 20M Sprint tests must be defined")
+        tests = [test for test in tests if test]
+
+        matrix = self._result_repository.get_latest_results(
+            athlete_ids,
+            [test.id for test in tests],
+            as_of=test_date
+        )
+        times = matrix.latest()
+        sprint_10m, sprint_20m = times[:, 0], times[:, 1]
+        flying_10m = times[:, 2] if len(tests) > 2 else np.full(len(times), np.nan)
+
+        metrics = self._speed_profiler.profile_squad(sprint_10m, sprint_20m, flying_10m)
+        focus = self._training_focus(sprint_20m / sprint_10m)
+        complete = ~np.isnan(sprint_10m) & ~np.isnan(sprint_20m)
+        has_flying = complete & ~np.isnan(flying_10m)
+
+        # Round whole columns once, then read plain floats per athlete
+        columns = {name: np.round(values, 2).tolist() for name, values in metrics.items()
+                   if values.dtype != object}
+        times_10m, times_20m, times_flying = sprint_10m.tolist(), sprint_20m.tolist(), flying_10m.tolist()
+
+        profiles = {}
+        for i in np.flatnonzero(complete):
+            profile = {
+                "sprint_times": {
+                    "10m": times_10m[i],
+                    "20m": times_20m[i],
+                    "flying_10m": times_flying[i] if has_flying[i] else None
+                },
+                "pure_acceleration": {
+                    "value": columns["acceleration"][i],
+                    "quality": metrics["acceleration_quality"][i].value,
+                    "relative_score": columns["acceleration_score"][i],
+                    "interpretation": self._speed_profiler._get_acceleration_interpretation(
+                        metrics["acceleration_quality"][i]),
+                    "velocity": columns["initial_velocity"][i]
+                },
+                "speed_endurance": {
+                    "second_10m_time": columns["second_10m_time"][i],
+                    "velocity_drop_percentage": columns["velocity_drop"][i],
+                    "quality": metrics["speed_maintenance_quality"][i].value,
+                    "initial_velocity": columns["initial_velocity"][i],
+                    "final_velocity": columns["final_velocity"][i]
+                },
+                "acceleration_curve": {
+                    "acceleration_phases": {
+                        "0-10m": columns["acceleration"][i],
+                        "10-20m": columns["acceleration_10_20"][i]
+                    },
+                    "acceleration_decrease": columns["acceleration_decrease"][i],
+                    "velocity_progression": {
+                        "10m": columns["initial_velocity"][i],
+                        "20m": columns["velocity_20m"][i]
+                    }
+                },
+                "training_program": focus[i].value,
+                "recommendations": TRAINING_PROGRAMS[focus[i]]
+            }
+            if has_flying[i]:
+                profile["max_speed"] = {
+                    "max_velocity": columns["max_velocity"][i],
+                    "quality": metrics["max_speed_quality"][i].value,
+                    "relative_score": columns["max_speed_score"][i],
+                    "time": times_flying[i]
+                }
+                profile["acceleration_deficit"] = {
+                    "deficit_percentage": columns["acceleration_deficit"][i],
+                    "quality": metrics["deficit_quality"][i].value,
+                    "interpretation": self._speed_profiler._get_deficit_interpretation(
+                        metrics["deficit_quality"][i]),
+                    "acceleration_velocity": columns["initial_velocity"][i],
+                    "max_velocity": columns["max_velocity"][i]
+                }
+            profiles[str(matrix.athlete_ids[i])] = profile
+
+        return {
+            "test_date": test_date,
+            "profiles": profiles,
+            "incomplete": [str(matrix.athlete_ids[i]) for i in np.flatnonzero(~complete)]
+        }
+
     def _get_sprint_results(self, athlete_id: UUID, test_date: datetime) -> SprintResults:
         """Fetch all relevant sprint results"""
         sprint_10m = self._result_repository.get_latest_result(
@@ -128,64 +277,13 @@ class SprintAnalyzer(BaseAnalyzer):  # Changed to inherit from BaseAnalyzer
                                     normalized_20m: float,
                                     acceleration_profile: Dict) -> Tuple[str, TrainingRecommendation]:
         """Generate specific training recommendations"""
-        # Analyze acceleration qualities
-        initial_acc_quality = acceleration_profile["pure_acceleration"]["metrics"].quality
-        speed_maint_quality = acceleration_profile["speed_endurance"]["quality"]
-
-        if normalized_20m <= 1.79:
-            return (
-                TrainingFocus.STRENGTH.value,
-                TrainingRecommendation(
-                    focus="Acceleration and Force Production",
-                    key_exercises=[
-                        "Heavy Squats (3-5 reps)",
-                        "Deadlifts (3-5 reps)",
-                        "Power Cleans (3-5 reps)",
-                        "Weighted Jumps",
-                        "Hill Sprints"
-                    ],
-                    training_emphasis="Focus on maximal strength and explosive power",
-                    volume="3-4 sets per exercise, 2-3 times per week",
-                    rest="2-3 minutes between sets",
-                    progression_notes="Increase weight when 3x5 is achieved with good form"
-                )
-            )
-        elif 1.79 < normalized_20m <= 1.82:
-            return (
-                TrainingFocus.POWER.value,
-                TrainingRecommendation(
-                    focus="Speed-Strength Development",
-                    key_exercises=[
-                        "Jump Squats",
-                        "Trap Bar Jumps",
-                        "Olympic Lifts",
-                        "Resisted Sprints",
-                        "Plyometric Combinations"
-                    ],
-                    training_emphasis="Focus on explosive power and rate of force development",
-                    volume="4-6 sets per exercise, 2-3 times per week",
-                    rest="2 minutes between sets",
-                    progression_notes="Progress by increasing movement velocity"
-                )
-            )
-        else:
-            return (
-                TrainingFocus.SPEED.value,
-                TrainingRecommendation(
-                    focus="Speed and Technique",
-                    key_exercises=[
-                        "Sprint Technique Drills",
-                        "Flying Sprints",
-                        "Rolling Starts",
-                        "Sprint Bounds",
-                        "Light Plyometrics"
-                    ],
-                    training_emphasis="Focus on sprint mechanics and neural activation",
-                    volume="5-8 sets per exercise, 2-3 times per week",
-                    rest="Full recovery (2-3 minutes)",
-                    progression_notes="Focus on quality and technical execution"
-                )
-            )
+        focus = self._training_focus(normalized_20m)
+        return focus.value, TRAINING_PROGRAMS[focus]
+
+    @staticmethod
+    def _training_focus(normalized_20m: np.ndarray) -> np.ndarray:
+        """TrainingFocus per normalized 20m time; a time on an edge gets the lower program"""
+        return _TRAINING_FOCI[np.digitize(normalized_20m, TRAINING_FOCUS_EDGES, right=True)]
 
     def _generate_performance_summary(self, 
                                     acceleration_profile: Dict,
@@ -1,4 +1,5 @@
 from .strength_analyzer import StrengthAnalyzer
 from .imtp_analyzer import IMTPAnalyzer
+from .imtp_trace import IMTPTraceProcessor, IMTPTraceResults
 
-__all__ = ['StrengthAnalyzer', 'IMTPAnalyzer']
\ No newline at end of file
+__all__ = ['StrengthAnalyzer', 'IMTPAnalyzer', 'IMTPTraceProcessor', 'IMTPTraceResults']
\ No newline at end of file
@@ -1,8 +1,10 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
 from datetime import datetime
 from ..base.base_analyzer import BaseAnalyzer
 from .strength_metrics import StrengthMetricsCalculator, IMTPMetrics, StrengthLevel
+from ....entity.value_objects import SignalFilter
+from .imtp_trace import IMTPTraceProcessor
 
 class IMTPAnalyzer(BaseAnalyzer):
     """Analyzer for Isometric Mid-thigh Pull test results"""
@@ -48,6 +50,45 @@ class IMTPAnalyzer(BaseAnalyzer):
 
         return analysis
 
+    def analyze_traces(self,
+                       athlete_ids: Sequence[UUID],
+                       traces: Sequence[Sequence[float]],
+                       sample_rate: float,
+                       body_masses: Optional[Sequence[Optional[float]]] = None,
+                       test_date: Optional[datetime] = None,
+                       signal_filter: Optional[SignalFilter] = None) -> List[Dict]:
+        """
+        Analyze raw force-time traces, one per trial.
+
+        Body mass defaults to the weighing period's body weight. Trials
+        without a detectable onset get an "error" entry instead of metrics.
+        Historical trends are left out; use analyze per athlete for those.
+        signal_filter, usually from the test protocol, is applied to all
+        traces before onset detection.
+        """
+        if len(athlete_ids) != len(traces):
+            raise ValueError("athlete_ids and traces must have the same length")
+        if test_date is None:
+            test_date = datetime.now()
+        body_masses = body_masses or [None] * len(traces)
+
+        trace_results = IMTPTraceProcessor(
+            sample_rate=sample_rate,
+            signal_filter=signal_filter
+        ).process(traces)
+        analyses = []
+        for trial, (athlete_id, body_mass) in enumerate(zip(athlete_ids, body_masses)):
+            try:
+                metrics = trace_results.to_metrics(trial, athlete_id, body_mass, test_date)
+            except ValueError as e:
+                analyses.append({"athlete_id": athlete_id, "trial": trial, "error": str(e)})
+                continue
+            analysis = self.analyze_result(metrics)
+            analysis.update({"athlete_id": athlete_id, "trial": trial, "metrics": metrics})
+            analyses.append(analysis)
+
+        return analyses
+
     def analyze_result(self, result: IMTPMetrics) -> Dict:
         """Analyze IMTP test result and provide assessment"""
         thresholds = self._metrics_calculator.IMTP_THRESHOLDS
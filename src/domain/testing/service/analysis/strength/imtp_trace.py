@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+from uuid import UUID
+import numpy as np
+from ....entity.value_objects import SignalFilter
+from ..common.force_trace import (
+    GRAVITY,
+    TRACE_BLOCK_SIZE,
+    baseline,
+    cumulative_impulse,
+    first_crossing,
+    iter_trace_blocks,
+    sample_at
+)
+from ..common.signal_filter import filter_matrix
+from .strength_metrics import IMTPMetrics
+
+@dataclass
+class IMTPTraceResults:
+    """Per-trial IMTP metrics as arrays; NaN where a trial has no onset"""
+    epochs_ms: Tuple[int, ...]
+    onset_time: np.ndarray      # s from start of recording
+    body_weight: np.ndarray     # N, mean of the weighing period
+    peak_force: np.ndarray      # N, gross
+    time_to_peak: np.ndarray    # s from onset
+    force_at: np.ndarray        # N, gross force at each epoch after onset
+    rfd: np.ndarray             # N/s, average RFD from onset to each epoch
+    impulse: np.ndarray         # N·s, net impulse from onset to each epoch
+
+    def __len__(self) -> int:
+        return len(self.peak_force)
+
+    def to_metrics(self,
+                   trial: int,
+                   athlete_id: UUID,
+                   body_mass: Optional[float] = None,
+                   test_date: Optional[datetime] = None) -> IMTPMetrics:
+        """Build IMTPMetrics for one trial; body mass defaults to body weight / g"""
+        if np.isnan(self.peak_force[trial]):
+            raise ValueError(f"No force onset detected in trial {trial}")
+        if body_mass is None:
+            body_mass = self.body_weight[trial] / GRAVITY
+        force_at = self._by_epoch(self.force_at[trial])
+        rfd = self._by_epoch(self.rfd[trial])
+        if 50 not in rfd or 200 not in force_at:
+            raise ValueError(f"Trial {trial} ends less than 200 ms after onset")
+        return IMTPMetrics(
+            peak_force=float(self.peak_force[trial]),
+            relative_peak_force=float(self.peak_force[trial] / body_mass),
+            rfd_50=rfd[50],
+            force_200ms=force_at[200],
+            test_date=test_date or datetime.now(),
+            athlete_id=athlete_id,
+            time_to_peak=float(self.time_to_peak[trial]),
+            force_at=force_at,
+            rfd=rfd,
+            impulse=self._by_epoch(self.impulse[trial])
+        )
+
+    def _by_epoch(self, values: np.ndarray) -> Dict[int, float]:
+        return {epoch: float(value) for epoch, value in zip(self.epochs_ms, values)
+                if not np.isnan(value)}
+
+@dataclass
+class IMTPTraceProcessor:
+    """
+    Derive IMTP metrics from raw vertical force-time traces.
+
+    Onset is the first sample more than onset_sds standard deviations (and
+    at least min_onset_force N) above the weighing period at the start of
+    the trace. Trials are processed as padded matrices, block_size at a
+    time, so a whole session costs a handful of array operations.
+    """
+    sample_rate: float                              # Hz
+    weighing_period: float = 1.0                    # s
+    onset_sds: float = 5.0
+    min_onset_force: float = 20.0                   # N
+    epochs_ms: Tuple[int, ...] = (50, 100, 150, 200, 250)
+    block_size: int = TRACE_BLOCK_SIZE
+    # Applied to each block before any phase detection
+    signal_filter: Optional[SignalFilter] = None
+
+    def process(self, traces: Sequence[Sequence[float]]) -> IMTPTraceResults:
+        """Process many trials of the same sample rate in one call"""
+        count, epochs = len(traces), len(self.epochs_ms)
+        results = IMTPTraceResults(
+            epochs_ms=tuple(self.epochs_ms),
+            onset_time=np.full(count, np.nan),
+            body_weight=np.full(count, np.nan),
+            peak_force=np.full(count, np.nan),
+            time_to_peak=np.full(count, np.nan),
+            force_at=np.full((count, epochs), np.nan),
+            rfd=np.full((count, epochs), np.nan),
+            impulse=np.full((count, epochs), np.nan)
+        )
+        offsets = np.rint(np.asarray(self.epochs_ms) * self.sample_rate / 1000).astype(np.intp)
+        weighing_samples = max(int(self.weighing_period * self.sample_rate), 1)
+
+        for start, force, lengths in iter_trace_blocks(traces, self.block_size):
+            rows = slice(start, start + len(force))
+            if self.signal_filter:
+                force = filter_matrix(force, lengths, self.sample_rate, self.signal_filter)
+            weight, noise = baseline(force, weighing_samples)
+            threshold = weight + np.maximum(self.onset_sds * noise, self.min_onset_force)
+            onset = first_crossing(force > threshold[:, None], start=np.full(len(force), weighing_samples))
+            found = onset >= 0
+
+            # Peak after onset only, so a pre-tension spike is not reported
+            columns = np.arange(force.shape[1])
+            after_onset = np.where(found[:, None] & (columns[None, :] >= onset[:, None]), force, np.nan)
+            peak_index = np.argmax(np.nan_to_num(after_onset, nan=-np.inf), axis=1)
+
+            epoch_index = onset[:, None] + offsets[None, :]
+            onset_force = sample_at(force, onset, lengths)
+            force_at = sample_at(force, epoch_index, lengths)
+            impulse = cumulative_impulse(force - weight[:, None], self.sample_rate)
+
+            results.body_weight[rows] = weight
+            results.onset_time[rows] = np.where(found, onset / self.sample_rate, np.nan)
+            results.peak_force[rows] = np.where(found, sample_at(force, peak_index, lengths), np.nan)
+            results.time_to_peak[rows] = np.where(found, (peak_index - onset) / self.sample_rate, np.nan)
+            results.force_at[rows] = np.where(found[:, None], force_at, np.nan)
+            results.rfd[rows] = (force_at - onset_force[:, None]) / (offsets[None, :] / self.sample_rate)
+            results.impulse[rows] = np.where(
+                found[:, None],
+                sample_at(impulse, epoch_index, lengths) - sample_at(impulse, onset, lengths)[:, None],
+                np.nan
+            )
+
+        return results
\ No newline at end of file
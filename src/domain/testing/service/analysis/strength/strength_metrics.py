@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 from typing import Dict, Optional
+from uuid import UUID
 
 class StrengthLevel(Enum):
     ELITE = "Elite"
@@ -24,6 +26,11 @@ class IMTPMetrics:
     force_200ms: float
     test_date: datetime
     athlete_id: UUID
+    # Set when the metrics are derived from a raw force trace
+    time_to_peak: Optional[float] = None            # s
+    force_at: Optional[Dict[int, float]] = None     # N at ms after onset
+    rfd: Optional[Dict[int, float]] = None          # N/s from onset to ms
+    impulse: Optional[Dict[int, float]] = None      # N·s from onset to ms
 
 class StrengthMetricsCalculator:
     # Your existing IMTP thresholds
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 from ..entity.test import TestResult
@@ -85,11 +85,40 @@ class TestAnalysisService:
             end_date=time_period[1] if time_period else None
         )
 
+        summary = self._repository.get_result_summary(athlete_id, test_def.id)
+
         analyzer = self._get_analyzer(test_def.category)
         if analyzer:
-            return analyzer.analyze_trend(
+            progress = analyzer.analyze_trend(
                 values=[r.primary_value for r in results],
                 dates=[r.test_date for r in results]
             )
+            progress["summary"] = summary
+            return progress
+
+        return {"results": results, "summary": summary}
+
+    def get_athlete_summary(self, athlete_id: UUID, test_id: UUID) -> Optional[Dict]:
+        """Get latest value, bests, count and mean without scanning results"""
+        return self._repository.get_result_summary(athlete_id, test_id)
+
+    def get_leaderboard(self,
+                        group_id: UUID,
+                        test_id: UUID,
+                        limit: int = 10,
+                        metric: str = 'best',
+                        higher_is_better: bool = True) -> List[Dict]:
+        """Top N of a group on a test"""
+        return self._repository.get_leaderboard(group_id, test_id, limit, metric, higher_is_better)
 
-        return {"results": results}
\ No newline at end of file
+    def get_leaderboard_standing(self,
+                                 group_id: UUID,
+                                 test_id: UUID,
+                                 athlete_id: UUID,
+                                 neighbors: int = 2,
+                                 metric: str = 'best',
+                                 higher_is_better: bool = True) -> Optional[Dict]:
+        """An athlete's rank within a group on a test, with neighbors"""
+        return self._repository.get_leaderboard_standing(
+            group_id, test_id, athlete_id, neighbors, metric, higher_is_better
+        )
\ No newline at end of file
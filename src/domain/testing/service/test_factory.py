@@ -5,6 +5,7 @@ from ..entity.value_objects import (
     TestCategory, 
     TestUnit, 
     TestProtocol, 
+    SignalFilter,
     AdditionalVariable,
     TestEnvironment
 )
@@ -114,7 +115,8 @@ class TestFactory:
                     name="Countermovement Jump Protocol",
                     description="Standard CMJ test",
                     setup_instructions="Use force platform or jump mat",
-                    required_equipment=["Force Platform/Jump Mat"]
+                    required_equipment=["Force Platform/Jump Mat"],
+                    signal_filters={"force": SignalFilter(cutoff=50.0)}
                 ),
                 "variables": [
                     AdditionalVariable("Flight Time", TestUnit.SECONDS, True),
@@ -131,7 +133,8 @@ class TestFactory:
                     name="IMTP Protocol",
                     description="Isometric Mid-thigh Pull test",
                     setup_instructions="Set bar height to mid-thigh position",
-                    required_equipment=["Force Platform", "IMTP Rack", "Bar"]
+                    required_equipment=["Force Platform", "IMTP Rack", "Bar"],
+                    signal_filters={"force": SignalFilter(cutoff=50.0)}
                 ),
                 "variables": [
                     AdditionalVariable("RFD 0-50ms", TestUnit.NEWTONS_PER_SECOND, True),
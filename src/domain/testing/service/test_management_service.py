@@ -1,61 +1,144 @@
-from typing import Dict, List, Optional
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 from ..entity.test import Test, TestCategory, TestUnit
-from ..entity.value_objects import TestProtocol, AdditionalVariable
+from ..entity.value_objects import TestProtocol, AdditionalVariable, SignalFilter
 from ..repository.test_repository import TestRepository
 from .test_factory import TestFactory
 
 # Analyzer imports
-from .analysis.strength.imtp_analyzer import IMTPAnalyzer, IMTPResult
+from .analysis.strength.imtp_analyzer import IMTPAnalyzer
+from .analysis.power.jump_profile_analyzer import JumpProfileAnalyzer
+from .analysis.speed.sprint_analyzer import SprintAnalyzer
+from .analysis.common.comparative_analyzer import ComparativeAnalyzer
+from .analysis.strength.strength_metrics import IMTPMetrics
 from .analysis.test_analyzer_factory import TestAnalyzerFactory
 
 class TestManagementService:
     """Service for managing tests, test definitions, and analysis"""
     
-    def __init__(self, repository: TestRepository):
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    def __init__(self,
+                 repository: TestRepository,
+                 async_repository_factory: Optional[Callable] = None,
+                 analysis_repository_factory: Optional[Callable] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 executor: Optional[Executor] = None,
+                 group_repository=None):
+        """
+        async_repository_factory returns an async context manager yielding an
+        async repository; analysis_repository_factory returns a context manager
+        yielding a sync repository for use in executor threads. Without them,
+        batch analysis runs on the shared repository one item at a time.
+        group_repository is needed for group rankings.
+        """
         self._repository = repository
+        self._group_repository = group_repository
+        self._async_repository_factory = async_repository_factory
+        self._analysis_repository_factory = analysis_repository_factory
+        self._max_concurrency = max_concurrency
+        self._executor = executor
         self._test_factory = TestFactory()
         self._analyzer_factory = TestAnalyzerFactory(repository)
-        self._imtp_analyzer = IMTPAnalyzer()
+        self._imtp_analyzer = IMTPAnalyzer(repository)
+        self._jump_analyzer = JumpProfileAnalyzer(repository)
+        self._sprint_analyzer = SprintAnalyzer(repository)
 
 
 # New methods from when changing database:
     def get_test_analysis(self, test_result_id: UUID) -> Optional[Dict]:
-        """Get analysis for a specific test result"""
+        """
+        Get analysis for a specific test result.
+
+        Analyses are stored per analyzer version and reused until a newer
+        result for the same athlete and test is recorded.
+        """
+        result, analyzer = self._result_analyzer(test_result_id)
+        if not analyzer:
+            return None
+
+        analyzer_type = type(analyzer).__name__
+        cached = self._repository.get_analysis(result.id, analyzer_type, analyzer.VERSION)
+        if cached is not None:
+            return cached
+        return self._analyze_and_store(analyzer, result)
+
+    def get_stored_test_analysis(self, test_result_id: UUID) -> Optional[Dict]:
+        """
+        Stored analysis of a test result for the current analyzer version.
+
+        Never runs an analyzer or writes, so it can be served from a read
+        replica; None means the analysis has yet to be computed.
+        """
+        result, analyzer = self._result_analyzer(test_result_id)
+        if not analyzer:
+            return None
+        return self._repository.get_analysis(result.id, type(analyzer).__name__, analyzer.VERSION)
+
+    def _result_analyzer(self, test_result_id: UUID) -> tuple:
+        """A stored result and the analyzer for its test, or (result, None)"""
         result = self._repository.get_test_result(test_result_id)
         if not result:
-            return None
+            return None, None
 
         test = self._repository.get(result.test_id)
-        analyzer = self._analyzer_factory.get_analyzer(test)
-        if analyzer:
-            return analyzer.analyze(
-                athlete_id=result.athlete_id,
-                test_date=result.test_date,
-                primary_value=result.value,
-                additional_values=result.additional_values
-            )
-        return None
+        return result, self._analyzer_factory.get_analyzer(test)
 
     def get_athlete_test_history(self,
                                athlete_id: UUID,
                                test_id: UUID,
                                time_period: Optional[tuple] = None,
                                limit: int = 10) -> List[Dict]:
-        """Get athlete's test history with analysis"""
-        results = self._repository.get_athlete_results(
+        """
+        Get athlete's test history with analysis.
+
+        Results and their stored analyses are loaded together; the analyzer
+        only runs for results without a current stored analysis.
+        """
+        history = self._repository.get_athlete_history(
             athlete_id=athlete_id,
             test_id=test_id,
             time_period=time_period,
             limit=limit
         )
-        
-        # Include analysis for each result
-        return [{
-            'result': result,
-            'analysis': self.get_test_analysis(result.id)
-        } for result in results]
+        if not history:
+            return []
+
+        test = self._repository.get(test_id)
+        analyzer = self._analyzer_factory.get_analyzer(test) if test else None
+        key = (type(analyzer).__name__, analyzer.VERSION) if analyzer else None
+
+        entries = []
+        for result, analyses in history:
+            analysis = None
+            if analyzer:
+                analysis = analyses.get(key)
+                if analysis is None:
+                    analysis = self._analyze_and_store(analyzer, result)
+            entries.append({
+                'result': result,
+                'analysis': analysis
+            })
+        return entries
+
+    def _analyze_and_store(self, analyzer, result) -> Optional[Dict]:
+        """Run an analyzer on a stored result and keep its output"""
+        analysis = analyzer.analyze(
+            athlete_id=result.athlete_id,
+            test_date=result.test_date,
+            primary_value=result.value,
+            additional_values=result.additional_values
+        )
+        if analysis is not None:
+            self._repository.save_analysis(result.id, {
+                "analyzer_type": type(analyzer).__name__,
+                "analyzer_version": analyzer.VERSION,
+                "payload": analysis
+            })
+        return analysis
 
     def validate_test_input(self,
                           test_id: UUID,
@@ -79,21 +162,32 @@ class TestManagementService:
     async def analyze_test_batch(self,
                               athlete_id: UUID,
                               test_results: List[Dict]) -> List[Dict]:
-        """Analyze multiple test results in parallel"""
-        analyses = []
-        for result in test_results:
-            analysis = await self._analyze_single_result(
-                athlete_id=athlete_id,
-                test_id=result['test_id'],
-                primary_value=result['primary_value'],
-                additional_values=result.get('additional_values'),
-                test_date=result.get('test_date')
-            )
-            analyses.append({
+        """
+        Analyze multiple test results concurrently.
+
+        At most max_concurrency items are in flight at once. Results are
+        returned in the same order as test_results.
+        """
+        concurrency = self._max_concurrency
+        if not (self._async_repository_factory and self._analysis_repository_factory):
+            concurrency = 1
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def analyze(result: Dict) -> Dict:
+            async with semaphore:
+                analysis = await self._analyze_single_result(
+                    athlete_id=athlete_id,
+                    test_id=result['test_id'],
+                    primary_value=result['primary_value'],
+                    additional_values=result.get('additional_values'),
+                    test_date=result.get('test_date')
+                )
+            return {
                 'result': result,
                 'analysis': analysis
-            })
-        return analyses
+            }
+
+        return await asyncio.gather(*(analyze(result) for result in test_results))
 
     async def _analyze_single_result(self,
                                   athlete_id: UUID,
@@ -101,11 +195,40 @@ class TestManagementService:
                                   primary_value: float,
                                   additional_values: Optional[Dict] = None,
                                   test_date: Optional[datetime] = None) -> Dict:
-        """Analyze a single test result asynchronously"""
-        test = await self._repository.get(test_id)
-        analyzer = self._analyzer_factory.get_analyzer(test)
+        """Analyze a single test result, running the analyzer in an executor"""
+        if self._async_repository_factory:
+            async with self._async_repository_factory() as repository:
+                test = await repository.get(test_id)
+        else:
+            test = self._repository.get(test_id)
+        if not test:
+            return None
+
+        def run_analysis():
+            if not self._analysis_repository_factory:
+                return self._run_analyzer(self._analyzer_factory, test, athlete_id,
+                                          test_date, primary_value, additional_values)
+            # Sessions are not thread-safe, so each executor job gets its own
+            with self._analysis_repository_factory() as repository:
+                return self._run_analyzer(TestAnalyzerFactory(repository), test, athlete_id,
+                                          test_date, primary_value, additional_values)
+
+        if not self._analysis_repository_factory:
+            return run_analysis()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, run_analysis)
+
+    @staticmethod
+    def _run_analyzer(analyzer_factory: TestAnalyzerFactory,
+                      test: Test,
+                      athlete_id: UUID,
+                      test_date: Optional[datetime],
+                      primary_value: float,
+                      additional_values: Optional[Dict]) -> Optional[Dict]:
+        analyzer = analyzer_factory.get_analyzer(test)
         if analyzer:
-            return await analyzer.analyze(
+            return analyzer.analyze(
                 athlete_id=athlete_id,
                 test_date=test_date or datetime.utcnow(),
                 primary_value=primary_value,
@@ -187,6 +310,16 @@ class TestManagementService:
 
         return self._repository.save(updated_test)
 
+    def promote_variable(self, test_id: UUID, variable_name: str) -> int:
+        """Store a frequently queried additional variable in a typed, indexed column"""
+        test = self._repository.get(test_id)
+        if not test:
+            raise ValueError(f"Test not found: {test_id}")
+        if not any(var.name == variable_name for var in test.additional_variables):
+            raise ValueError(f"Unknown variable for {test.name}: {variable_name}")
+
+        return self._repository.promote_variable(test_id, variable_name)
+
     # Test Results and Analysis
     def record_test_result(self,
                           test_id: UUID,
@@ -246,6 +379,91 @@ class TestManagementService:
             "analysis": analysis_result
         }
 
+    def process_batch_upload(self,
+                           upload_type: str,
+                           data: List[Dict],
+                           metadata: Optional[Dict] = None) -> Dict:
+        """
+        Validate and bulk-save a batch of test results.
+
+        Invalid items are recorded as failed on the batch instead of
+        aborting it. Analysis is not run per item; use analyze_test_batch
+        for that once the results are stored.
+        """
+        if upload_type != 'test_results':
+            raise ValueError(f"Unsupported batch upload type: {upload_type}")
+
+        tests = {}
+        results = []
+        rejected = {}
+        for index, item in enumerate(data):
+            try:
+                test_id = UUID(str(item['test_id']))
+                athlete_id = UUID(str(item['athlete_id']))
+                primary_value = float(item['primary_value'])
+                additional_values = item.get('additional_values') or {}
+                test_date = item.get('test_date')
+                if isinstance(test_date, str):
+                    test_date = datetime.fromisoformat(test_date)
+
+                if test_id not in tests:
+                    tests[test_id] = self._repository.get(test_id)
+                test = tests[test_id]
+                if not test:
+                    raise ValueError(f"Test not found: {test_id}")
+
+                if not test.validate_result(primary_value):
+                    raise ValueError(f"Invalid primary value for test: {primary_value}")
+                for name, value in additional_values.items():
+                    if not test.validate_result(value, name):
+                        raise ValueError(f"Invalid value for {name}: {value}")
+                missing = [var.name for var in test.additional_variables
+                           if var.is_required and not var.calculation_formula
+                           and var.name not in additional_values]
+                if missing:
+                    raise ValueError(f"Missing required variables: {', '.join(missing)}")
+
+                derived_values = test.calculate_derived_variables(
+                    primary_value,
+                    additional_values
+                )
+            except KeyError as e:
+                rejected[index] = f"Missing field: {e.args[0]}"
+                continue
+            except (TypeError, ValueError) as e:
+                rejected[index] = str(e)
+                continue
+
+            results.append({
+                "item_index": index,
+                "test_id": test_id,
+                "athlete_id": athlete_id,
+                "test_date": test_date,
+                "values": {
+                    "primary_value": primary_value,
+                    **additional_values,
+                    **derived_values
+                }
+            })
+
+        return self._repository.save_results_bulk(
+            results=results,
+            rejected=rejected,
+            metadata=metadata
+        )
+
+    def get_test(self, test_id: UUID) -> Optional[Test]:
+        """Get a test definition by id"""
+        return self._repository.get(test_id)
+
+    def get_test_by_name(self, name: str) -> Optional[Test]:
+        """Get a test definition by name"""
+        return self._repository.find_by_name(name)
+
+    def get_batch_status(self, batch_id: UUID) -> Optional[Dict]:
+        """Get progress of a batch upload"""
+        return self._repository.get_batch_operation(batch_id)
+
     # Specific Test Analysis Methods
     def analyze_imtp_result(self,
                           athlete_id: UUID,
@@ -258,7 +476,7 @@ class TestManagementService:
         if test_date is None:
             test_date = datetime.now()
 
-        result = IMTPResult(
+        result = IMTPMetrics(
             peak_force=peak_force,
             relative_peak_force=peak_force / (body_mass * 9.81),
             rfd_50=rfd_50,
@@ -269,6 +487,65 @@ class TestManagementService:
 
         return self._imtp_analyzer.analyze_result(result)
 
+    def analyze_imtp_traces(self,
+                            athlete_ids: List[UUID],
+                            traces: List[List[float]],
+                            sample_rate: float,
+                            body_masses: Optional[List[Optional[float]]] = None,
+                            test_date: datetime = None,
+                            test_id: Optional[UUID] = None) -> List[Dict]:
+        """
+        Analyze raw IMTP force-time traces, one per trial, filtered as the
+        test's protocol specifies when test_id is given
+        """
+        return self._imtp_analyzer.analyze_traces(
+            athlete_ids=athlete_ids,
+            traces=traces,
+            sample_rate=sample_rate,
+            body_masses=body_masses,
+            test_date=test_date,
+            signal_filter=self._get_signal_filter(test_id, 'force')
+        )
+
+    def analyze_jump_traces(self,
+                            sample_rate: float,
+                            cmj_traces: List[List[float]],
+                            drop_jump_traces: Optional[List[List[float]]] = None,
+                            drop_heights: Optional[List[float]] = None,
+                            body_mass: Optional[float] = None,
+                            loaded_jump_traces: Optional[List[List[float]]] = None,
+                            added_weights: Optional[List[float]] = None,
+                            test_id: Optional[UUID] = None) -> Dict:
+        """
+        Analyze one athlete's raw CMJ, drop jump and loaded jump traces,
+        filtered as the test's protocol specifies when test_id is given
+        """
+        return self._jump_analyzer.analyze_traces(
+            sample_rate=sample_rate,
+            cmj_traces=cmj_traces,
+            drop_jump_traces=drop_jump_traces,
+            drop_heights=drop_heights,
+            body_mass=body_mass,
+            loaded_jump_traces=loaded_jump_traces,
+            added_weights=added_weights,
+            signal_filter=self._get_signal_filter(test_id, 'force')
+        )
+
+    def analyze_squad_sprints(self,
+                              athlete_ids: List[UUID],
+                              test_date: Optional[datetime] = None) -> Dict:
+        """Sprint profiles for many athletes from their latest timing-gate splits"""
+        return self._sprint_analyzer.analyze_squad(athlete_ids, test_date)
+
+    def _get_signal_filter(self, test_id: Optional[UUID], signal: str) -> Optional[SignalFilter]:
+        """The test protocol's filter for a raw signal, if it sets one"""
+        if test_id is None:
+            return None
+        test = self._repository.get(test_id)
+        if not test:
+            raise ValueError(f"Test not found: {test_id}")
+        return test.protocol.get_signal_filter(signal) if test.protocol else None
+
     # Query Methods
     def get_tests_by_category(self, category: TestCategory) -> List[Test]:
         """Get all tests in a specific category"""
@@ -295,6 +572,15 @@ class TestManagementService:
             time_period=time_period
         )
 
+    def rank_group(self, group_id: UUID, test_ids: List[UUID]) -> Dict:
+        """Rank every member of a group on each test by their latest result"""
+        if self._group_repository is None:
+            raise ValueError("Group rankings need a group repository")
+        if not test_ids:
+            raise ValueError("At least one test is required")
+        comparative_analyzer = ComparativeAnalyzer(self._repository, self._group_repository)
+        return comparative_analyzer.analyze_group(group_id, test_ids)
+
     def analyze_performance_trends(self,
                                  athlete_id: UUID,
                                  test_id: UUID,
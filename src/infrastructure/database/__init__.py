@@ -1,15 +1,131 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
-from contextlib import contextmanager
-from typing import Generator
+import asyncio
+import itertools
+import logging
+import os
+import threading
+import time
+import weakref
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from sqlalchemy.pool import StaticPool
+from contextlib import contextmanager, asynccontextmanager
+from typing import Any, AsyncGenerator, Awaitable, Dict, Generator, List, Optional
 from .models.base import Base
+from .partitions import ResultPartitionManager
+from .pool import InstrumentedQueuePool
+
+logger = logging.getLogger(__name__)
 
 class Database:
-    def __init__(self, url: str):
-        self._engine = create_engine(url)
+    # Seconds an unreachable replica is skipped before it is tried again
+    REPLICA_RETRY_INTERVAL = 30.0
+
+    def __init__(self,
+                 url: str,
+                 replica_urls: Optional[List[str]] = None,
+                 season_start_month: int = 1,
+                 pool_options: Optional[Dict] = None):
+        pool_options = pool_options or {}
+        self._url = url
+        self._pool_options = pool_options
+        self._engine = self._create_engine(url, pool_options)
+        # Event loop -> (async engine, sessionmaker); asyncpg connections
+        # belong to the loop that opened them
+        self._async_engines = weakref.WeakKeyDictionary()
+        self._partitions = ResultPartitionManager(self._engine, season_start_month)
         self._session_factory = sessionmaker(bind=self._engine)
         self._scoped_session = scoped_session(self._session_factory)
 
+        self._replica_engines = [
+            self._create_engine(replica_url, pool_options)
+            for replica_url in replica_urls or []
+        ]
+        self._replica_factories = [sessionmaker(bind=engine) for engine in self._replica_engines]
+        self._replica_cycle = itertools.cycle(range(len(self._replica_factories)))
+        self._replica_down_until: Dict[int, float] = {}
+        self._replica_lock = threading.Lock()
+
+        # Connections inherited from a prefork parent (e.g. gunicorn master)
+        # must not be shared with it; children start with empty pools
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._dispose_after_fork)
+
+    @staticmethod
+    def _create_engine(url: str, pool_options: Dict):
+        """
+        Engine for a PostgreSQL or SQLite URL.
+
+        SQLite (a file or sqlite:// in memory) is meant for benchmarks and
+        single-machine use at venues: pool options do not apply, an in-memory
+        database is shared through one connection, and foreign keys are
+        enforced so ON DELETE CASCADE behaves as on PostgreSQL.
+        """
+        parsed = make_url(url)
+        if parsed.get_backend_name() != 'sqlite':
+            return create_engine(url, poolclass=InstrumentedQueuePool, **pool_options)
+
+        options = {'connect_args': {'check_same_thread': False}}
+        if parsed.database in (None, '', ':memory:'):
+            options['poolclass'] = StaticPool
+        engine = create_engine(url, **options)
+
+        @event.listens_for(engine, 'connect')
+        def enable_foreign_keys(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA foreign_keys=ON')
+            cursor.close()
+
+        return engine
+
+    @property
+    def is_postgresql(self) -> bool:
+        return self._engine.dialect.name == 'postgresql'
+
+    def _dispose_after_fork(self) -> None:
+        """Drop inherited pooled connections without closing the parent's sockets"""
+        self._scoped_session.registry.clear()
+        self._async_engines.clear()
+        for engine in [self._engine, *self._replica_engines]:
+            engine.dispose(close=False)
+
+    def pool_statistics(self) -> Dict:
+        """Live pool usage of the primary and each replica"""
+        return {
+            "pid": os.getpid(),
+            "primary": self._pool_statistics(self._engine),
+            "replicas": [self._pool_statistics(engine) for engine in self._replica_engines]
+        }
+
+    @staticmethod
+    def _pool_statistics(engine) -> Optional[Dict]:
+        # Only PostgreSQL engines use the instrumented pool
+        statistics = getattr(engine.pool, 'statistics', None)
+        return statistics() if statistics else None
+
+    def init_app(self, app):
+        """
+        Make each request a single unit of work.
+
+        Repositories only flush; the request's session is committed once after
+        a successful response and rolled back on errors or 4xx/5xx responses.
+        """
+        @app.after_request
+        def commit_session(response):
+            if response.status_code < 400:
+                self._scoped_session.commit()
+            else:
+                self._scoped_session.rollback()
+            return response
+
+        @app.teardown_appcontext
+        def remove_session(exception=None):
+            if exception is not None:
+                self._scoped_session.rollback()
+            self._scoped_session.remove()
+
     def create_database(self):
         """Create all database tables"""
         Base.metadata.create_all(self._engine)
@@ -20,7 +136,13 @@ class Database:
 
     @contextmanager
     def session(self) -> Generator:
-        """Provide a transactional scope around a series of operations."""
+        """
+        Provide a transactional scope around a series of operations.
+
+        Use this as the unit of work for commands and scripts run outside a
+        request: everything done through the yielded session is committed once
+        on exit, or rolled back together if anything raises.
+        """
         session = self._scoped_session()
         try:
             yield session
@@ -29,8 +151,100 @@ class Database:
             session.rollback()
             raise
         finally:
+            self._scoped_session.remove()
+
+    @contextmanager
+    def read_session(self) -> Generator:
+        """
+        Provide a session for read-only work such as analysis queries.
+
+        Sessions are spread over the replicas round-robin; a replica that
+        cannot be reached is skipped for REPLICA_RETRY_INTERVAL seconds, and
+        the primary is used when no replica is available. Nothing done in the
+        session is committed.
+        """
+        session = self._open_read_session()
+        try:
+            yield session
+        finally:
+            session.rollback()
             session.close()
 
+    def _open_read_session(self) -> Session:
+        """Open a session on the next healthy replica, else on the primary"""
+        for _ in range(len(self._replica_factories)):
+            with self._replica_lock:
+                index = next(self._replica_cycle)
+                if self._replica_down_until.get(index, 0.0) > time.monotonic():
+                    continue
+
+            session = self._replica_factories[index]()
+            try:
+                # Check out a connection now so an unreachable replica fails here
+                session.connection()
+                return session
+            except OperationalError as e:
+                session.close()
+                logger.warning(f"Read replica {index} unavailable, skipping: {e}")
+                with self._replica_lock:
+                    self._replica_down_until[index] = time.monotonic() + self.REPLICA_RETRY_INTERVAL
+
+        return self._session_factory()
+
+    @asynccontextmanager
+    async def async_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Provide an asyncio session for concurrent reads.
+
+        Each concurrent task needs its own session. An async engine is
+        created on first use in each event loop, since its connections
+        cannot be used from another loop; run_async() disposes it when the
+        loop's work is done.
+        """
+        async with self._async_session_factory()() as session:
+            yield session
+
+    def _async_session_factory(self) -> async_sessionmaker:
+        """Session factory on the running event loop's own async engine"""
+        loop = asyncio.get_running_loop()
+        entry = self._async_engines.get(loop)
+        if entry is None:
+            url = make_url(self._url)
+            options = self._pool_options
+            if url.drivername in ('postgresql', 'postgresql+psycopg2'):
+                url = url.set(drivername='postgresql+asyncpg')
+            elif url.drivername in ('sqlite', 'sqlite+pysqlite'):
+                url = url.set(drivername='sqlite+aiosqlite')
+                options = {}
+            engine = create_async_engine(url, **options)
+            entry = (engine, async_sessionmaker(engine, expire_on_commit=False))
+            self._async_engines[loop] = entry
+        return entry[1]
+
+    async def dispose_async_engine(self) -> None:
+        """Close the running event loop's async engine and its connections"""
+        entry = self._async_engines.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].dispose()
+
+    def run_async(self, coroutine: Awaitable) -> Any:
+        """
+        Run a coroutine to completion from synchronous code.
+
+        Each call gets a new event loop, and the async engine opened in it
+        is disposed before the loop closes.
+        """
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await self.dispose_async_engine()
+        return asyncio.run(run())
+
+    @property
+    def partitions(self) -> ResultPartitionManager:
+        return self._partitions
+
     @property
     def session_factory(self):
         return self._scoped_session
\ No newline at end of file
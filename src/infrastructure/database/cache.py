@@ -0,0 +1,260 @@
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from domain.athlete.entity.value_objects import AgeGroup
+from domain.testing.entity.test import Test
+from domain.testing.service.analysis.common.metrics import NormativeDistribution
+from .models.athlete import Athlete
+from .models.cache_version import CacheVersion
+from .models.test import NormativeData, TestResultSummary
+
+class TestDefinitionCache:
+    """
+    In-process cache of test definitions keyed by id and name.
+
+    Writes in this process invalidate entries directly. Writes in other
+    workers bump the 'test_definitions' row in cache_versions; each process
+    compares that counter at most once per check_interval seconds and drops
+    its entries when it has moved, so most reads cost no query at all.
+    """
+
+    VERSION_NAME = 'test_definitions'
+
+    def __init__(self, check_interval: float = 1.0):
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._by_id: Dict[UUID, Test] = {}
+        self._id_by_name: Dict[str, UUID] = {}
+        self._promoted_by_id: Dict[UUID, Dict[str, int]] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+
+    def sync(self, session: Session) -> None:
+        """Drop cached entries if another worker changed definitions"""
+        if self._needs_check():
+            self._apply_version(session.execute(self._version_query()).scalar() or 0)
+
+    async def sync_async(self, session: AsyncSession) -> None:
+        """sync() for repositories on an asyncio session"""
+        if self._needs_check():
+            self._apply_version((await session.execute(self._version_query())).scalar() or 0)
+
+    def _needs_check(self) -> bool:
+        return time.monotonic() - self._checked_at >= self._check_interval
+
+    def _version_query(self):
+        return select(CacheVersion.version).where(CacheVersion.name == self.VERSION_NAME)
+
+    def _apply_version(self, version: int) -> None:
+        with self._lock:
+            if version != self._version:
+                self._by_id.clear()
+                self._id_by_name.clear()
+                self._promoted_by_id.clear()
+                self._version = version
+            self._checked_at = time.monotonic()
+
+    def get(self, id: UUID) -> Optional[Test]:
+        return self._by_id.get(id)
+
+    def find_by_name(self, name: str) -> Optional[Test]:
+        id = self._id_by_name.get(name)
+        return self._by_id.get(id) if id else None
+
+    def put(self, test: Test) -> None:
+        with self._lock:
+            self._by_id[test.id] = test
+            self._id_by_name[test.name] = test.id
+
+    def get_promoted(self, id: UUID) -> Optional[Dict[str, int]]:
+        """Promoted variable name -> metric slot mapping of a test"""
+        return self._promoted_by_id.get(id)
+
+    def put_promoted(self, id: UUID, promoted: Dict[str, int]) -> None:
+        with self._lock:
+            self._promoted_by_id[id] = promoted
+
+    def invalidate(self, id: UUID) -> None:
+        with self._lock:
+            self._promoted_by_id.pop(id, None)
+            test = self._by_id.pop(id, None)
+            if test:
+                self._id_by_name.pop(test.name, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_id.clear()
+            self._id_by_name.clear()
+            self._promoted_by_id.clear()
+            self._checked_at = 0.0
+
+    def bump_version(self, session: Session) -> None:
+        """Signal other workers; committed with the caller's transaction"""
+        bumped = session.execute(
+            update(CacheVersion)
+            .where(CacheVersion.name == self.VERSION_NAME)
+            .values(version=CacheVersion.version + 1)
+        )
+        if not bumped.rowcount:
+            session.add(CacheVersion(name=self.VERSION_NAME, version=1))
+            session.flush()
+
+# (sport, gender, age group name)
+CohortKey = Tuple[str, str, str]
+
+def normative_subcategory(gender: str, age_group: str) -> str:
+    """NormativeData.subcategory for a cohort; category holds the sport"""
+    return f"{gender} {age_group}"
+
+class _TestNorms:
+    """Distributions of one test, plus each athlete's current contribution"""
+
+    def __init__(self):
+        self.distributions: Dict[CohortKey, NormativeDistribution] = {}
+        self.athletes: Dict[UUID, Tuple[CohortKey, float]] = {}
+        self.references: Dict[CohortKey, Tuple[List[float], List[float]]] = {}
+        self.watermark = None
+        self.loaded_at = time.monotonic()
+        self.checked_at = self.loaded_at
+
+class NormativeDistributionCache:
+    """
+    In-process sorted distributions per (test, sport, gender, age group).
+
+    Samples are each athlete's latest value from test_result_summaries, in
+    the age group they were in on that test date, plus NormativeData rows
+    without a percentile. NormativeData rows with a percentile form the
+    published curve used for cohorts with too few samples.
+
+    After check_interval seconds a lookup folds in summaries updated since
+    the last refresh, so new results from any worker are picked up without
+    a full reload. Each test is reloaded from scratch after max_age seconds.
+    """
+
+    # now() is the transaction start time, so refreshes re-read a margin
+    # to catch rows committed by transactions that began before the last one
+    REFRESH_OVERLAP = timedelta(minutes=5)
+
+    def __init__(self, check_interval: float = 5.0, max_age: float = 900.0, min_samples: int = 20):
+        self._check_interval = check_interval
+        self._max_age = max_age
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+        self._tests: Dict[UUID, _TestNorms] = {}
+
+    def get(self,
+            session: Session,
+            test_id: UUID,
+            sport: str,
+            gender: str,
+            age_group: str) -> NormativeDistribution:
+        """Distribution for one cohort, empty if nobody has been tested"""
+        norms = self._norms(session, test_id)
+        key = (sport, gender, age_group)
+        with self._lock:
+            distribution = norms.distributions.get(key)
+            if distribution is None:
+                distribution = norms.distributions[key] = self._distribution(norms, key)
+        return distribution
+
+    def invalidate(self, test_id: UUID) -> None:
+        with self._lock:
+            self._tests.pop(test_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tests.clear()
+
+    def _norms(self, session: Session, test_id: UUID) -> _TestNorms:
+        now = time.monotonic()
+        norms = self._tests.get(test_id)
+        if norms is None or now - norms.loaded_at >= self._max_age:
+            norms = self._load(session, test_id)
+            with self._lock:
+                self._tests[test_id] = norms
+        elif now - norms.checked_at >= self._check_interval:
+            self._refresh(session, norms, test_id)
+        return norms
+
+    def _load(self, session: Session, test_id: UUID) -> _TestNorms:
+        norms = _TestNorms()
+        norms.watermark = session.execute(select(func.now())).scalar()
+
+        samples: Dict[CohortKey, List[float]] = {}
+        for row in session.execute(self._summary_query(test_id)):
+            key = self._cohort(row)
+            norms.athletes[row.athlete_id] = (key, row.latest_value)
+            samples.setdefault(key, []).append(row.latest_value)
+
+        for row in session.execute(
+            select(NormativeData.category, NormativeData.subcategory,
+                   NormativeData.value, NormativeData.percentile)
+            .where(NormativeData.test_definition_id == test_id)
+        ):
+            gender, _, age_group = row.subcategory.rpartition(' ')
+            key = (row.category, gender, age_group)
+            if row.percentile is None:
+                samples.setdefault(key, []).append(row.value)
+            else:
+                values, percentiles = norms.references.setdefault(key, ([], []))
+                values.append(row.value)
+                percentiles.append(row.percentile)
+
+        for key in samples.keys() | norms.references.keys():
+            norms.distributions[key] = self._distribution(norms, key, samples.get(key))
+        return norms
+
+    def _refresh(self, session: Session, norms: _TestNorms, test_id: UUID) -> None:
+        watermark = session.execute(select(func.now())).scalar()
+        rows = session.execute(
+            self._summary_query(test_id)
+            .where(TestResultSummary.updated_at >= norms.watermark - self.REFRESH_OVERLAP)
+        ).all()
+
+        with self._lock:
+            for row in rows:
+                key = self._cohort(row)
+                previous = norms.athletes.get(row.athlete_id)
+                if previous == (key, row.latest_value):
+                    continue
+                if previous:
+                    norms.distributions[previous[0]].remove(previous[1])
+                distribution = norms.distributions.get(key)
+                if distribution is None:
+                    distribution = norms.distributions[key] = self._distribution(norms, key)
+                distribution.add(row.latest_value)
+                norms.athletes[row.athlete_id] = (key, row.latest_value)
+            norms.watermark = watermark
+            norms.checked_at = time.monotonic()
+
+    def _distribution(self, norms: _TestNorms, key: CohortKey,
+                      samples: Optional[List[float]] = None) -> NormativeDistribution:
+        return NormativeDistribution(samples, norms.references.get(key), self._min_samples)
+
+    @staticmethod
+    def _summary_query(test_id: UUID):
+        return select(
+            TestResultSummary.athlete_id,
+            TestResultSummary.latest_value,
+            TestResultSummary.latest_test_date,
+            Athlete.sport,
+            Athlete.gender,
+            Athlete.birthdate
+        ).join(Athlete, Athlete.id == TestResultSummary.athlete_id)\
+            .where(TestResultSummary.test_definition_id == test_id)
+
+    @staticmethod
+    def _cohort(row) -> CohortKey:
+        tested_on = row.latest_test_date.date() if hasattr(row.latest_test_date, 'date') else row.latest_test_date
+        born = row.birthdate
+        age = tested_on.year - born.year - ((tested_on.month, tested_on.day) < (born.month, born.day))
+        return (row.sport, row.gender, AgeGroup.for_age(age).name)
+
+# Shared by every repository instance in this process
+test_definition_cache = TestDefinitionCache()
+normative_distribution_cache = NormativeDistributionCache()
\ No newline at end of file
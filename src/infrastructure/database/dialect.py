@@ -0,0 +1,25 @@
+from sqlalchemy import case
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+# Helpers for the few statements PostgreSQL and SQLite spell differently
+
+def dialect_name(session: Session) -> str:
+    return session.get_bind().dialect.name
+
+def is_postgresql(session: Session) -> bool:
+    return dialect_name(session) == 'postgresql'
+
+def upsert(session: Session, table):
+    """INSERT with on_conflict_do_update / on_conflict_do_nothing for the session's backend"""
+    if dialect_name(session) == 'sqlite':
+        return sqlite.insert(table)
+    return postgresql.insert(table)
+
+def least(a, b):
+    """Smaller of two non-null expressions (LEAST is not available on SQLite)"""
+    return case((a <= b, a), else_=b)
+
+def greatest(a, b):
+    """Larger of two non-null expressions (GREATEST is not available on SQLite)"""
+    return case((a >= b, a), else_=b)
\ No newline at end of file
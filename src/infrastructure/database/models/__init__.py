@@ -1,9 +1,11 @@
 from .base import Base, BaseModel
 from .group import Group, AthleteGroup
-from .test import TestDefinition, TestResult, TestAnalysis
+from .test import TestDefinition, TestResult, TestResultSummary, TestAnalysis, TestSignal
 from .anthropometric import AnthropometricData
 from .athlete import Athlete
-from .batch import BatchOperation
+from .batch import BatchOperation, BatchResult
+from .cache_version import CacheVersion
+from .leaderboard import LeaderboardEntry
 from src.interfaces.web import db
 
 # Import indexes after all models are defined
@@ -17,9 +19,14 @@ __all__ = [
     'AthleteGroup',
     'TestDefinition',
     'TestResult',
+    'TestResultSummary',
     'TestAnalysis',
+    'TestSignal',
     'AnthropometricData',
     'BatchOperation',
+    'BatchResult',
+    'CacheVersion',
+    'LeaderboardEntry',
     'create_indexes'
 ]
 
@@ -30,4 +37,4 @@ def create_db_indexes(target, connection, **kw):
     """Create all indexes after database creation"""
     indexes = create_indexes()
     for index in indexes:
-        index.create(connection)
\ No newline at end of file
+        index.create(connection, checkfirst=True)
\ No newline at end of file
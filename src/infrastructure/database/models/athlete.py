@@ -1,22 +1,26 @@
 from datetime import date
 import uuid
 from src.interfaces.web import db  # Import SQLAlchemy instance
-from sqlalchemy import Column, String, Date, Boolean, Enum
+from sqlalchemy import Column, String, Date, DateTime, Boolean, Enum, func
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID as pgUUID
-from ....domain.athlete.value_objects import Gender
+from .base import GUID
+from ....domain.athlete.entity.value_objects import AgeGroup, Gender
 
 class Athlete(db.Model):
     __tablename__ = 'athletes'
     
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
     birthdate = Column(Date, nullable=False)
     gender = Column(String, nullable=False)
     sport = Column(String, nullable=False)
     email = Column(String)
+    # Age group name of a custom team assignment, e.g. an athlete playing up
+    custom_team = Column(String)
     is_active = Column(Boolean, default=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     
     test_results = db.relationship("TestResult", back_populates="athlete", lazy="dynamic", cascade="all, delete-orphan")
     anthropometric_data = db.relationship("AnthropometricData", back_populates="athlete", cascade="all, delete-orphan")
@@ -35,24 +39,18 @@ class Athlete(db.Model):
     @property
     def age_group(self) -> str:
         """Calculate age group based on current age"""
-        age = self.age
-        if age <= 12: return 'U12'
-        elif age <= 14: return 'U14'
-        elif age <= 16: return 'U16'
-        elif age <= 18: return 'U18'
-        elif age <= 20: return 'U20'
-        return 'Senior'
+        return AgeGroup.for_age(self.age).name
 
     def to_entity(self) -> 'AthleteEntity':
         """Convert DB model to domain entity"""
         from ....domain.athlete.entity.athlete import Athlete as AthleteEntity
-        from ....domain.athlete.value_objects import Name, EmailAddress
+        from ....domain.athlete.entity.value_objects import Name, EmailAddress
         
         return AthleteEntity(
             id=self.id,
             name=Name(self.first_name, self.last_name),
             birthdate=self.birthdate,
-            gender=self.gender,
+            gender=Gender(self.gender),
             sport=self.sport,
             email=EmailAddress(self.email) if self.email else None,
             custom_team=self.custom_team
@@ -66,7 +64,7 @@ class Athlete(db.Model):
             first_name=athlete.name.first_name,
             last_name=athlete.name.last_name,
             birthdate=athlete.birthdate,
-            gender=athlete.gender,
+            gender=Gender(athlete.gender).value,
             sport=athlete.sport,
             email=athlete.email.value if athlete.email else None,
             custom_team=athlete.custom_team,
@@ -1,7 +1,6 @@
 from sqlalchemy import Column, String, JSON, Integer, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, GUID
 
 class BatchOperation(BaseModel):
     """Tracks batch operations like bulk uploads"""
@@ -21,10 +20,10 @@ class BatchResult(BaseModel):
     """Individual results from batch operations"""
     __tablename__ = 'batch_results'
     
-    batch_operation_id = Column(UUID(as_uuid=True), ForeignKey('batch_operations.id'), nullable=False)
+    batch_operation_id = Column(GUID(as_uuid=True), ForeignKey('batch_operations.id'), nullable=False)
     item_index = Column(Integer, nullable=False)  # Position in original batch
     status = Column(String, nullable=False)  # 'success', 'failed'
     error_message = Column(String)
-    result_id = Column(UUID(as_uuid=True))  # ID of created/updated record
+    result_id = Column(GUID(as_uuid=True))  # ID of created/updated record
     
     batch_operation = relationship("BatchOperation", back_populates="results")
\ No newline at end of file
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, Integer
+from src.interfaces.web import db
+
+class CacheVersion(db.Model):
+    """Version counters that let every worker detect changes to cached data"""
+    __tablename__ = 'cache_versions'
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
\ No newline at end of file
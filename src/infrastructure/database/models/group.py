@@ -1,21 +1,22 @@
 from uuid import UUID
-from sqlalchemy import Column, String, JSON, ForeignKey, Boolean, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID as pgUUID
+from sqlalchemy import Column, String, JSON, ForeignKey, Boolean, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, GUID
 from src.interfaces.web import db
 import uuid
-from sqlalchemy.dialects.postgresql import UUID as pgUUID
 
 class Group(db.Model):
     __tablename__ = 'groups'
     
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
     type = Column(String, nullable=False)  # 'natural', 'custom'
     sport = Column(String, nullable=False)
     gender = Column(String, nullable=False)
     age_range = Column(JSON)  # {"min": 14, "max": 16} for age groups
+    # Integer copies of age_range so natural group lookups can use an index
+    min_age = Column(Integer)
+    max_age = Column(Integer)
     is_custom = Column(Boolean, default=False)
     group_metadata = Column(JSON)  # Changed from metadata to group_metadata
 
@@ -27,12 +28,27 @@ class Group(db.Model):
         UniqueConstraint('sport', 'gender', 'name', name='unq_group_sport_gender_name'),
     )
 
+    def to_entity(self) -> 'GroupEntity':
+        """Convert DB model to domain entity"""
+        from ....domain.groups.entity.group import Group as GroupEntity
+
+        return GroupEntity(
+            id=self.id,
+            name=self.name,
+            type=self.type,
+            sport=self.sport,
+            gender=self.gender,
+            min_age=self.min_age,
+            max_age=self.max_age,
+            is_custom=bool(self.is_custom)
+        )
+
 class AthleteGroup(db.Model):
     __tablename__ = 'athlete_groups'
 
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    athlete_id = Column(pgUUID(as_uuid=True), ForeignKey('athletes.id', ondelete='CASCADE'), nullable=False)
-    group_id = Column(pgUUID(as_uuid=True), ForeignKey('groups.id', ondelete='CASCADE'), nullable=False)
+    id = Column(GUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    athlete_id = Column(GUID(as_uuid=True), ForeignKey('athletes.id', ondelete='CASCADE'), nullable=False)
+    group_id = Column(GUID(as_uuid=True), ForeignKey('groups.id', ondelete='CASCADE'), nullable=False)
     is_primary = Column(Boolean, default=True)
     
     __table_args__ = (
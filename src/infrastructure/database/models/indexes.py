@@ -1,17 +1,32 @@
+from functools import lru_cache
 from sqlalchemy import Index
 from .test import TestResult
 from .batch import BatchOperation
 from .athlete import Athlete
 from .group import Group
 
+@lru_cache(maxsize=None)
 def create_indexes():
-    """Create all database indexes"""
+    """
+    Create all database indexes.
+
+    Built once: each Index attaches itself to its table, so building them
+    again would make later create_all calls emit every index twice.
+    """
     return [
         # Test Results indexes
         Index('idx_test_results_date', TestResult.test_date.desc()),
         Index('idx_test_results_athlete_test', 
               TestResult.athlete_id, 
-              TestResult.test_definition_id),
+              TestResult.test_definition_id,
+              TestResult.test_date.desc()),
+        Index('idx_test_results_additional_values',
+              TestResult.additional_values,
+              postgresql_using='gin'),
+        *[Index(f'idx_test_results_test_metric_{slot}',
+                TestResult.test_definition_id,
+                getattr(TestResult, f'metric_{slot}'))
+          for slot in range(1, TestResult.PROMOTED_SLOTS + 1)],
         
         # Batch Operations indexes
         Index('idx_batch_operations_status', BatchOperation.status),
@@ -20,9 +35,16 @@ def create_indexes():
         Index('idx_athlete_sport', Athlete.sport),
         Index('idx_athlete_birthdate', Athlete.birthdate),
         Index('idx_athlete_name', Athlete.last_name, Athlete.first_name),
+        Index('idx_athlete_custom_team', Athlete.custom_team),
         
         # Group indexes
         Index('idx_group_type', Group.type),
-        Index('idx_group_sport_gender', Group.sport, Group.gender)
+        Index('idx_group_sport_gender', Group.sport, Group.gender),
+        Index('idx_group_natural_age',
+              Group.sport,
+              Group.gender,
+              Group.min_age,
+              Group.max_age,
+              postgresql_where=Group.is_custom == False)
         
     ]
\ No newline at end of file
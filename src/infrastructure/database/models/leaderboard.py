@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Float, DateTime, ForeignKey, Index, func
+from .base import GUID
+from src.interfaces.web import db
+
+class LeaderboardEntry(db.Model):
+    """
+    A group member's standing on one test.
+
+    Copied from test_result_summaries for every group the athlete belongs
+    to, so boards are answered from the (group, test, value) indexes.
+    """
+    __tablename__ = 'leaderboard_entries'
+    __table_args__ = (
+        Index('idx_leaderboard_max', 'group_id', 'test_definition_id', 'max_value', 'athlete_id'),
+        Index('idx_leaderboard_min', 'group_id', 'test_definition_id', 'min_value', 'athlete_id'),
+        Index('idx_leaderboard_latest', 'group_id', 'test_definition_id', 'latest_value', 'athlete_id'),
+    )
+
+    group_id = Column(GUID(as_uuid=True), ForeignKey('groups.id', ondelete='CASCADE'), primary_key=True)
+    test_definition_id = Column(GUID(as_uuid=True), ForeignKey('test_definitions.id', ondelete='CASCADE'), primary_key=True)
+    athlete_id = Column(GUID(as_uuid=True), ForeignKey('athletes.id', ondelete='CASCADE'), primary_key=True)
+    max_value = Column(Float, nullable=False)
+    min_value = Column(Float, nullable=False)
+    latest_value = Column(Float, nullable=False)
+    latest_test_date = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+    def to_dict(self) -> dict:
+        return {
+            "athlete_id": self.athlete_id,
+            "max": self.max_value,
+            "min": self.min_value,
+            "latest_value": self.latest_value,
+            "latest_test_date": self.latest_test_date
+        }
\ No newline at end of file
@@ -1,24 +1,29 @@
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy import Column, String, JSON, ForeignKey, Float, DateTime, Boolean
+from sqlalchemy import Column, String, JSON, ForeignKey, Float, DateTime, Boolean, Integer, DDL, UniqueConstraint, event, func
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID as pgUUID
-from ....domain.testing.entity.test import Test, TestCategory, TestResult
+from sqlalchemy.dialects.postgresql import JSONB
+from ....domain.testing.entity.test import Test, TestCategory, TestResult as TestResultEntity
 from ....domain.testing.entity.value_objects import TestUnit, TestProtocol, AdditionalVariable
-from .base import BaseModel
+from .base import BaseModel, GUID
 from src.interfaces.web import db
 import uuid
 
+# JSONB on Postgres (GIN-indexable, binary), plain JSON elsewhere
+JSONVariant = JSON().with_variant(JSONB(), 'postgresql')
+
 class TestDefinition(db.Model):
     __tablename__ = 'test_definitions'
     
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False, unique=True)
     category = Column(String, nullable=False)
     primary_unit = Column(String, nullable=False)
     description = Column(String)
     required_fields = Column(JSON, nullable=False)
     optional_fields = Column(JSON)
+    # Additional variable name -> TestResult metric slot (1..PROMOTED_SLOTS)
+    promoted_variables = Column(JSON)
     is_active = Column(Boolean, default=True)
 
     test_results = db.relationship("TestResult", back_populates="test_definition")
@@ -34,14 +39,15 @@ class TestDefinition(db.Model):
             ]
 
         protocol = None
-        if self.required_fields and 'protocol' in self.required_fields:
+        if self.required_fields and self.required_fields.get('protocol'):
             protocol = TestProtocol(**self.required_fields['protocol'])
 
         return Test(
             id=self.id,
             name=self.name,
             category=TestCategory[self.category.upper()],
-            primary_unit=TestUnit[self.primary_unit.upper()],
+            # from_entity stores the unit's value, e.g. 'sec'
+            primary_unit=TestUnit(self.primary_unit),
             description=self.description,
             protocol=protocol,
             additional_variables=additional_vars
@@ -57,7 +63,7 @@ class TestDefinition(db.Model):
             primary_unit=entity.primary_unit.value,
             description=entity.description,
             required_fields={
-                'protocol': entity.protocol.__dict__ if entity.protocol else {},
+                'protocol': entity.protocol.to_dict() if entity.protocol else {},
                 'unit': entity.primary_unit.value
             },
             optional_fields={
@@ -67,23 +73,40 @@ class TestDefinition(db.Model):
 
 class TestResult(db.Model):
     __tablename__ = 'test_results'
+    # Range-partitioned by season on test_date, so the partition key is part
+    # of the primary key (see infrastructure/database/partitions.py)
+    __table_args__ = {'postgresql_partition_by': 'RANGE (test_date)'}
     
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    test_definition_id = Column(pgUUID(as_uuid=True), ForeignKey('test_definitions.id'), nullable=False)
-    athlete_id = Column(pgUUID(as_uuid=True), ForeignKey('athletes.id'), nullable=False)
-    test_date = Column(DateTime, nullable=False)
+    id = Column(GUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    test_definition_id = Column(GUID(as_uuid=True), ForeignKey('test_definitions.id'), nullable=False)
+    athlete_id = Column(GUID(as_uuid=True), ForeignKey('athletes.id'), nullable=False)
+    test_date = Column(DateTime, primary_key=True, nullable=False)
     primary_value = Column(Float, nullable=False)
-    additional_values = Column(JSON)
-    conditions = Column(JSON)
+    additional_values = Column(JSONVariant)
+    conditions = Column(JSONVariant)
     validated = Column(Boolean, default=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+    # Typed copies of frequently queried additional values; which variable a
+    # slot holds is configured per test in TestDefinition.promoted_variables
+    PROMOTED_SLOTS = 4
+    metric_1 = Column(Float)
+    metric_2 = Column(Float)
+    metric_3 = Column(Float)
+    metric_4 = Column(Float)
 
     test_definition = db.relationship("TestDefinition", back_populates="test_results")
     athlete = db.relationship("Athlete", back_populates="test_results")
-    analysis_results = db.relationship("TestAnalysis", back_populates="test_result")
+    analysis_results = db.relationship(
+        "TestAnalysis",
+        primaryjoin="TestResult.id == foreign(TestAnalysis.test_result_id)",
+        back_populates="test_result"
+    )
 
-    def to_entity(self) -> TestResult:
+    def to_entity(self) -> TestResultEntity:
         """Convert database model to domain entity"""
-        return TestResult(
+        return TestResultEntity(
             id=self.id,
             athlete_id=self.athlete_id,
             test_id=self.test_definition_id,
@@ -94,7 +117,7 @@ class TestResult(db.Model):
         )
 
     @classmethod
-    def from_entity(cls, entity: TestResult) -> 'TestResult':
+    def from_entity(cls, entity: TestResultEntity) -> 'TestResult':
         """Create database model from domain entity"""
         return cls(
             id=entity.id,
@@ -106,24 +129,108 @@ class TestResult(db.Model):
             conditions={'phase': entity.phase} if entity.phase else {}
         )
 
+# Catch-all partition so inserts succeed before a season partition exists
+event.listen(
+    TestResult.__table__,
+    'after_create',
+    DDL("CREATE TABLE test_results_default PARTITION OF test_results DEFAULT")
+    .execute_if(dialect='postgresql')
+)
+
+class TestResultSummary(db.Model):
+    """Per athlete/test rollup of test_results, maintained on every write"""
+    __tablename__ = 'test_result_summaries'
+
+    athlete_id = Column(GUID(as_uuid=True), ForeignKey('athletes.id', ondelete='CASCADE'), primary_key=True)
+    test_definition_id = Column(GUID(as_uuid=True), ForeignKey('test_definitions.id', ondelete='CASCADE'), primary_key=True)
+    result_count = Column(Integer, nullable=False)
+    value_sum = Column(Float, nullable=False)
+    min_value = Column(Float, nullable=False)
+    max_value = Column(Float, nullable=False)
+    latest_value = Column(Float, nullable=False)
+    first_test_date = Column(DateTime, nullable=False)
+    latest_test_date = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+    def to_dict(self) -> dict:
+        return {
+            "athlete_id": self.athlete_id,
+            "test_id": self.test_definition_id,
+            "count": self.result_count,
+            "mean": self.value_sum / self.result_count,
+            "min": self.min_value,
+            "max": self.max_value,
+            "latest_value": self.latest_value,
+            "first_test_date": self.first_test_date,
+            "latest_test_date": self.latest_test_date
+        }
+
 # Keep TestAnalysis and NormativeData classes as they are - they don't need conversion methods
 class TestAnalysis(db.Model):
+    """Stored analyzer output, reused until the athlete's history or the analyzer changes"""
     __tablename__ = 'test_analyses'
+    __table_args__ = (
+        UniqueConstraint('test_result_id', 'analyzer_type', 'analyzer_version',
+                         name='uq_test_analyses_result_analyzer'),
+    )
     
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    test_result_id = Column(pgUUID(as_uuid=True), ForeignKey('test_results.id'), nullable=False)
+    id = Column(GUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # No foreign key: test_results.id is only unique together with the
+    # partition key, so the reference is kept by the relationship alone
+    test_result_id = Column(GUID(as_uuid=True), nullable=False, index=True)
     analyzer_type = Column(String, nullable=False)
+    analyzer_version = Column(Integer, nullable=False, default=1, server_default='1')
     metrics = Column(JSON, nullable=False)
     interpretation = Column(JSON)
     recommendations = Column(JSON)
+    payload = Column(JSONVariant)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     
-    test_result = db.relationship("TestResult", back_populates="analysis_results")
+    test_result = db.relationship(
+        "TestResult",
+        primaryjoin="foreign(TestAnalysis.test_result_id) == TestResult.id",
+        back_populates="analysis_results"
+    )
+
+class TestSignal(db.Model):
+    """
+    A raw trace (force, velocity, ...) recorded with a test result.
+
+    Only metadata lives here; samples are in the signal store on disk, so
+    queries on results and signals never read sample bytes.
+    """
+    __tablename__ = 'test_signals'
+    __table_args__ = (
+        UniqueConstraint('test_result_id', 'name', name='uq_test_signals_result_name'),
+    )
+
+    id = Column(GUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # No foreign key, for the same reason as TestAnalysis.test_result_id
+    test_result_id = Column(GUID(as_uuid=True), nullable=False, index=True)
+    name = Column(String, nullable=False)
+    sample_rate = Column(Float, nullable=False)
+    sample_count = Column(Integer, nullable=False)
+    storage_key = Column(String, nullable=False)
+    byte_size = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    def to_dict(self) -> dict:
+        return {
+            "test_result_id": self.test_result_id,
+            "name": self.name,
+            "sample_rate": self.sample_rate,
+            "sample_count": self.sample_count,
+            "duration": self.sample_count / self.sample_rate,
+            "byte_size": self.byte_size,
+            "created_at": self.created_at
+        }
 
 class NormativeData(db.Model):
     __tablename__ = 'normative_data'
     
-    id = Column(pgUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    test_definition_id = Column(pgUUID(as_uuid=True), ForeignKey('test_definitions.id'), nullable=False)
+    id = Column(GUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    test_definition_id = Column(GUID(as_uuid=True), ForeignKey('test_definitions.id'), nullable=False)
     category = Column(String, nullable=False)
     subcategory = Column(String, nullable=False)
     value = Column(Float, nullable=False)
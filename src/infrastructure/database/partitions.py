@@ -0,0 +1,120 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+class ResultPartitionManager:
+    """
+    Manages season range partitions of the test_results table.
+
+    A season starts on the first day of season_start_month; season 2025 with
+    a start month of 8 covers 2025-08-01 up to 2026-08-01. Rows outside every
+    season partition land in test_results_default until their season's
+    partition is created, at which point they are moved across.
+
+    Nothing creates partitions from the insert path. init_database creates
+    them through next season; after that, `python -m
+    scripts.manage_partitions ensure` has to run ahead of each season,
+    e.g. monthly from cron, or new results pile up in the default
+    partition.
+    """
+
+    TABLE = 'test_results'
+    DEFAULT_PARTITION = 'test_results_default'
+
+    def __init__(self, engine: Engine, season_start_month: int = 1):
+        self._engine = engine
+        self._season_start_month = season_start_month
+
+    def season_for(self, moment: datetime) -> int:
+        """Season (by starting year) that a timestamp falls in"""
+        return moment.year if moment.month >= self._season_start_month else moment.year - 1
+
+    def season_bounds(self, season: int) -> Tuple[datetime, datetime]:
+        """Inclusive start and exclusive end of a season"""
+        return (datetime(season, self._season_start_month, 1),
+                datetime(season + 1, self._season_start_month, 1))
+
+    def partition_name(self, season: int) -> str:
+        return f"{self.TABLE}_{season}"
+
+    def existing_partitions(self) -> List[str]:
+        """Names of partitions currently attached to test_results"""
+        with self._engine.connect() as connection:
+            rows = connection.execute(text("""
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON pg_inherits.inhparent = parent.oid
+                JOIN pg_class child ON pg_inherits.inhrelid = child.oid
+                WHERE parent.relname = :table
+                ORDER BY child.relname
+            """), {"table": self.TABLE})
+            return [row[0] for row in rows]
+
+    def ensure_partitions(self, through: Optional[datetime] = None, ahead: int = 1) -> List[str]:
+        """
+        Create missing season partitions up to `ahead` seasons past `through`
+        (default now). Returns the names of partitions created.
+        """
+        last_season = self.season_for(through or datetime.utcnow()) + ahead
+        existing = set(self.existing_partitions())
+        seasons = [int(name.rsplit('_', 1)[1]) for name in existing
+                   if name != self.DEFAULT_PARTITION and name.rsplit('_', 1)[1].isdigit()]
+        first_season = min(seasons) if seasons else self.season_for(datetime.utcnow())
+
+        created = []
+        for season in range(first_season, last_season + 1):
+            name = self.partition_name(season)
+            if name not in existing:
+                self.create_partition(season)
+                created.append(name)
+        return created
+
+    def create_partition(self, season: int) -> None:
+        """
+        Create one season partition, moving any rows for that season out of
+        the default partition so the new range constraint holds.
+        """
+        start, end = self.season_bounds(season)
+        name = self.partition_name(season)
+        bounds = {"start": start, "end": end}
+        with self._engine.begin() as connection:
+            connection.execute(text(
+                f"ALTER TABLE {self.TABLE} DETACH PARTITION {self.DEFAULT_PARTITION}"
+            ))
+            connection.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {self.TABLE} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            connection.execute(text(f"""
+                WITH moved AS (
+                    DELETE FROM {self.DEFAULT_PARTITION}
+                    WHERE test_date >= :start AND test_date < :end
+                    RETURNING *
+                )
+                INSERT INTO {self.TABLE} SELECT * FROM moved
+            """), bounds)
+            connection.execute(text(
+                f"ALTER TABLE {self.TABLE} ATTACH PARTITION {self.DEFAULT_PARTITION} DEFAULT"
+            ))
+
+    def detach_season(self, season: int) -> str:
+        """
+        Detach a season's partition from test_results. The rows stay in a
+        standalone table of the same name that can be archived or dropped.
+        """
+        name = self.partition_name(season)
+        with self._engine.begin() as connection:
+            connection.execute(text(f"ALTER TABLE {self.TABLE} DETACH PARTITION {name}"))
+        return name
+
+    def attach_season(self, season: int) -> str:
+        """Re-attach a previously detached season partition"""
+        start, end = self.season_bounds(season)
+        name = self.partition_name(season)
+        with self._engine.begin() as connection:
+            connection.execute(text(
+                f"ALTER TABLE {self.TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+        return name
\ No newline at end of file
@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Dict
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+class PoolTelemetry:
+    """Running totals of how long callers waited to get a pooled connection"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_seconds": round(self.total_wait, 6),
+                "mean_wait_seconds": round(self.total_wait / attempts, 6) if attempts else 0.0,
+                "max_wait_seconds": round(self.max_wait, 6)
+            }
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records connection acquisition time"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.telemetry = PoolTelemetry()
+
+    def recreate(self) -> 'InstrumentedQueuePool':
+        # Engine.dispose() swaps in a recreated pool; keep the same counters
+        pool = super().recreate()
+        pool.telemetry = self.telemetry
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.telemetry.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        self.telemetry.record_wait(time.perf_counter() - started)
+        return connection
+
+    def statistics(self) -> Dict:
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "wait": self.telemetry.snapshot()
+        }
\ No newline at end of file
@@ -0,0 +1,79 @@
+from contextlib import asynccontextmanager, contextmanager
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.testing.entity.test import Test, TestResult
+from ..cache import TestDefinitionCache, test_definition_cache
+from ..models.test import TestDefinition, TestResult as TestResultModel
+from .test_repository import SQLAlchemyTestRepository
+
+class AsyncSQLAlchemyTestRepository:
+    """Read-side test repository on an asyncio session"""
+
+    def __init__(self, session: AsyncSession, definition_cache: TestDefinitionCache = test_definition_cache):
+        self._session = session
+        self._definitions = definition_cache
+
+    async def get(self, id: UUID) -> Optional[Test]:
+        """Get test by ID"""
+        await self._definitions.sync_async(self._session)
+        test = self._definitions.get(id)
+        if test is None:
+            model = await self._session.get(TestDefinition, id)
+            if model:
+                test = model.to_entity()
+                self._definitions.put(test)
+        return test
+
+    async def find_by_name(self, name: str) -> Optional[Test]:
+        """Find test by name"""
+        await self._definitions.sync_async(self._session)
+        test = self._definitions.find_by_name(name)
+        if test is None:
+            model = (await self._session.execute(
+                select(TestDefinition).where(TestDefinition.name == name)
+            )).scalar()
+            if model:
+                test = model.to_entity()
+                self._definitions.put(test)
+        return test
+
+    async def get_athlete_results(self,
+                                  athlete_id: UUID,
+                                  test_id: Optional[UUID] = None,
+                                  time_period: Optional[tuple] = None,
+                                  limit: int = 10) -> List[TestResult]:
+        """Get athlete's test results"""
+        query = select(TestResultModel).where(TestResultModel.athlete_id == athlete_id)
+
+        if test_id:
+            query = query.where(TestResultModel.test_definition_id == test_id)
+
+        if time_period:
+            start_date, end_date = time_period
+            if start_date:
+                query = query.where(TestResultModel.test_date >= start_date)
+            if end_date:
+                query = query.where(TestResultModel.test_date <= end_date)
+
+        results = await self._session.execute(
+            query.order_by(TestResultModel.test_date.desc()).limit(limit)
+        )
+        return [result.to_entity() for result in results.scalars()]
+
+def async_repository_factory(database):
+    """Factory giving each concurrent task its own async repository and session"""
+    @asynccontextmanager
+    async def factory():
+        async with database.async_session() as session:
+            yield AsyncSQLAlchemyTestRepository(session)
+    return factory
+
+def read_repository_factory(database):
+    """Factory for sync repositories used from executor threads, one session each"""
+    @contextmanager
+    def factory():
+        with database.read_session() as session:
+            yield SQLAlchemyTestRepository(session)
+    return factory
\ No newline at end of file
@@ -1,11 +1,12 @@
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy import or_
+from datetime import date
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 from domain.athlete.repository.athlete_repository import AthleteRepository
 from domain.athlete.entity.athlete import Athlete
-from domain.athlete.entity.value_objects import Name, Gender
-from ..models.athlete import AthleteModel
+from domain.athlete.entity.value_objects import Name, Gender, AgeGroup
+from ..models.athlete import Athlete as AthleteModel
 
 class SQLAlchemyAthleteRepository(AthleteRepository):
     def __init__(self, session: Session):
@@ -27,7 +28,7 @@ class SQLAlchemyAthleteRepository(AthleteRepository):
             model = AthleteModel.from_entity(athlete)
             self._session.add(model)
         
-        self._session.commit()
+        self._session.flush()
         return model.to_entity()
 
     def find_by_name(self, name: Name) -> Optional[Athlete]:
@@ -47,24 +48,34 @@ class SQLAlchemyAthleteRepository(AthleteRepository):
                         age_group: Optional[str] = None,
                         gender: Optional[Gender] = None,
                         sport: Optional[str] = None,
-                        custom_team: Optional[str] = None) -> List[Athlete]:
+                        custom_team: Optional[str] = None,
+                        as_of: Optional[date] = None) -> List[Athlete]:
         query = self._session.query(AthleteModel)
 
         if gender:
-            query = query.filter(AthleteModel.gender == gender)
+            query = query.filter(AthleteModel.gender == Gender(gender).value)
         if sport:
             query = query.filter(AthleteModel.sport == sport)
         if custom_team:
             query = query.filter(AthleteModel.custom_team == custom_team)
 
-        # Age group filtering will be handled after fetching due to dynamic calculation
-        athletes = [model.to_entity() for model in query.all()]
-        
         if age_group:
-            athletes = [athlete for athlete in athletes 
-                       if athlete.age_group == age_group or athlete.competitive_age_group == age_group]
+            # Athletes match on their natural age group (a birthdate range as
+            # of the given date) or on a custom team assignment. The two run
+            # as a UNION so each side can use its own index
+            # (idx_athlete_birthdate, idx_athlete_custom_team); an OR would
+            # rule out the birthdate range scan.
+            members = query.filter(AthleteModel.custom_team == age_group)
+            cohort = AgeGroup.from_name(age_group)
+            if cohort:
+                born_after, born_on_or_before = cohort.birthdate_range(as_of or date.today())
+                birthdate = AthleteModel.birthdate <= born_on_or_before
+                if born_after:
+                    birthdate = and_(birthdate, AthleteModel.birthdate > born_after)
+                members = members.union(query.filter(birthdate))
+            query = members
 
-        return athletes
+        return [model.to_entity() for model in query.all()]
 
     def find_active(self) -> List[Athlete]:
         models = self._session.query(AthleteModel).filter_by(is_active=True).all()
@@ -74,4 +85,4 @@ class SQLAlchemyAthleteRepository(AthleteRepository):
         model = self._session.query(AthleteModel).get(id)
         if model:
             self._session.delete(model)
-            self._session.commit()
\ No newline at end of file
+            self._session.flush()
\ No newline at end of file
@@ -1,24 +1,33 @@
-from typing import List, Optional
-from uuid import UUID
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
+from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import Integer
+from sqlalchemy import Date, Integer, String, and_, cast, column, delete, func, literal, select, tuple_, values
+from domain.athlete.entity.athlete import Athlete as AthleteEntity
+from domain.groups.entity.group import Group as GroupEntity
+from domain.groups.repository.group_repository import GroupRepository as GroupRepositoryInterface
+from ..dialect import is_postgresql, upsert
 from ..models.group import Group, AthleteGroup
 from ..models.athlete import Athlete
+from .leaderboard_repository import LeaderboardRepository
+
+class GroupRepository(GroupRepositoryInterface):
+    """Groups and memberships in groups/athlete_groups, returned as domain entities"""
 
-class GroupRepository:
     def __init__(self, session: Session):
         self._session = session
+        self._leaderboards = LeaderboardRepository(session)
 
-    def find_natural_group(self, sport: str, gender: str, age: int) -> Optional[Group]:
+    def find_natural_group(self, sport: str, gender: str, age: int) -> Optional[GroupEntity]:
         """Find natural group for given attributes"""
-        return self._session.query(Group)\
+        model = self._session.query(Group)\
             .filter(Group.sport == sport)\
             .filter(Group.gender == gender)\
             .filter(Group.is_custom == False)\
-            .filter(
-                (Group.age_range['min'].astext.cast(Integer) <= age) &
-                (Group.age_range['max'].astext.cast(Integer) >= age)
-            ).first()
+            .filter(Group.min_age <= age)\
+            .filter(Group.max_age >= age)\
+            .first()
+        return model.to_entity() if model else None
 
     def add_to_group(self, athlete_id: UUID, group_id: UUID, is_primary: bool = True) -> None:
         """Add athlete to group"""
@@ -38,29 +47,34 @@ class GroupRepository:
             )
             self._session.add(membership)
         
-        self._session.commit()
+        self._session.flush()
+        self._leaderboards.add_member(athlete_id, group_id)
 
     def remove_primary_group(self, athlete_id: UUID) -> None:
         """Remove athlete from their primary group"""
-        self._session.query(AthleteGroup)\
+        memberships = self._session.query(AthleteGroup)\
             .filter(AthleteGroup.athlete_id == athlete_id)\
-            .filter(AthleteGroup.is_primary == True)\
-            .delete()
-        self._session.commit()
+            .filter(AthleteGroup.is_primary == True)
+        group_ids = [membership.group_id for membership in memberships]
+        memberships.delete()
+        self._session.flush()
+        self._leaderboards.remove_member(athlete_id, group_ids)
 
-    def get_athlete_groups(self, athlete_id: UUID) -> List[Group]:
+    def get_athlete_groups(self, athlete_id: UUID) -> List[GroupEntity]:
         """Get all groups for an athlete"""
-        return self._session.query(Group)\
+        models = self._session.query(Group)\
             .join(AthleteGroup)\
             .filter(AthleteGroup.athlete_id == athlete_id)\
             .all()
+        return [model.to_entity() for model in models]
 
-    def get_group_athletes(self, group_id: UUID) -> List[Athlete]:
+    def get_group_athletes(self, group_id: UUID) -> List[AthleteEntity]:
         """Get all athletes in a group"""
-        return self._session.query(Athlete)\
+        models = self._session.query(Athlete)\
             .join(AthleteGroup)\
             .filter(AthleteGroup.group_id == group_id)\
             .all()
+        return [model.to_entity() for model in models]
 
     def create_group(self, 
                     name: str,
@@ -68,7 +82,7 @@ class GroupRepository:
                     sport: str,
                     gender: str,
                     age_range: dict,
-                    is_custom: bool = False) -> Group:
+                    is_custom: bool = False) -> GroupEntity:
         """Create a new group"""
         group = Group(
             name=name,
@@ -76,8 +90,180 @@ class GroupRepository:
             sport=sport,
             gender=gender,
             age_range=age_range,
+            min_age=age_range.get('min') if age_range else None,
+            max_age=age_range.get('max') if age_range else None,
             is_custom=is_custom
         )
         self._session.add(group)
-        self._session.commit()
-        return group
\ No newline at end of file
+        self._session.flush()
+        return group.to_entity()
+
+    def reassign_natural_groups(self, age_ranges: List[Dict], as_of: date) -> Dict[str, int]:
+        """
+        Move every athlete into the natural group matching their age on as_of.
+
+        age_ranges lists {"min", "max", "name"} brackets. Missing natural
+        groups are created, stale primary natural memberships are removed
+        and the target memberships are upserted, all in set-based statements
+        within the current transaction.
+        """
+        if not is_postgresql(self._session):
+            return self._reassign_natural_groups_portable(age_ranges, as_of)
+
+        brackets = values(
+            column('min_age', Integer),
+            column('max_age', Integer),
+            column('bracket', String),
+            name='brackets'
+        ).data([(r['min'], r['max'], r['name']) for r in age_ranges])
+
+        athlete_ages = select(
+            Athlete.id.label('athlete_id'),
+            Athlete.sport,
+            Athlete.gender,
+            cast(func.date_part('year', func.age(cast(literal(as_of), Date), Athlete.birthdate)), Integer).label('age')
+        ).subquery('athlete_ages')
+
+        def natural_group_for(ages):
+            return and_(
+                Group.sport == ages.c.sport,
+                Group.gender == ages.c.gender,
+                Group.is_custom == False,
+                Group.min_age <= ages.c.age,
+                Group.max_age >= ages.c.age
+            )
+
+        missing_groups = select(
+            athlete_ages.c.sport,
+            athlete_ages.c.gender,
+            brackets.c.bracket,
+            brackets.c.min_age,
+            brackets.c.max_age
+        ).distinct().join(brackets, and_(
+            brackets.c.min_age <= athlete_ages.c.age,
+            brackets.c.max_age >= athlete_ages.c.age
+        )).where(~select(Group.id).where(natural_group_for(athlete_ages)).exists())\
+            .subquery('missing_groups')
+        missing = select(
+            func.gen_random_uuid(),
+            func.concat_ws(' ', missing_groups.c.sport, missing_groups.c.gender, missing_groups.c.bracket),
+            literal('natural'),
+            missing_groups.c.sport,
+            missing_groups.c.gender,
+            func.json_build_object('min', missing_groups.c.min_age, 'max', missing_groups.c.max_age),
+            missing_groups.c.min_age,
+            missing_groups.c.max_age,
+            literal(False)
+        )
+        created = self._session.execute(
+            upsert(self._session, Group.__table__)
+            .from_select(['id', 'name', 'type', 'sport', 'gender', 'age_range',
+                          'min_age', 'max_age', 'is_custom'], missing)
+            .on_conflict_do_nothing(index_elements=['sport', 'gender', 'name'])
+        ).rowcount
+
+        # Narrowest matching group wins where natural groups overlap
+        targets = select(
+            athlete_ages.c.athlete_id,
+            Group.id.label('group_id')
+        ).distinct(athlete_ages.c.athlete_id)\
+            .join(Group, natural_group_for(athlete_ages))\
+            .order_by(athlete_ages.c.athlete_id, (Group.max_age - Group.min_age).asc())\
+            .cte('targets')
+
+        natural_groups = select(Group.id).where(Group.is_custom == False)
+        removed = self._session.execute(
+            delete(AthleteGroup)
+            .where(AthleteGroup.is_primary == True)
+            .where(AthleteGroup.group_id.in_(natural_groups))
+            .where(tuple_(AthleteGroup.athlete_id, AthleteGroup.group_id).not_in(
+                select(targets.c.athlete_id, targets.c.group_id)
+            ))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+        stmt = upsert(self._session, AthleteGroup.__table__).from_select(
+            ['id', 'athlete_id', 'group_id', 'is_primary'],
+            select(func.gen_random_uuid(), targets.c.athlete_id, targets.c.group_id, literal(True))
+        )
+        assigned = self._session.execute(self._assign_primary(stmt)).rowcount
+        self._leaderboards.sync_memberships()
+        self._session.flush()
+
+        return {
+            "groups_created": created,
+            "memberships_removed": removed,
+            "memberships_assigned": assigned
+        }
+
+    def _reassign_natural_groups_portable(self, age_ranges: List[Dict], as_of: date) -> Dict[str, int]:
+        """
+        reassign_natural_groups for backends without PostgreSQL's date
+        functions and DISTINCT ON (SQLite); targets are computed in Python.
+        """
+        natural = self._session.query(Group).filter(Group.is_custom == False).all()
+        by_cohort: Dict[tuple, List[Group]] = {}
+        for group in natural:
+            by_cohort.setdefault((group.sport, group.gender), []).append(group)
+        names = {(group.sport, group.gender, group.name) for group in natural}
+
+        created = 0
+        targets: Dict[UUID, UUID] = {}
+        for athlete_id, sport, gender, birthdate in self._session.execute(
+            select(Athlete.id, Athlete.sport, Athlete.gender, Athlete.birthdate)
+        ):
+            age = as_of.year - birthdate.year - ((as_of.month, as_of.day) < (birthdate.month, birthdate.day))
+            candidates = [group for group in by_cohort.get((sport, gender), [])
+                          if group.min_age is not None and group.min_age <= age <= group.max_age]
+            if not candidates:
+                bracket = next((r for r in age_ranges if r['min'] <= age <= r['max']), None)
+                name = f"{sport} {gender} {bracket['name']}" if bracket else None
+                if not bracket or (sport, gender, name) in names:
+                    continue
+                group = self.create_group(
+                    name=name,
+                    type="natural",
+                    sport=sport,
+                    gender=gender,
+                    age_range={"min": bracket["min"], "max": bracket["max"]},
+                    is_custom=False
+                )
+                by_cohort.setdefault((sport, gender), []).append(group)
+                names.add((sport, gender, name))
+                candidates = [group]
+                created += 1
+            targets[athlete_id] = min(candidates, key=lambda group: group.max_age - group.min_age).id
+
+        removed = 0
+        for membership in self._session.query(AthleteGroup)\
+                .filter(AthleteGroup.is_primary == True)\
+                .filter(AthleteGroup.group_id.in_([group.id for groups in by_cohort.values() for group in groups])):
+            if targets.get(membership.athlete_id) != membership.group_id:
+                self._session.delete(membership)
+                removed += 1
+        self._session.flush()
+
+        assigned = 0
+        if targets:
+            assigned = self._session.execute(
+                self._assign_primary(upsert(self._session, AthleteGroup.__table__)),
+                [{"id": uuid4(), "athlete_id": athlete_id, "group_id": group_id, "is_primary": True}
+                 for athlete_id, group_id in targets.items()]
+            ).rowcount
+        self._leaderboards.sync_memberships()
+        self._session.flush()
+
+        return {
+            "groups_created": created,
+            "memberships_removed": removed,
+            "memberships_assigned": assigned
+        }
+
+    @staticmethod
+    def _assign_primary(statement):
+        """Upsert memberships as primary, skipping rows that already are"""
+        return statement.on_conflict_do_update(
+            index_elements=['athlete_id', 'group_id'],
+            set_={"is_primary": True},
+            where=AthleteGroup.__table__.c.is_primary.isnot(True)
+        )
\ No newline at end of file
@@ -0,0 +1,207 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import and_, delete, exists, func, or_, select, true, tuple_
+from sqlalchemy.orm import Session
+from ..dialect import upsert
+from ..models.group import AthleteGroup
+from ..models.leaderboard import LeaderboardEntry
+from ..models.test import TestResultSummary
+
+class LeaderboardRepository:
+    """
+    Per group and test boards kept in leaderboard_entries.
+
+    Entries mirror test_result_summaries for each of the athlete's groups
+    and are refreshed on every result write and membership change. Boards
+    rank on the best value (max or min, depending on higher_is_better) or
+    on the latest value; ties are broken by athlete id.
+    """
+
+    METRICS = ('best', 'latest')
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    # Maintenance
+
+    def refresh(self, pairs: Iterable[Tuple[UUID, UUID]]) -> None:
+        """Copy updated (athlete_id, test_definition_id) summaries to every group board"""
+        pairs = set(pairs)
+        if pairs:
+            self._upsert(tuple_(TestResultSummary.athlete_id,
+                                TestResultSummary.test_definition_id).in_(pairs))
+
+    def add_member(self, athlete_id: UUID, group_id: UUID) -> None:
+        """Put an athlete's existing results on a group's boards"""
+        self._upsert(TestResultSummary.athlete_id == athlete_id,
+                     AthleteGroup.group_id == group_id)
+
+    def remove_member(self, athlete_id: UUID, group_ids: List[UUID]) -> None:
+        """Take an athlete off the boards of the given groups"""
+        if group_ids:
+            self._session.execute(
+                delete(LeaderboardEntry)
+                .where(LeaderboardEntry.athlete_id == athlete_id)
+                .where(LeaderboardEntry.group_id.in_(group_ids))
+                .execution_options(synchronize_session=False)
+            )
+
+    def sync_memberships(self) -> None:
+        """Reconcile all boards with athlete_groups after bulk membership changes"""
+        self._session.execute(
+            delete(LeaderboardEntry)
+            .where(~exists().where(
+                AthleteGroup.athlete_id == LeaderboardEntry.athlete_id,
+                AthleteGroup.group_id == LeaderboardEntry.group_id
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        self._upsert(~exists().where(
+            LeaderboardEntry.athlete_id == TestResultSummary.athlete_id,
+            LeaderboardEntry.group_id == AthleteGroup.group_id,
+            LeaderboardEntry.test_definition_id == TestResultSummary.test_definition_id
+        ))
+
+    def rebuild(self) -> int:
+        """Recompute every board from test_result_summaries"""
+        self._session.execute(delete(LeaderboardEntry))
+        self._upsert()
+        return self._session.query(LeaderboardEntry).count()
+
+    def _upsert(self, *criteria) -> None:
+        source = select(
+            AthleteGroup.group_id,
+            TestResultSummary.test_definition_id,
+            TestResultSummary.athlete_id,
+            TestResultSummary.max_value,
+            TestResultSummary.min_value,
+            TestResultSummary.latest_value,
+            TestResultSummary.latest_test_date
+        ).join(AthleteGroup, AthleteGroup.athlete_id == TestResultSummary.athlete_id)\
+            .where(*(criteria or (true(),)))  # SQLite needs a WHERE before ON CONFLICT
+
+        statement = upsert(self._session, LeaderboardEntry.__table__).from_select(
+            ['group_id', 'test_definition_id', 'athlete_id', 'max_value',
+             'min_value', 'latest_value', 'latest_test_date'],
+            source
+        )
+        new = statement.excluded
+        self._session.execute(statement.on_conflict_do_update(
+            index_elements=['group_id', 'test_definition_id', 'athlete_id'],
+            set_={
+                "max_value": new.max_value,
+                "min_value": new.min_value,
+                "latest_value": new.latest_value,
+                "latest_test_date": new.latest_test_date,
+                "updated_at": func.now()
+            }
+        ))
+
+    # Queries
+
+    def top(self,
+            group_id: UUID,
+            test_id: UUID,
+            limit: int = 10,
+            metric: str = 'best',
+            higher_is_better: bool = True) -> List[Dict]:
+        """First entries of a board"""
+        value = self._value_column(metric, higher_is_better)
+        entries = self._session.execute(
+            self._board(group_id, test_id, value)
+            .order_by(*self._ordering(value, higher_is_better))
+            .limit(limit)
+        ).all()
+        return [self._entry(row, position) for position, row in enumerate(entries, 1)]
+
+    def standing(self,
+                 group_id: UUID,
+                 test_id: UUID,
+                 athlete_id: UUID,
+                 neighbors: int = 0,
+                 metric: str = 'best',
+                 higher_is_better: bool = True) -> Optional[Dict]:
+        """
+        An athlete's rank on a board with up to `neighbors` entries either side.
+
+        rank is shared by equal values; position is the athlete's place in
+        the board order.
+        """
+        value = self._value_column(metric, higher_is_better)
+        row = self._session.execute(
+            self._board(group_id, test_id, value)
+            .where(LeaderboardEntry.athlete_id == athlete_id)
+        ).first()
+        if row is None:
+            return None
+
+        better = value > row.value if higher_is_better else value < row.value
+        before = or_(better, and_(value == row.value, LeaderboardEntry.athlete_id < athlete_id))
+        counts = self._session.execute(
+            select(
+                func.count().filter(better),
+                func.count().filter(before),
+                func.count()
+            ).where(
+                LeaderboardEntry.group_id == group_id,
+                LeaderboardEntry.test_definition_id == test_id
+            )
+        ).one()
+        rank, position, size = counts[0] + 1, counts[1] + 1, counts[2]
+
+        standing = {
+            **self._entry(row, position),
+            "rank": rank,
+            "board_size": size
+        }
+        if neighbors:
+            ordering = self._ordering(value, higher_is_better)
+            above = self._session.execute(
+                self._board(group_id, test_id, value)
+                .where(before)
+                .order_by(*self._ordering(value, not higher_is_better, athlete_desc=True))
+                .limit(neighbors)
+            ).all()
+            below = self._session.execute(
+                self._board(group_id, test_id, value)
+                .where(~before, LeaderboardEntry.athlete_id != athlete_id)
+                .order_by(*ordering)
+                .limit(neighbors)
+            ).all()
+            standing["above"] = [self._entry(entry, position - offset)
+                                 for offset, entry in reversed(list(enumerate(above, 1)))]
+            standing["below"] = [self._entry(entry, position + offset)
+                                 for offset, entry in enumerate(below, 1)]
+        return standing
+
+    def _value_column(self, metric: str, higher_is_better: bool):
+        if metric not in self.METRICS:
+            raise ValueError(f"Unknown leaderboard metric: {metric}")
+        if metric == 'latest':
+            return LeaderboardEntry.latest_value
+        return LeaderboardEntry.max_value if higher_is_better else LeaderboardEntry.min_value
+
+    @staticmethod
+    def _ordering(value, higher_is_better: bool, athlete_desc: bool = False) -> tuple:
+        athlete = LeaderboardEntry.athlete_id.desc() if athlete_desc else LeaderboardEntry.athlete_id.asc()
+        return (value.desc() if higher_is_better else value.asc(), athlete)
+
+    @staticmethod
+    def _board(group_id: UUID, test_id: UUID, value):
+        return select(
+            LeaderboardEntry.athlete_id,
+            value.label('value'),
+            LeaderboardEntry.latest_test_date
+        ).where(
+            LeaderboardEntry.group_id == group_id,
+            LeaderboardEntry.test_definition_id == test_id
+        )
+
+    @staticmethod
+    def _entry(row, position: int) -> Dict:
+        return {
+            "position": position,
+            "athlete_id": row.athlete_id,
+            "value": row.value,
+            "latest_test_date": row.latest_test_date
+        }
\ No newline at end of file
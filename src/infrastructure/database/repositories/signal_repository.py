@@ -0,0 +1,87 @@
+from typing import Dict, List, Optional
+from uuid import UUID
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from ..dialect import upsert
+from ..models.test import TestSignal
+from ...signals import SignalStore
+
+class SignalRepository:
+    """
+    Raw traces of test results: metadata in test_signals, samples in the
+    signal store.
+
+    Sample reads go straight to the store and never query the database.
+    Files are written before the metadata row is flushed, so a rolled back
+    transaction can leave an orphaned file but never a row without samples.
+    """
+
+    def __init__(self, session: Session, store: SignalStore):
+        self._session = session
+        self._store = store
+
+    def save(self,
+             test_result_id: UUID,
+             name: str,
+             samples,
+             sample_rate: float) -> Dict:
+        """Store a trace, replacing any previous one of the same name"""
+        key = SignalStore.key(test_result_id, name)
+        info = self._store.write(key, samples, sample_rate)
+        values = {
+            "test_result_id": test_result_id,
+            "name": name,
+            "sample_rate": sample_rate,
+            "sample_count": info.sample_count,
+            "storage_key": key,
+            "byte_size": info.byte_size
+        }
+        stmt = upsert(self._session, TestSignal.__table__).values(**values)
+        self._session.execute(stmt.on_conflict_do_update(
+            index_elements=['test_result_id', 'name'],
+            set_={column: stmt.excluded[column]
+                  for column in ('sample_rate', 'sample_count', 'storage_key', 'byte_size')}
+        ))
+        self._session.flush()
+        return values
+
+    def list(self, test_result_id: UUID) -> List[Dict]:
+        """Metadata of a result's traces"""
+        signals = self._session.scalars(
+            select(TestSignal)
+            .where(TestSignal.test_result_id == test_result_id)
+            .order_by(TestSignal.name)
+        )
+        return [signal.to_dict() for signal in signals]
+
+    def read(self,
+             test_result_id: UUID,
+             name: str,
+             start: int = 0,
+             stop: Optional[int] = None) -> Optional[np.ndarray]:
+        """Samples [start, stop) of one trace, or None if it was never stored"""
+        key = SignalStore.key(test_result_id, name)
+        if not self._store.exists(key):
+            return None
+        return self._store.read(key, start, stop)
+
+    def open(self, test_result_id: UUID, name: str) -> Optional[np.ndarray]:
+        """Read-only memory-mapped view of a whole trace"""
+        key = SignalStore.key(test_result_id, name)
+        if not self._store.exists(key):
+            return None
+        return self._store.open(key)
+
+    def delete(self, test_result_id: UUID, name: Optional[str] = None) -> int:
+        """
+        Delete one trace, or all traces of a result. Files are removed
+        right away, not on commit.
+        """
+        stmt = delete(TestSignal).where(TestSignal.test_result_id == test_result_id)
+        if name is not None:
+            stmt = stmt.where(TestSignal.name == name)
+        keys = self._session.scalars(stmt.returning(TestSignal.storage_key)).all()
+        for key in keys:
+            self._store.delete(key)
+        return len(keys)
\ No newline at end of file
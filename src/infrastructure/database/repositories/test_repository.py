@@ -1,24 +1,61 @@
-from typing import List, Optional, Dict
-from uuid import UUID
+from typing import Iterator, List, Optional, Dict, Tuple
+from uuid import UUID, uuid4
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
+import numpy as np
+from sqlalchemy import insert, select, update, delete, func, case, literal, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload, selectinload
 from domain.testing.repository.test_repository import TestRepository
 from domain.testing.entity.test import Test, TestCategory, TestResult
-from ..models.test import TestDefinition, TestResult as TestResultModel, TestAnalysis
+from ..models.test import TestDefinition, TestResult as TestResultModel, TestResultSummary, TestAnalysis
+from domain.testing.service.analysis.common.metrics import ResultsMatrix, NormativeDistribution
+from ..models.batch import BatchOperation, BatchResult
+from ..models.athlete import Athlete
+from ..models.group import AthleteGroup
+from .leaderboard_repository import LeaderboardRepository
+from ..dialect import upsert, least, greatest, is_postgresql
+from ..cache import (
+    TestDefinitionCache, test_definition_cache,
+    NormativeDistributionCache, normative_distribution_cache
+)
+
+# Rows per multi-row INSERT / transaction in the bulk ingestion path
+BULK_CHUNK_SIZE = 1000
+
+# Rows fetched per round trip from the server-side cursor when exporting
+EXPORT_BATCH_SIZE = 2000
 
 class SQLAlchemyTestRepository(TestRepository):
-    def __init__(self, session: Session):
+    def __init__(self,
+                 session: Session,
+                 definition_cache: TestDefinitionCache = test_definition_cache,
+                 normative_cache: NormativeDistributionCache = normative_distribution_cache):
         self._session = session
+        self._definitions = definition_cache
+        self._normatives = normative_cache
+        self._leaderboards = LeaderboardRepository(session)
 
     def get(self, id: UUID) -> Optional[Test]:
         """Get test by ID"""
-        model = self._session.query(TestDefinition).get(id)
-        return model.to_entity() if model else None
+        self._definitions.sync(self._session)
+        test = self._definitions.get(id)
+        if test is None:
+            model = self._session.query(TestDefinition).get(id)
+            if model:
+                test = model.to_entity()
+                self._definitions.put(test)
+        return test
 
     def find_by_name(self, name: str) -> Optional[Test]:
         """Find test by name"""
-        model = self._session.query(TestDefinition).filter_by(name=name).first()
-        return model.to_entity() if model else None
+        self._definitions.sync(self._session)
+        test = self._definitions.find_by_name(name)
+        if test is None:
+            model = self._session.query(TestDefinition).filter_by(name=name).first()
+            if model:
+                test = model.to_entity()
+                self._definitions.put(test)
+        return test
 
     def find_by_category(self, category: TestCategory) -> List[Test]:
         """Find all tests in a category"""
@@ -35,28 +72,23 @@ class SQLAlchemyTestRepository(TestRepository):
     def save(self, test: Test) -> Test:
         """Save or update a test definition"""
         model = self._session.query(TestDefinition).get(test.id)
+        updated = TestDefinition.from_entity(test)
         if model:
             # Update existing
-            model.name = test.name
-            model.category = test.category
-            model.primary_unit = test.primary_unit
-            model.description = test.description
-            model.required_fields = test.required_fields
-            model.optional_fields = test.optional_fields
+            model.name = updated.name
+            model.category = updated.category
+            model.primary_unit = updated.primary_unit
+            model.description = updated.description
+            model.required_fields = updated.required_fields
+            model.optional_fields = updated.optional_fields
         else:
             # Create new
-            model = TestDefinition(
-                id=test.id,
-                name=test.name,
-                category=test.category,
-                primary_unit=test.primary_unit,
-                description=test.description,
-                required_fields=test.required_fields,
-                optional_fields=test.optional_fields
-            )
+            model = updated
             self._session.add(model)
         
-        self._session.commit()
+        self._session.flush()
+        self._definitions.invalidate(test.id)
+        self._definitions.bump_version(self._session)
         return model.to_entity()
 
     def save_result(self,
@@ -70,24 +102,564 @@ class SQLAlchemyTestRepository(TestRepository):
             athlete_id=athlete_id,
             test_date=test_date or datetime.utcnow(),
             primary_value=values.get('primary_value'),
-            additional_values=values
+            additional_values=values,
+            **self._metric_values(test_id, values)
         )
         self._session.add(result)
-        self._session.commit()
+        self._session.flush()
+        self._results_added([{
+            "athlete_id": result.athlete_id,
+            "test_definition_id": result.test_definition_id,
+            "test_date": result.test_date,
+            "primary_value": result.primary_value
+        }])
         return result.to_entity()
 
+    def save_results_bulk(self,
+                         results: List[Dict],
+                         rejected: Optional[Dict[int, str]] = None,
+                         metadata: Optional[Dict] = None,
+                         chunk_size: int = BULK_CHUNK_SIZE) -> Dict:
+        """
+        Save many test results using chunked multi-row inserts.
+
+        Each item in results holds item_index, test_id, athlete_id, values
+        and test_date. Items rejected before reaching the database are passed
+        in as {item_index: error_message} so they are recorded on the batch.
+        One transaction is committed per chunk; a failing chunk is retried row
+        by row inside savepoints so only the offending items are marked failed.
+        Unlike the other write methods this commits itself, so it should be
+        called on a session with no other pending work.
+        """
+        rejected = rejected or {}
+        batch = BatchOperation(
+            id=uuid4(),
+            type='test_results',
+            status='processing',
+            total_items=len(results) + len(rejected),
+            processed_items=0,
+            errors=[],
+            batch_metadata=metadata
+        )
+        self._session.add(batch)
+        self._session.commit()
+
+        errors = [{"item_index": index, "error": message}
+                  for index, message in sorted(rejected.items())]
+        if rejected:
+            self._session.execute(insert(BatchResult.__table__), [
+                self._batch_result_row(batch.id, index, 'failed', error_message=message)
+                for index, message in rejected.items()
+            ])
+            self._session.commit()
+
+        saved = 0
+        for start in range(0, len(results), chunk_size):
+            chunk = results[start:start + chunk_size]
+            rows = [self._result_row(item) for item in chunk]
+            try:
+                self._session.execute(insert(TestResultModel.__table__), rows)
+                outcomes = [(item['item_index'], row['id'], None)
+                            for item, row in zip(chunk, rows)]
+                self._results_added(rows)
+            except SQLAlchemyError:
+                self._session.rollback()
+                outcomes = self._save_rows_individually(chunk, rows)
+                saved_ids = {result_id for _, result_id, error in outcomes if not error}
+                self._results_added([row for row in rows if row['id'] in saved_ids])
+
+            self._session.execute(insert(BatchResult.__table__), [
+                self._batch_result_row(
+                    batch.id, index,
+                    'failed' if error else 'success',
+                    result_id=None if error else result_id,
+                    error_message=error
+                )
+                for index, result_id, error in outcomes
+            ])
+            errors.extend({"item_index": index, "error": error}
+                          for index, _, error in outcomes if error)
+            saved += sum(1 for _, _, error in outcomes if not error)
+
+            batch.processed_items = len(rejected) + start + len(chunk)
+            self._session.commit()
+
+        batch.errors = errors
+        batch.status = 'completed_with_errors' if errors else 'completed'
+        batch.completed_at = datetime.utcnow()
+        self._session.commit()
+
+        return {
+            "batch_id": batch.id,
+            "status": batch.status,
+            "total_items": batch.total_items,
+            "processed_items": batch.processed_items,
+            "saved_items": saved,
+            "failed_items": len(errors),
+            "errors": errors
+        }
+
+    def _save_rows_individually(self, chunk: List[Dict], rows: List[Dict]) -> List[tuple]:
+        """Insert rows one by one in savepoints to isolate failing items"""
+        outcomes = []
+        for item, row in zip(chunk, rows):
+            try:
+                with self._session.begin_nested():
+                    self._session.execute(insert(TestResultModel.__table__), [row])
+                outcomes.append((item['item_index'], row['id'], None))
+            except SQLAlchemyError as e:
+                outcomes.append((item['item_index'], None, str(e.orig if hasattr(e, 'orig') else e)))
+        return outcomes
+
+    def _result_row(self, item: Dict) -> Dict:
+        """Build a test_results row for a Core insert"""
+        values = item['values']
+        return {
+            "id": uuid4(),
+            "test_definition_id": item['test_id'],
+            "athlete_id": item['athlete_id'],
+            "test_date": item.get('test_date') or datetime.utcnow(),
+            "primary_value": values.get('primary_value'),
+            "additional_values": values,
+            "conditions": {},
+            "validated": False,
+            **self._metric_values(item['test_id'], values)
+        }
+
+    def _batch_result_row(self,
+                          batch_id: UUID,
+                          item_index: int,
+                          status: str,
+                          result_id: Optional[UUID] = None,
+                          error_message: Optional[str] = None) -> Dict:
+        """Build a batch_results row for a Core insert"""
+        return {
+            "id": uuid4(),
+            "batch_operation_id": batch_id,
+            "item_index": item_index,
+            "status": status,
+            "result_id": result_id,
+            "error_message": error_message
+        }
+
+    def _results_added(self, rows: List[Dict]) -> None:
+        """Bring derived data up to date with newly inserted result rows"""
+        self._merge_result_summaries(rows)
+        self._leaderboards.refresh((row['athlete_id'], row['test_definition_id']) for row in rows)
+        self._invalidate_analyses(rows)
+
+    def _invalidate_analyses(self, rows: List[Dict]) -> None:
+        """
+        Drop stored analyses for the athlete/test pairs of new results.
+
+        Analyzers look at the athlete's recent history, so a new result
+        changes the analysis of the earlier ones as well.
+        """
+        pairs = {(row['athlete_id'], row['test_definition_id']) for row in rows}
+        if not pairs:
+            return
+
+        affected = select(TestResultModel.id).where(
+            tuple_(TestResultModel.athlete_id, TestResultModel.test_definition_id).in_(pairs)
+        )
+        self._session.execute(
+            delete(TestAnalysis)
+            .where(TestAnalysis.test_result_id.in_(affected))
+            .execution_options(synchronize_session=False)
+        )
+
+    def _merge_result_summaries(self, rows: List[Dict]) -> None:
+        """
+        Fold newly inserted result rows into test_result_summaries.
+
+        Rows without a primary value are skipped, as min/max/sum skip NULLs
+        in rebuild_result_summaries.
+        """
+        aggregates = {}
+        for row in rows:
+            key = (row['athlete_id'], row['test_definition_id'])
+            value, test_date = row['primary_value'], row['test_date']
+            if value is None:
+                continue
+            aggregate = aggregates.get(key)
+            if aggregate is None:
+                aggregates[key] = {
+                    "athlete_id": row['athlete_id'],
+                    "test_definition_id": row['test_definition_id'],
+                    "result_count": 1,
+                    "value_sum": value,
+                    "min_value": value,
+                    "max_value": value,
+                    "latest_value": value,
+                    "first_test_date": test_date,
+                    "latest_test_date": test_date
+                }
+                continue
+            aggregate["result_count"] += 1
+            aggregate["value_sum"] += value
+            aggregate["min_value"] = min(aggregate["min_value"], value)
+            aggregate["max_value"] = max(aggregate["max_value"], value)
+            aggregate["first_test_date"] = min(aggregate["first_test_date"], test_date)
+            if test_date >= aggregate["latest_test_date"]:
+                aggregate["latest_test_date"] = test_date
+                aggregate["latest_value"] = value
+        if not aggregates:
+            return
+
+        summary = TestResultSummary.__table__
+        statement = upsert(self._session, summary).values(list(aggregates.values()))
+        new = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=[summary.c.athlete_id, summary.c.test_definition_id],
+            set_={
+                "result_count": summary.c.result_count + new.result_count,
+                "value_sum": summary.c.value_sum + new.value_sum,
+                "min_value": least(summary.c.min_value, new.min_value),
+                "max_value": greatest(summary.c.max_value, new.max_value),
+                "first_test_date": least(summary.c.first_test_date, new.first_test_date),
+                "latest_test_date": greatest(summary.c.latest_test_date, new.latest_test_date),
+                "latest_value": case(
+                    (new.latest_test_date >= summary.c.latest_test_date, new.latest_value),
+                    else_=summary.c.latest_value
+                ),
+                "updated_at": func.now()
+            }
+        )
+        self._session.execute(statement)
+
+    def rebuild_result_summaries(self) -> int:
+        """Recompute test_result_summaries from test_results"""
+        results = TestResultModel.__table__
+        ranked = select(
+            results.c.athlete_id,
+            results.c.test_definition_id,
+            results.c.test_date,
+            results.c.primary_value,
+            func.row_number().over(
+                partition_by=(results.c.athlete_id, results.c.test_definition_id),
+                order_by=results.c.test_date.desc()
+            ).label('recency')
+        ).subquery()
+        aggregated = select(
+            ranked.c.athlete_id,
+            ranked.c.test_definition_id,
+            func.count(),
+            func.sum(ranked.c.primary_value),
+            func.min(ranked.c.primary_value),
+            func.max(ranked.c.primary_value),
+            func.max(ranked.c.primary_value).filter(ranked.c.recency == 1),
+            func.min(ranked.c.test_date),
+            func.max(ranked.c.test_date)
+        ).group_by(ranked.c.athlete_id, ranked.c.test_definition_id)
+
+        summary = TestResultSummary.__table__
+        self._session.execute(delete(summary))
+        inserted = self._session.execute(insert(summary).from_select([
+            summary.c.athlete_id,
+            summary.c.test_definition_id,
+            summary.c.result_count,
+            summary.c.value_sum,
+            summary.c.min_value,
+            summary.c.max_value,
+            summary.c.latest_value,
+            summary.c.first_test_date,
+            summary.c.latest_test_date
+        ], aggregated))
+        self._leaderboards.rebuild()
+        self._session.flush()
+        return inserted.rowcount
+
+    def get_result_summary(self, athlete_id: UUID, test_id: UUID) -> Optional[Dict]:
+        """Get latest value, bests, count and mean for an athlete's test"""
+        summary = self._session.get(TestResultSummary, (athlete_id, test_id))
+        return summary.to_dict() if summary else None
+
+    def get_athlete_summaries(self, athlete_id: UUID) -> List[Dict]:
+        """Get result summaries for every test an athlete has taken"""
+        summaries = self._session.query(TestResultSummary)\
+            .filter(TestResultSummary.athlete_id == athlete_id)\
+            .all()
+        return [summary.to_dict() for summary in summaries]
+
+    def get_leaderboard(self,
+                        group_id: UUID,
+                        test_id: UUID,
+                        limit: int = 10,
+                        metric: str = 'best',
+                        higher_is_better: bool = True) -> List[Dict]:
+        """Top entries of a group's board for a test"""
+        return self._leaderboards.top(group_id, test_id, limit, metric, higher_is_better)
+
+    def get_leaderboard_standing(self,
+                                 group_id: UUID,
+                                 test_id: UUID,
+                                 athlete_id: UUID,
+                                 neighbors: int = 0,
+                                 metric: str = 'best',
+                                 higher_is_better: bool = True) -> Optional[Dict]:
+        """An athlete's rank on a group's board, with surrounding entries"""
+        return self._leaderboards.standing(group_id, test_id, athlete_id, neighbors, metric, higher_is_better)
+
+    def get_batch_operation(self, batch_id: UUID) -> Optional[Dict]:
+        """Get progress of a batch operation"""
+        batch = self._session.query(BatchOperation).get(batch_id)
+        if not batch:
+            return None
+        return {
+            "batch_id": batch.id,
+            "type": batch.type,
+            "status": batch.status,
+            "total_items": batch.total_items,
+            "processed_items": batch.processed_items,
+            "errors": batch.errors or [],
+            "completed_at": batch.completed_at
+        }
+
+    def _promoted_slots(self, test_id: UUID) -> Dict[str, int]:
+        """Promoted variable name -> metric slot mapping for a test"""
+        self._definitions.sync(self._session)
+        promoted = self._definitions.get_promoted(test_id)
+        if promoted is None:
+            promoted = self._session.execute(
+                select(TestDefinition.promoted_variables).where(TestDefinition.id == test_id)
+            ).scalar() or {}
+            self._definitions.put_promoted(test_id, promoted)
+        return promoted
+
+    def _metric_values(self, test_id: UUID, values: Dict) -> Dict[str, Optional[float]]:
+        """Typed metric column values for a result's promoted variables"""
+        metrics = {f"metric_{slot}": None for slot in range(1, TestResultModel.PROMOTED_SLOTS + 1)}
+        for name, slot in self._promoted_slots(test_id).items():
+            value = values.get(name)
+            if isinstance(value, (int, float)):
+                metrics[f"metric_{slot}"] = float(value)
+        return metrics
+
+    def _variable_column(self, test_id: UUID, variable_name: str):
+        """Typed metric column if the variable is promoted, else a JSON extraction"""
+        slot = self._promoted_slots(test_id).get(variable_name)
+        if slot:
+            return getattr(TestResultModel, f"metric_{slot}")
+        return TestResultModel.additional_values[variable_name].as_float()
+
+    def promote_variable(self, test_id: UUID, variable_name: str) -> int:
+        """
+        Store an additional variable of a test in a typed, indexed metric
+        column and backfill existing results. Returns the slot used.
+        """
+        model = self._session.query(TestDefinition).get(test_id)
+        if not model:
+            raise ValueError(f"Test not found: {test_id}")
+
+        promoted = dict(model.promoted_variables or {})
+        if variable_name in promoted:
+            return promoted[variable_name]
+
+        free_slots = [slot for slot in range(1, TestResultModel.PROMOTED_SLOTS + 1)
+                      if slot not in promoted.values()]
+        if not free_slots:
+            raise ValueError(
+                f"All {TestResultModel.PROMOTED_SLOTS} metric slots are in use for test {test_id}"
+            )
+
+        promoted[variable_name] = free_slots[0]
+        model.promoted_variables = promoted
+        self._session.flush()
+        self._definitions.invalidate(test_id)
+        self._definitions.bump_version(self._session)
+
+        self.backfill_promoted_variable(test_id, variable_name)
+        return free_slots[0]
+
+    def demote_variable(self, test_id: UUID, variable_name: str) -> None:
+        """Release a variable's metric slot; values stay in additional_values"""
+        model = self._session.query(TestDefinition).get(test_id)
+        if not model or variable_name not in (model.promoted_variables or {}):
+            return
+
+        promoted = dict(model.promoted_variables)
+        slot = promoted.pop(variable_name)
+        model.promoted_variables = promoted
+        self._session.execute(
+            update(TestResultModel)
+            .where(TestResultModel.test_definition_id == test_id)
+            .values({f"metric_{slot}": None})
+        )
+        self._session.flush()
+        self._definitions.invalidate(test_id)
+        self._definitions.bump_version(self._session)
+
+    def backfill_promoted_variable(self, test_id: UUID, variable_name: str) -> int:
+        """Copy a promoted variable from additional_values into its metric column"""
+        slot = self._promoted_slots(test_id).get(variable_name)
+        if not slot:
+            raise ValueError(f"Variable {variable_name} is not promoted for test {test_id}")
+
+        updated = self._session.execute(
+            update(TestResultModel)
+            .where(TestResultModel.test_definition_id == test_id)
+            .values({f"metric_{slot}": TestResultModel.additional_values[variable_name].as_float()})
+            .execution_options(synchronize_session=False)
+        )
+        return updated.rowcount
+
+    def aggregate_variable(self,
+                          test_id: UUID,
+                          variable_name: str,
+                          athlete_ids: Optional[List[UUID]] = None,
+                          time_period: Optional[tuple] = None,
+                          value_range: Optional[tuple] = None) -> Dict:
+        """Count, mean, std, min and max of an additional variable, computed in SQL"""
+        column = self._variable_column(test_id, variable_name)
+        query = select(
+            func.count(column),
+            func.avg(column),
+            func.avg(column * column),
+            func.min(column),
+            func.max(column)
+        ).where(TestResultModel.test_definition_id == test_id)
+        query = self._filter_variable_query(query, column, athlete_ids, time_period, value_range)
+
+        count, mean, mean_square, minimum, maximum = self._session.execute(query).one()
+        if not count:
+            return {"count": 0}
+        return {
+            "count": count,
+            "mean": float(mean),
+            "std": float(max(mean_square - mean * mean, 0.0) ** 0.5),
+            "min": float(minimum),
+            "max": float(maximum)
+        }
+
+    def find_results_by_variable(self,
+                                test_id: UUID,
+                                variable_name: str,
+                                athlete_ids: Optional[List[UUID]] = None,
+                                time_period: Optional[tuple] = None,
+                                value_range: Optional[tuple] = None,
+                                limit: int = 100) -> List[TestResult]:
+        """Get results whose additional variable falls in value_range"""
+        column = self._variable_column(test_id, variable_name)
+        query = select(TestResultModel)\
+            .where(TestResultModel.test_definition_id == test_id)
+        query = self._filter_variable_query(query, column, athlete_ids, time_period, value_range)
+        models = self._session.execute(
+            query.order_by(TestResultModel.test_date.desc()).limit(limit)
+        ).scalars()
+        return [model.to_entity() for model in models]
+
+    def _filter_variable_query(self, query, column, athlete_ids, time_period, value_range):
+        """Apply athlete, date and value filters to a variable query"""
+        if athlete_ids:
+            query = query.where(TestResultModel.athlete_id.in_(athlete_ids))
+        if time_period:
+            start_date, end_date = time_period
+            if start_date:
+                query = query.where(TestResultModel.test_date >= start_date)
+            if end_date:
+                query = query.where(TestResultModel.test_date <= end_date)
+        if value_range:
+            min_value, max_value = value_range
+            if min_value is not None:
+                query = query.where(column >= min_value)
+            if max_value is not None:
+                query = query.where(column <= max_value)
+        return query
+
     def get_athlete_results(self,
                           athlete_id: UUID,
                           test_id: Optional[UUID] = None,
                           time_period: Optional[tuple] = None,
                           limit: int = 10) -> List[TestResult]:
         """Get athlete's test results"""
+        results = self._athlete_results_query(athlete_id, test_id, time_period)\
+            .limit(limit)\
+            .all()
+            
+        return [result.to_entity() for result in results]
+
+    def iter_results(self,
+                     group_id: Optional[UUID] = None,
+                     test_id: Optional[UUID] = None,
+                     sport: Optional[str] = None,
+                     time_period: Optional[tuple] = None,
+                     batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Dict]:
+        """
+        Stream results as flat rows for export.
+
+        Rows come from a server-side cursor batch_size at a time, so memory
+        use does not grow with the number of rows. The session must stay
+        open until the iterator is exhausted.
+        """
+        query = select(
+            TestResultModel.id.label('result_id'),
+            TestResultModel.athlete_id,
+            Athlete.first_name,
+            Athlete.last_name,
+            Athlete.sport,
+            TestResultModel.test_definition_id.label('test_id'),
+            TestDefinition.name.label('test_name'),
+            TestResultModel.test_date,
+            TestResultModel.primary_value,
+            TestResultModel.additional_values
+        ).join(Athlete, Athlete.id == TestResultModel.athlete_id)\
+            .join(TestDefinition, TestDefinition.id == TestResultModel.test_definition_id)
+
+        if group_id:
+            query = query.join(AthleteGroup, AthleteGroup.athlete_id == TestResultModel.athlete_id)\
+                .where(AthleteGroup.group_id == group_id)
+        if test_id:
+            query = query.where(TestResultModel.test_definition_id == test_id)
+        if sport:
+            query = query.where(Athlete.sport == sport)
+        if time_period:
+            start_date, end_date = time_period
+            if start_date:
+                query = query.where(TestResultModel.test_date >= start_date)
+            if end_date:
+                query = query.where(TestResultModel.test_date <= end_date)
+
+        rows = self._session.execute(
+            query.order_by(TestResultModel.test_date, TestResultModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for row in rows:
+            yield row._asdict()
+
+    def get_athlete_history(self,
+                            athlete_id: UUID,
+                            test_id: Optional[UUID] = None,
+                            time_period: Optional[tuple] = None,
+                            limit: int = 10) -> List[Tuple[TestResult, Dict[Tuple[str, int], Dict]]]:
+        """
+        Get athlete's test results together with their stored analyses.
+
+        Stored analyses are eager loaded in one extra query and keyed by
+        (analyzer_type, analyzer_version).
+        """
+        results = self._athlete_results_query(athlete_id, test_id, time_period)\
+            .options(selectinload(TestResultModel.analysis_results))\
+            .limit(limit)\
+            .all()
+
+        return [(
+            result.to_entity(),
+            {(analysis.analyzer_type, analysis.analyzer_version): analysis.payload
+             for analysis in result.analysis_results}
+        ) for result in results]
+
+    def _athlete_results_query(self,
+                               athlete_id: UUID,
+                               test_id: Optional[UUID] = None,
+                               time_period: Optional[tuple] = None):
+        """Newest-first query over an athlete's results"""
         query = self._session.query(TestResultModel)\
             .filter(TestResultModel.athlete_id == athlete_id)
         
         if test_id:
             query = query.filter(TestResultModel.test_definition_id == test_id)
         
+        # Bounds on test_date let Postgres prune to the matching season partitions
         if time_period:
             start_date, end_date = time_period
             if start_date:
@@ -95,29 +667,212 @@ class SQLAlchemyTestRepository(TestRepository):
             if end_date:
                 query = query.filter(TestResultModel.test_date <= end_date)
         
-        results = query.order_by(TestResultModel.test_date.desc())\
-            .limit(limit)\
-            .all()
-            
-        return [result.to_entity() for result in results]
+        return query.order_by(TestResultModel.test_date.desc())
+
+    def get_normative_distribution(self,
+                                   test_id: UUID,
+                                   sport: str,
+                                   gender: str,
+                                   age_group: str) -> NormativeDistribution:
+        """Sorted reference values of a sport/gender/age group cohort for a test"""
+        return self._normatives.get(self._session, test_id, sport, gender, age_group)
+
+    def get_results_matrix(self,
+                          athlete_ids: List[UUID],
+                          test_ids: List[UUID],
+                          time_period: Optional[tuple] = None,
+                          max_results: Optional[int] = None) -> ResultsMatrix:
+        """
+        Get primary values pivoted into athletes x tests x results arrays.
+
+        The position of each result along the last axis is assigned in SQL
+        with row_number() (most recent first), so the rows are scattered into
+        the arrays in one vectorized step without building entities.
+        max_results keeps only the most recent results per athlete and test.
+        """
+        athlete_ids = list(athlete_ids)
+        test_ids = list(test_ids)
+
+        slot = func.row_number().over(
+            partition_by=(TestResultModel.athlete_id, TestResultModel.test_definition_id),
+            order_by=TestResultModel.test_date.desc()
+        ).label('slot')
+        query = select(
+            TestResultModel.athlete_id,
+            TestResultModel.test_definition_id,
+            TestResultModel.test_date,
+            TestResultModel.primary_value,
+            slot
+        ).where(
+            TestResultModel.athlete_id.in_(athlete_ids),
+            TestResultModel.test_definition_id.in_(test_ids)
+        )
+        if time_period:
+            start_date, end_date = time_period
+            if start_date:
+                query = query.where(TestResultModel.test_date >= start_date)
+            if end_date:
+                query = query.where(TestResultModel.test_date <= end_date)
+
+        ranked = query.subquery()
+        query = select(ranked)
+        if max_results:
+            query = query.where(ranked.c.slot <= max_results)
+
+        return self._scatter_matrix(self._session.execute(query).all(), athlete_ids, test_ids)
+
+    def get_latest_results(self,
+                           athlete_ids: List[UUID],
+                           test_ids: List[UUID],
+                           as_of: Optional[datetime] = None) -> ResultsMatrix:
+        """
+        Get each athlete's most recent result per test, on or before as_of.
+
+        One query for the whole squad: DISTINCT ON (athlete, test) walking
+        the (athlete, test, date) index on Postgres, row_number() elsewhere.
+        The matrix has depth 1.
+        """
+        athlete_ids = list(athlete_ids)
+        test_ids = list(test_ids)
+        columns = (
+            TestResultModel.athlete_id,
+            TestResultModel.test_definition_id,
+            TestResultModel.test_date,
+            TestResultModel.primary_value
+        )
+        conditions = [
+            TestResultModel.athlete_id.in_(athlete_ids),
+            TestResultModel.test_definition_id.in_(test_ids)
+        ]
+        if as_of:
+            conditions.append(TestResultModel.test_date <= as_of)
+
+        if is_postgresql(self._session):
+            query = select(*columns, literal(1).label('slot')).where(*conditions).distinct(
+                TestResultModel.athlete_id, TestResultModel.test_definition_id
+            ).order_by(
+                TestResultModel.athlete_id,
+                TestResultModel.test_definition_id,
+                TestResultModel.test_date.desc()
+            )
+        else:
+            ranked = select(*columns, func.row_number().over(
+                partition_by=(TestResultModel.athlete_id, TestResultModel.test_definition_id),
+                order_by=TestResultModel.test_date.desc()
+            ).label('slot')).where(*conditions).subquery()
+            query = select(ranked).where(ranked.c.slot == 1)
+
+        return self._scatter_matrix(self._session.execute(query).all(), athlete_ids, test_ids, depth=1)
+
+    @staticmethod
+    def _scatter_matrix(rows: List[tuple],
+                        athlete_ids: List[UUID],
+                        test_ids: List[UUID],
+                        depth: Optional[int] = None) -> ResultsMatrix:
+        """
+        Scatter (athlete_id, test_id, test_date, value, slot) rows into a
+        ResultsMatrix in one vectorized step. slot is the 1-based position
+        along the last axis; depth defaults to the deepest slot.
+        """
+        athlete_index = {athlete_id: i for i, athlete_id in enumerate(athlete_ids)}
+        test_index = {test_id: i for i, test_id in enumerate(test_ids)}
+
+        count = len(rows)
+        athletes, tests, dates, values, slots = zip(*rows) if rows else ((), (), (), (), ())
+        a_idx = np.fromiter((athlete_index[a] for a in athletes), dtype=np.intp, count=count)
+        t_idx = np.fromiter((test_index[t] for t in tests), dtype=np.intp, count=count)
+        s_idx = np.fromiter(slots, dtype=np.intp, count=count) - 1
+        if depth is None:
+            depth = int(s_idx.max()) + 1 if count else 0
+
+        shape = (len(athlete_ids), len(test_ids), depth)
+        value_matrix = np.full(shape, np.nan)
+        date_matrix = np.full(shape, np.datetime64('NaT'), dtype='datetime64[s]')
+        mask = np.zeros(shape, dtype=bool)
+
+        value_matrix[a_idx, t_idx, s_idx] = np.fromiter(values, dtype=float, count=count)
+        date_matrix[a_idx, t_idx, s_idx] = np.array(dates, dtype='datetime64[s]')
+        mask[a_idx, t_idx, s_idx] = True
+
+        return ResultsMatrix(
+            athlete_ids=athlete_ids,
+            test_ids=test_ids,
+            values=value_matrix,
+            dates=date_matrix,
+            mask=mask
+        )
+
+    def get_test_result(self, id: UUID) -> Optional[TestResult]:
+        """Get a single test result"""
+        model = self._session.execute(
+            select(TestResultModel).where(TestResultModel.id == id)
+        ).scalar()
+        return model.to_entity() if model else None
+
+    def get_analysis(self,
+                     test_result_id: UUID,
+                     analyzer_type: str,
+                     analyzer_version: int) -> Optional[Dict]:
+        """Get stored analyzer output for a result, if still current"""
+        return self._session.execute(
+            select(TestAnalysis.payload).where(
+                TestAnalysis.test_result_id == test_result_id,
+                TestAnalysis.analyzer_type == analyzer_type,
+                TestAnalysis.analyzer_version == analyzer_version
+            )
+        ).scalar()
 
     def save_analysis(self,
                      test_result_id: UUID,
                      analysis_data: Dict) -> None:
-        """Save analysis results for a test"""
-        analysis = TestAnalysis(
-            test_result_id=test_result_id,
-            analyzer_type=analysis_data.get('analyzer_type'),
-            metrics=analysis_data.get('metrics', {}),
-            interpretation=analysis_data.get('interpretation'),
-            recommendations=analysis_data.get('recommendations')
+        """
+        Save analysis results for a test.
+
+        analysis_data holds analyzer_type, analyzer_version and the
+        analyzer output under payload. Rows from other versions of the
+        same analyzer are replaced.
+        """
+        analyzer_type = analysis_data.get('analyzer_type')
+        analyzer_version = analysis_data.get('analyzer_version', 1)
+        payload = analysis_data.get('payload') or {}
+
+        self._session.execute(
+            delete(TestAnalysis)
+            .where(
+                TestAnalysis.test_result_id == test_result_id,
+                TestAnalysis.analyzer_type == analyzer_type,
+                TestAnalysis.analyzer_version != analyzer_version
+            )
+            .execution_options(synchronize_session=False)
         )
-        self._session.add(analysis)
-        self._session.commit()
+
+        row = {
+            "id": uuid4(),
+            "test_result_id": test_result_id,
+            "analyzer_type": analyzer_type,
+            "analyzer_version": analyzer_version,
+            "metrics": analysis_data.get('metrics', payload.get('metrics', {})),
+            "interpretation": analysis_data.get('interpretation', payload.get('interpretation')),
+            "recommendations": analysis_data.get('recommendations', payload.get('recommendations')),
+            "payload": payload
+        }
+        stmt = upsert(self._session, TestAnalysis.__table__).values(row)
+        self._session.execute(stmt.on_conflict_do_update(
+            index_elements=['test_result_id', 'analyzer_type', 'analyzer_version'],
+            set_={
+                "metrics": stmt.excluded.metrics,
+                "interpretation": stmt.excluded.interpretation,
+                "recommendations": stmt.excluded.recommendations,
+                "payload": stmt.excluded.payload,
+                "updated_at": func.now()
+            }
+        ))
 
     def delete(self, id: UUID) -> None:
         """Delete a test definition"""
         model = self._session.query(TestDefinition).get(id)
         if model:
             self._session.delete(model)
-            self._session.commit()
\ No newline at end of file
+            self._session.flush()
+            self._definitions.invalidate(id)
+            self._definitions.bump_version(self._session)
\ No newline at end of file
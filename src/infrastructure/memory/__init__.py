@@ -0,0 +1,9 @@
+from .test_repository import InMemoryTestRepository
+from .athlete_repository import InMemoryAthleteRepository
+from .group_repository import InMemoryGroupRepository
+
+__all__ = [
+    'InMemoryTestRepository',
+    'InMemoryAthleteRepository',
+    'InMemoryGroupRepository'
+]
\ No newline at end of file
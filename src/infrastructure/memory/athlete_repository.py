@@ -0,0 +1,60 @@
+import threading
+from typing import Dict, List, Optional
+from uuid import UUID
+from datetime import date
+from domain.athlete.repository.athlete_repository import AthleteRepository
+from domain.athlete.entity.athlete import Athlete
+from domain.athlete.entity.value_objects import Name, Gender, AgeGroup
+
+class InMemoryAthleteRepository(AthleteRepository):
+    """AthleteRepository kept in process memory, for benchmarks and hermetic suites"""
+
+    def __init__(self):
+        self._athletes: Dict[UUID, Athlete] = {}
+        self._lock = threading.Lock()
+
+    def get(self, id: UUID) -> Optional[Athlete]:
+        return self._athletes.get(id)
+
+    def save(self, athlete: Athlete) -> Athlete:
+        with self._lock:
+            self._athletes[athlete.id] = athlete
+        return athlete
+
+    def find_by_name(self, name: Name) -> Optional[Athlete]:
+        return next((athlete for athlete in self._athletes.values()
+                     if athlete.name.first_name == name.first_name
+                     and athlete.name.last_name == name.last_name), None)
+
+    def find_by_email(self, email: str) -> Optional[Athlete]:
+        return next((athlete for athlete in self._athletes.values()
+                     if athlete.email and athlete.email.value == email), None)
+
+    def find_by_criteria(self,
+                        age_group: Optional[str] = None,
+                        gender: Optional[Gender] = None,
+                        sport: Optional[str] = None,
+                        custom_team: Optional[str] = None,
+                        as_of: Optional[date] = None) -> List[Athlete]:
+        as_of = as_of or date.today()
+        athletes = list(self._athletes.values())
+
+        if gender:
+            athletes = [athlete for athlete in athletes if athlete.gender == gender]
+        if sport:
+            athletes = [athlete for athlete in athletes if athlete.sport == sport]
+        if custom_team:
+            athletes = [athlete for athlete in athletes if athlete.custom_team == custom_team]
+        if age_group:
+            athletes = [athlete for athlete in athletes
+                        if athlete.custom_team == age_group
+                        or AgeGroup.for_age(athlete.age_on(as_of)).name == age_group]
+
+        return athletes
+
+    def find_active(self) -> List[Athlete]:
+        return [athlete for athlete in self._athletes.values() if athlete.is_active]
+
+    def delete(self, id: UUID) -> None:
+        with self._lock:
+            self._athletes.pop(id, None)
\ No newline at end of file
@@ -0,0 +1,114 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+from datetime import date
+from domain.groups.repository.group_repository import GroupRepository
+from domain.groups.entity.group import Group
+from domain.athlete.entity.athlete import Athlete
+from domain.athlete.entity.value_objects import Gender
+from .athlete_repository import InMemoryAthleteRepository
+
+class InMemoryGroupRepository(GroupRepository):
+    """
+    GroupRepository kept in process memory. Members are resolved through
+    the athlete repository, so only saved athletes are returned as group
+    athletes, as the SQL repository joins athletes.
+    """
+
+    def __init__(self, athletes: InMemoryAthleteRepository):
+        self._athletes = athletes
+        self._lock = threading.RLock()
+        self._groups: Dict[UUID, Group] = {}
+        # (athlete_id, group_id) -> is_primary
+        self._memberships: Dict[Tuple[UUID, UUID], bool] = {}
+
+    def find_natural_group(self, sport: str, gender: str, age: int) -> Optional[Group]:
+        return next((group for group in self._groups.values()
+                     if group.sport == sport and group.gender == gender and not group.is_custom
+                     and group.min_age is not None and group.min_age <= age <= group.max_age), None)
+
+    def create_group(self,
+                    name: str,
+                    type: str,
+                    sport: str,
+                    gender: str,
+                    age_range: dict,
+                    is_custom: bool = False) -> Group:
+        with self._lock:
+            if any((group.sport, group.gender, group.name) == (sport, gender, name)
+                   for group in self._groups.values()):
+                raise ValueError(f"Group already exists: {name}")
+            group = Group(
+                name=name,
+                type=type,
+                sport=sport,
+                gender=gender,
+                min_age=age_range.get('min') if age_range else None,
+                max_age=age_range.get('max') if age_range else None,
+                is_custom=is_custom,
+                id=uuid4()
+            )
+            self._groups[group.id] = group
+        return group
+
+    def add_to_group(self, athlete_id: UUID, group_id: UUID, is_primary: bool = True) -> None:
+        with self._lock:
+            self._memberships[(athlete_id, group_id)] = is_primary
+
+    def remove_primary_group(self, athlete_id: UUID) -> None:
+        with self._lock:
+            for key in [key for key, is_primary in self._memberships.items()
+                        if key[0] == athlete_id and is_primary]:
+                del self._memberships[key]
+
+    def get_athlete_groups(self, athlete_id: UUID) -> List[Group]:
+        return [self._groups[group_id] for member_id, group_id in list(self._memberships)
+                if member_id == athlete_id and group_id in self._groups]
+
+    def get_group_athletes(self, group_id: UUID) -> List[Athlete]:
+        athletes = (self._athletes.get(athlete_id) for athlete_id, member_group_id in list(self._memberships)
+                    if member_group_id == group_id)
+        return [athlete for athlete in athletes if athlete is not None]
+
+    def reassign_natural_groups(self, age_ranges: List[Dict], as_of: date) -> Dict[str, int]:
+        """Same rules as the SQL repository: the narrowest matching natural group wins"""
+        created = removed = assigned = 0
+        with self._lock:
+            targets: Dict[UUID, UUID] = {}
+            for athlete in self._athletes.find_by_criteria(as_of=as_of):
+                age = athlete.age_on(as_of)
+                gender = Gender(athlete.gender).value
+                candidates = [group for group in self._groups.values()
+                              if group.sport == athlete.sport and group.gender == gender
+                              and not group.is_custom and group.min_age is not None
+                              and group.min_age <= age <= group.max_age]
+                if not candidates:
+                    bracket = next((r for r in age_ranges if r['min'] <= age <= r['max']), None)
+                    if not bracket:
+                        continue
+                    candidates = [self.create_group(
+                        name=f"{athlete.sport} {gender} {bracket['name']}",
+                        type="natural",
+                        sport=athlete.sport,
+                        gender=gender,
+                        age_range={"min": bracket["min"], "max": bracket["max"]},
+                        is_custom=False
+                    )]
+                    created += 1
+                targets[athlete.id] = min(candidates, key=lambda group: group.max_age - group.min_age).id
+
+            for (athlete_id, group_id), is_primary in list(self._memberships.items()):
+                group = self._groups.get(group_id)
+                if is_primary and group and not group.is_custom and targets.get(athlete_id) != group_id:
+                    del self._memberships[(athlete_id, group_id)]
+                    removed += 1
+            for athlete_id, group_id in targets.items():
+                if not self._memberships.get((athlete_id, group_id)):
+                    self._memberships[(athlete_id, group_id)] = True
+                    assigned += 1
+
+        return {
+            "groups_created": created,
+            "memberships_removed": removed,
+            "memberships_assigned": assigned
+        }
\ No newline at end of file
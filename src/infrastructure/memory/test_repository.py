@@ -0,0 +1,402 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+from datetime import datetime
+import numpy as np
+from domain.testing.repository.test_repository import TestRepository
+from domain.testing.entity.test import Test, TestCategory, TestResult
+from domain.athlete.entity.value_objects import AgeGroup
+from domain.testing.service.analysis.common.metrics import ResultsMatrix, NormativeDistribution
+from .athlete_repository import InMemoryAthleteRepository
+from .group_repository import InMemoryGroupRepository
+
+class InMemoryTestRepository(TestRepository):
+    """
+    TestRepository kept in process memory.
+
+    Implements the SQLAlchemyTestRepository methods the services and
+    analyzers call, with the same return shapes, so performance suites can
+    run hermetically and small setups can run without a database server.
+    tests/integration/test_repository_contract.py runs both backends
+    through the same checks. Normative distributions need an athlete
+    repository to place results in sport/gender/age group cohorts, and
+    leaderboards rank the members of a group repository's groups.
+    """
+
+    # Metric columns a test can promote variables to, as in test_results
+    PROMOTED_SLOTS = 4
+    LEADERBOARD_METRICS = ('best', 'latest')
+
+    def __init__(self,
+                 athletes: Optional[InMemoryAthleteRepository] = None,
+                 groups: Optional[InMemoryGroupRepository] = None):
+        self._athletes = athletes
+        self._groups = groups
+        self._lock = threading.RLock()
+        self._tests: Dict[UUID, Test] = {}
+        self._promoted: Dict[UUID, Dict[str, int]] = {}
+        self._results: Dict[UUID, TestResult] = {}
+        # (athlete_id, test_id) -> results, newest first
+        self._history: Dict[Tuple[UUID, UUID], List[TestResult]] = {}
+        self._analyses: Dict[UUID, Dict[Tuple[str, int], Dict]] = {}
+        self._batches: Dict[UUID, Dict] = {}
+
+    # Test definitions
+
+    def get(self, id: UUID) -> Optional[Test]:
+        return self._tests.get(id)
+
+    def find_by_name(self, name: str) -> Optional[Test]:
+        return next((test for test in self._tests.values() if test.name == name), None)
+
+    def find_by_category(self, category: TestCategory) -> List[Test]:
+        return [test for test in self._tests.values() if test.category == category]
+
+    def find_with_benchmarks(self, test_id: UUID) -> Optional[Test]:
+        return self._tests.get(test_id)
+
+    def save(self, test: Test) -> Test:
+        with self._lock:
+            self._tests[test.id] = test
+        return test
+
+    def delete(self, id: UUID) -> None:
+        with self._lock:
+            self._tests.pop(id, None)
+
+    def promote_variable(self, test_id: UUID, variable_name: str) -> int:
+        """
+        Assign a variable a metric slot and return the slot. Values are
+        read from additional_values either way, so nothing is backfilled.
+        """
+        if test_id not in self._tests:
+            raise ValueError(f"Test not found: {test_id}")
+        with self._lock:
+            promoted = self._promoted.setdefault(test_id, {})
+            if variable_name in promoted:
+                return promoted[variable_name]
+
+            free_slots = [slot for slot in range(1, self.PROMOTED_SLOTS + 1)
+                          if slot not in promoted.values()]
+            if not free_slots:
+                raise ValueError(f"All {self.PROMOTED_SLOTS} metric slots are in use for test {test_id}")
+            promoted[variable_name] = free_slots[0]
+            return free_slots[0]
+
+    def demote_variable(self, test_id: UUID, variable_name: str) -> None:
+        with self._lock:
+            self._promoted.get(test_id, {}).pop(variable_name, None)
+
+    # Results
+
+    def save_result(self,
+                   test_id: UUID,
+                   athlete_id: UUID,
+                   values: Dict,
+                   test_date: Optional[datetime] = None) -> TestResult:
+        result = TestResult(
+            id=uuid4(),
+            athlete_id=athlete_id,
+            test_id=test_id,
+            value=values.get('primary_value'),
+            test_date=test_date or datetime.utcnow(),
+            additional_values=values,
+            phase=None
+        )
+        with self._lock:
+            self._results[result.id] = result
+            history = self._history.setdefault((athlete_id, test_id), [])
+            history.append(result)
+            history.sort(key=lambda item: item.test_date, reverse=True)
+            # A new result changes the analysis of the athlete's earlier ones
+            for earlier in history:
+                self._analyses.pop(earlier.id, None)
+        return result
+
+    def save_results_bulk(self,
+                         results: List[Dict],
+                         rejected: Optional[Dict[int, str]] = None,
+                         metadata: Optional[Dict] = None,
+                         chunk_size: int = 0) -> Dict:
+        rejected = rejected or {}
+        for item in results:
+            self.save_result(item['test_id'], item['athlete_id'], item['values'], item.get('test_date'))
+
+        errors = [{"item_index": index, "error": message}
+                  for index, message in sorted(rejected.items())]
+        batch = {
+            "batch_id": uuid4(),
+            "type": 'test_results',
+            "status": 'completed_with_errors' if errors else 'completed',
+            "total_items": len(results) + len(rejected),
+            "processed_items": len(results) + len(rejected),
+            "saved_items": len(results),
+            "failed_items": len(errors),
+            "errors": errors
+        }
+        with self._lock:
+            self._batches[batch["batch_id"]] = batch
+        return batch
+
+    def get_batch_operation(self, batch_id: UUID) -> Optional[Dict]:
+        return self._batches.get(batch_id)
+
+    def get_test_result(self, id: UUID) -> Optional[TestResult]:
+        return self._results.get(id)
+
+    def get_athlete_results(self,
+                          athlete_id: UUID,
+                          test_id: Optional[UUID] = None,
+                          time_period: Optional[tuple] = None,
+                          limit: int = 10) -> List[TestResult]:
+        if test_id:
+            results = self._history.get((athlete_id, test_id), [])
+        else:
+            results = sorted((result for (athlete, _), history in self._history.items()
+                              if athlete == athlete_id for result in history),
+                             key=lambda result: result.test_date, reverse=True)
+        return self._in_period(results, time_period)[:limit]
+
+    def get_athlete_history(self,
+                            athlete_id: UUID,
+                            test_id: Optional[UUID] = None,
+                            time_period: Optional[tuple] = None,
+                            limit: int = 10) -> List[Tuple[TestResult, Dict[Tuple[str, int], Dict]]]:
+        return [(result, dict(self._analyses.get(result.id, {})))
+                for result in self.get_athlete_results(athlete_id, test_id, time_period, limit)]
+
+    def find_results_by_variable(self,
+                                test_id: UUID,
+                                variable_name: str,
+                                athlete_ids: Optional[List[UUID]] = None,
+                                time_period: Optional[tuple] = None,
+                                value_range: Optional[tuple] = None,
+                                limit: int = 100) -> List[TestResult]:
+        results = sorted(self._variable_results(test_id, variable_name, athlete_ids, time_period, value_range),
+                         key=lambda result: result.test_date, reverse=True)
+        return results[:limit]
+
+    def aggregate_variable(self,
+                          test_id: UUID,
+                          variable_name: str,
+                          athlete_ids: Optional[List[UUID]] = None,
+                          time_period: Optional[tuple] = None,
+                          value_range: Optional[tuple] = None) -> Dict:
+        values = np.array([float(result.additional_values[variable_name])
+                           for result in self._variable_results(test_id, variable_name, athlete_ids,
+                                                                time_period, value_range)])
+        if not len(values):
+            return {"count": 0}
+        return {
+            "count": len(values),
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            "min": float(values.min()),
+            "max": float(values.max())
+        }
+
+    def _variable_results(self, test_id, variable_name, athlete_ids, time_period, value_range):
+        athletes = set(athlete_ids) if athlete_ids else None
+        min_value, max_value = value_range or (None, None)
+        for (athlete_id, result_test), history in self._history.items():
+            if result_test != test_id or (athletes is not None and athlete_id not in athletes):
+                continue
+            for result in self._in_period(history, time_period):
+                value = result.additional_values.get(variable_name)
+                if value is None:
+                    continue
+                if min_value is not None and value < min_value:
+                    continue
+                if max_value is not None and value > max_value:
+                    continue
+                yield result
+
+    @staticmethod
+    def _in_period(results: List[TestResult], time_period: Optional[tuple]) -> List[TestResult]:
+        if not time_period:
+            return list(results)
+        start_date, end_date = time_period
+        return [result for result in results
+                if (not start_date or result.test_date >= start_date)
+                and (not end_date or result.test_date <= end_date)]
+
+    def get_results_matrix(self,
+                          athlete_ids: List[UUID],
+                          test_ids: List[UUID],
+                          time_period: Optional[tuple] = None,
+                          max_results: Optional[int] = None) -> ResultsMatrix:
+        athlete_ids = list(athlete_ids)
+        test_ids = list(test_ids)
+        series = [[self._in_period(self._history.get((athlete_id, test_id), []), time_period)[:max_results]
+                   for test_id in test_ids] for athlete_id in athlete_ids]
+        depth = max((len(results) for row in series for results in row), default=0)
+
+        shape = (len(athlete_ids), len(test_ids), depth)
+        values = np.full(shape, np.nan)
+        dates = np.full(shape, np.datetime64('NaT'), dtype='datetime64[s]')
+        mask = np.zeros(shape, dtype=bool)
+        for i, row in enumerate(series):
+            for j, results in enumerate(row):
+                count = len(results)
+                values[i, j, :count] = [result.value for result in results]
+                dates[i, j, :count] = np.array([result.test_date for result in results], dtype='datetime64[s]')
+                mask[i, j, :count] = True
+
+        return ResultsMatrix(
+            athlete_ids=athlete_ids,
+            test_ids=test_ids,
+            values=values,
+            dates=dates,
+            mask=mask
+        )
+
+    def get_latest_results(self,
+                           athlete_ids: List[UUID],
+                           test_ids: List[UUID],
+                           as_of: Optional[datetime] = None) -> ResultsMatrix:
+        matrix = self.get_results_matrix(athlete_ids, test_ids, time_period=(None, as_of), max_results=1)
+        if matrix.values.shape[2]:
+            return matrix
+        shape = matrix.values.shape[:2] + (1,)
+        return ResultsMatrix(
+            athlete_ids=matrix.athlete_ids,
+            test_ids=matrix.test_ids,
+            values=np.full(shape, np.nan),
+            dates=np.full(shape, np.datetime64('NaT'), dtype='datetime64[s]'),
+            mask=np.zeros(shape, dtype=bool)
+        )
+
+    # Summaries and norms
+
+    def get_result_summary(self, athlete_id: UUID, test_id: UUID) -> Optional[Dict]:
+        history = self._history.get((athlete_id, test_id))
+        if not history:
+            return None
+        values = [result.value for result in history]
+        return {
+            "athlete_id": athlete_id,
+            "test_id": test_id,
+            "count": len(values),
+            "mean": sum(values) / len(values),
+            "min": min(values),
+            "max": max(values),
+            "latest_value": history[0].value,
+            "first_test_date": history[-1].test_date,
+            "latest_test_date": history[0].test_date
+        }
+
+    def get_athlete_summaries(self, athlete_id: UUID) -> List[Dict]:
+        return [self.get_result_summary(athlete, test)
+                for athlete, test in list(self._history) if athlete == athlete_id]
+
+    def get_normative_distribution(self,
+                                   test_id: UUID,
+                                   sport: str,
+                                   gender: str,
+                                   age_group: str) -> NormativeDistribution:
+        """Built on each call from every athlete's latest result; fine at in-memory sizes"""
+        samples = []
+        for (athlete_id, result_test), history in self._history.items():
+            athlete = self._athletes.get(athlete_id) if self._athletes else None
+            if result_test != test_id or athlete is None:
+                continue
+            latest = history[0]
+            if (athlete.sport == sport and athlete.gender == gender
+                    and AgeGroup.for_age(athlete.age_on(latest.test_date.date())).name == age_group):
+                samples.append(latest.value)
+        return NormativeDistribution(samples)
+
+    # Leaderboards
+
+    def get_leaderboard(self,
+                        group_id: UUID,
+                        test_id: UUID,
+                        limit: int = 10,
+                        metric: str = 'best',
+                        higher_is_better: bool = True) -> List[Dict]:
+        board = self._board(group_id, test_id, metric, higher_is_better)
+        return [self._leaderboard_entry(entry, position)
+                for position, entry in enumerate(board[:limit], 1)]
+
+    def get_leaderboard_standing(self,
+                                 group_id: UUID,
+                                 test_id: UUID,
+                                 athlete_id: UUID,
+                                 neighbors: int = 0,
+                                 metric: str = 'best',
+                                 higher_is_better: bool = True) -> Optional[Dict]:
+        board = self._board(group_id, test_id, metric, higher_is_better)
+        index = next((i for i, entry in enumerate(board) if entry[0] == athlete_id), None)
+        if index is None:
+            return None
+
+        value = board[index][1]
+        better = sum(1 for entry in board
+                     if (entry[1] > value if higher_is_better else entry[1] < value))
+        standing = {
+            **self._leaderboard_entry(board[index], index + 1),
+            "rank": better + 1,
+            "board_size": len(board)
+        }
+        if neighbors:
+            start = max(index - neighbors, 0)
+            standing["above"] = [self._leaderboard_entry(entry, position)
+                                 for position, entry in enumerate(board[start:index], start + 1)]
+            standing["below"] = [self._leaderboard_entry(entry, position)
+                                 for position, entry in enumerate(board[index + 1:index + 1 + neighbors],
+                                                                  index + 2)]
+        return standing
+
+    def _board(self,
+               group_id: UUID,
+               test_id: UUID,
+               metric: str,
+               higher_is_better: bool) -> List[Tuple[UUID, float, datetime]]:
+        """(athlete_id, value, latest_test_date) of each member with results, in board order"""
+        if metric not in self.LEADERBOARD_METRICS:
+            raise ValueError(f"Unknown leaderboard metric: {metric}")
+        board = []
+        members = self._groups.get_group_athletes(group_id) if self._groups else []
+        for athlete_id in (athlete.id for athlete in members):
+            history = self._history.get((athlete_id, test_id))
+            if not history:
+                continue
+            if metric == 'latest':
+                value = history[0].value
+            else:
+                values = [result.value for result in history]
+                value = max(values) if higher_is_better else min(values)
+            board.append((athlete_id, value, history[0].test_date))
+        # Ties are broken by athlete id, as on the SQL boards
+        board.sort(key=lambda entry: entry[0])
+        board.sort(key=lambda entry: entry[1], reverse=higher_is_better)
+        return board
+
+    @staticmethod
+    def _leaderboard_entry(entry: Tuple[UUID, float, datetime], position: int) -> Dict:
+        athlete_id, value, latest_test_date = entry
+        return {
+            "position": position,
+            "athlete_id": athlete_id,
+            "value": value,
+            "latest_test_date": latest_test_date
+        }
+
+    # Analyses
+
+    def get_analysis(self,
+                     test_result_id: UUID,
+                     analyzer_type: str,
+                     analyzer_version: int) -> Optional[Dict]:
+        return self._analyses.get(test_result_id, {}).get((analyzer_type, analyzer_version))
+
+    def save_analysis(self,
+                     test_result_id: UUID,
+                     analysis_data: Dict) -> None:
+        analyzer_type = analysis_data.get('analyzer_type')
+        analyzer_version = analysis_data.get('analyzer_version', 1)
+        with self._lock:
+            stored = self._analyses.setdefault(test_result_id, {})
+            for key in [key for key in stored if key[0] == analyzer_type]:
+                del stored[key]
+            stored[(analyzer_type, analyzer_version)] = analysis_data.get('payload') or {}
\ No newline at end of file
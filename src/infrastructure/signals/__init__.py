@@ -0,0 +1,7 @@
+from .signal_store import SIGNAL_CHUNK_SIZE, SignalInfo, SignalStore
+
+__all__ = [
+    'SIGNAL_CHUNK_SIZE',
+    'SignalInfo',
+    'SignalStore'
+]
\ No newline at end of file
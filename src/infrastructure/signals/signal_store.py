@@ -0,0 +1,173 @@
+import os
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+
+# Samples per independently compressed chunk
+SIGNAL_CHUNK_SIZE = 65536
+
+SIGNAL_DTYPE = np.dtype('<f4')
+
+_MAGIC = b'ASIG'
+_VERSION = 1
+# magic, version, sample rate, chunk size, sample count, chunk count
+_HEADER = struct.Struct('<4sHdIQI')
+_NAME_PATTERN = re.compile(r'^[a-z0-9_]{1,64}$')
+
+@dataclass(frozen=True)
+class SignalInfo:
+    sample_rate: float
+    sample_count: int
+    chunk_size: int
+    chunk_count: int
+    byte_size: int
+
+class SignalStore:
+    """
+    Raw force and velocity traces as compressed, chunked float32 files.
+
+    Each chunk stores the float32 bit patterns delta-encoded as int32,
+    byte-shuffled and zlib-compressed, so it round-trips exactly and can be
+    decoded on its own: range reads only inflate the chunks they cover.
+    open() decodes a signal once into an uncompressed .npy under cache_root
+    and returns a read-only memory map of it, so repeated reads are
+    zero-copy.
+    """
+
+    def __init__(self,
+                 root: str,
+                 cache_root: Optional[str] = None,
+                 chunk_size: int = SIGNAL_CHUNK_SIZE,
+                 compression_level: int = 6):
+        self._root = root
+        self._cache_root = cache_root or os.path.join(root, '.decoded')
+        self._chunk_size = chunk_size
+        self._compression_level = compression_level
+
+    @staticmethod
+    def key(test_result_id, name: str) -> str:
+        """Storage key of one named signal of a test result"""
+        if not _NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid signal name: {name}")
+        result_id = str(test_result_id)
+        return f"{result_id[:2]}/{result_id}/{name}"
+
+    def write(self, key: str, samples, sample_rate: float) -> SignalInfo:
+        """Write a signal atomically, replacing any previous version"""
+        values = np.ascontiguousarray(samples, dtype=SIGNAL_DTYPE).ravel()
+        chunks = [self._encode_chunk(values[start:start + self._chunk_size])
+                  for start in range(0, len(values), self._chunk_size)]
+        offsets = np.zeros(len(chunks) + 1, dtype='<u8')
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as handle:
+            handle.write(_HEADER.pack(_MAGIC, _VERSION, sample_rate, self._chunk_size,
+                                      len(values), len(chunks)))
+            handle.write(offsets.tobytes())
+            for chunk in chunks:
+                handle.write(chunk)
+        os.replace(temporary, path)
+        self._remove(self._cache_path(key))
+
+        return SignalInfo(
+            sample_rate=sample_rate,
+            sample_count=len(values),
+            chunk_size=self._chunk_size,
+            chunk_count=len(chunks),
+            byte_size=os.path.getsize(path)
+        )
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def info(self, key: str) -> SignalInfo:
+        path = self._path(key)
+        with open(path, 'rb') as handle:
+            sample_rate, chunk_size, sample_count, chunk_count = self._read_header(handle)
+        return SignalInfo(sample_rate, sample_count, chunk_size, chunk_count, os.path.getsize(path))
+
+    def read(self, key: str, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Samples [start, stop), decoding only the chunks that cover them"""
+        with open(self._path(key), 'rb') as handle:
+            _, chunk_size, sample_count, chunk_count = self._read_header(handle)
+            start, stop, _ = slice(start, stop).indices(sample_count)
+            if stop <= start:
+                return np.empty(0, dtype=SIGNAL_DTYPE)
+
+            offsets = np.frombuffer(handle.read(8 * (chunk_count + 1)), dtype='<u8')
+            data_start = handle.tell()
+            first, last = start // chunk_size, (stop - 1) // chunk_size
+            handle.seek(data_start + int(offsets[first]))
+            data = handle.read(int(offsets[last + 1] - offsets[first]))
+
+        parts = [self._decode_chunk(data[int(offsets[chunk] - offsets[first]):
+                                         int(offsets[chunk + 1] - offsets[first])])
+                 for chunk in range(first, last + 1)]
+        values = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        base = first * chunk_size
+        return values[start - base:stop - base]
+
+    def open(self, key: str) -> np.ndarray:
+        """Read-only memory-mapped view of the whole signal"""
+        source = self._path(key)
+        cached = self._cache_path(key)
+        if (not os.path.exists(cached)
+                or os.path.getmtime(cached) < os.path.getmtime(source)):
+            self._materialize(key, source, cached)
+        return np.load(cached, mmap_mode='r')
+
+    def delete(self, key: str) -> None:
+        self._remove(self._path(key))
+        self._remove(self._cache_path(key))
+
+    def _materialize(self, key: str, source: str, cached: str) -> None:
+        """Decode chunk by chunk into a .npy, so memory use stays one chunk"""
+        info = self.info(key)
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        temporary = f"{cached}.{os.getpid()}.tmp.npy"
+        decoded = np.lib.format.open_memmap(temporary, mode='w+', dtype=SIGNAL_DTYPE,
+                                            shape=(info.sample_count,))
+        for start in range(0, info.sample_count, info.chunk_size):
+            decoded[start:start + info.chunk_size] = self.read(key, start, start + info.chunk_size)
+        decoded.flush()
+        del decoded
+        os.replace(temporary, cached)
+
+    def _encode_chunk(self, values: np.ndarray) -> bytes:
+        # int32 deltas wrap on overflow and cumsum wraps back, so this is lossless
+        delta = np.diff(values.view('<i4'), prepend=np.int32(0))
+        shuffled = delta.view(np.uint8).reshape(-1, 4).T
+        return zlib.compress(shuffled.tobytes(), self._compression_level)
+
+    @staticmethod
+    def _decode_chunk(data: bytes) -> np.ndarray:
+        shuffled = np.frombuffer(zlib.decompress(data), dtype=np.uint8).reshape(4, -1)
+        delta = np.ascontiguousarray(shuffled.T).view('<i4').ravel()
+        return np.cumsum(delta, dtype='<i4').view(SIGNAL_DTYPE)
+
+    @staticmethod
+    def _read_header(handle):
+        magic, version, sample_rate, chunk_size, sample_count, chunk_count = _HEADER.unpack(
+            handle.read(_HEADER.size))
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Not a signal file: {handle.name}")
+        return sample_rate, chunk_size, sample_count, chunk_count
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._root, key + '.sig')
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self._cache_root, key + '.npy')
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
\ No newline at end of file
@@ -1,21 +1,52 @@
-from flask import Blueprint, request, jsonify, current_app
+from contextlib import contextmanager
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from marshmallow import ValidationError
 from datetime import datetime
+from uuid import UUID
+import numpy as np
 from .schemas import (
     TestResultSchema, 
     TestAnalysisSchema,
     BatchUploadSchema,
+    ForceTraceUploadSchema,
+    JumpTraceUploadSchema,
+    AnalysisBatchSchema,
+    SignalUploadSchema,
+    SquadSprintSchema,
     TestFilterSchema,
     AnalysisRequestSchema
 )
 from domain.testing.service.test_management_service import TestManagementService
 from domain.testing.service.test_analysis_service import TestAnalysisService
+from application.test.queries.export_results import (
+    CONTENT_TYPES,
+    ExportResultsHandler,
+    ExportResultsQuery
+)
+from infrastructure.database.repositories.async_test_repository import (
+    async_repository_factory,
+    read_repository_factory
+)
+from infrastructure.database.repositories.test_repository import SQLAlchemyTestRepository
+from infrastructure.database.repositories.signal_repository import SignalRepository
+from infrastructure.database.repositories.group_repository import GroupRepository
+
+@contextmanager
+def read_repository():
+    """Test repository on a read replica session for the current request"""
+    with read_repository_factory(current_app.db)() as repository:
+        yield repository
 
-testing_bp = Blueprint('testing', __name__, url_prefix='/api/testing')
+def init_testing_routes(test_management_service: TestManagementService):
+    """
+    Register the testing routes.
+
+    Writes go through test_management_service on the request's session;
+    read-only analysis endpoints build their services per request on a
+    read replica session.
+    """
+    testing_bp = Blueprint('testing', __name__, url_prefix='/api/testing')
 
-def init_testing_routes(test_management_service: TestManagementService, 
-                       test_analysis_service: TestAnalysisService):
-    
     @testing_bp.route('/tests', methods=['GET'])
     def get_available_tests():
         """Get all available test types"""
@@ -60,11 +91,12 @@ def init_testing_routes(test_management_service: TestManagementService,
             if filters.get('start_date') and filters.get('end_date'):
                 time_period = (filters['start_date'], filters['end_date'])
             
-            progress = test_analysis_service.get_athlete_progress(
-                athlete_id=athlete_id,
-                test_id=test_id,
-                time_period=time_period
-            )
+            with read_repository() as repository:
+                progress = TestAnalysisService(repository).get_athlete_progress(
+                    athlete_id=athlete_id,
+                    test_id=test_id,
+                    time_period=time_period
+                )
             
             return jsonify(progress)
             
@@ -74,12 +106,172 @@ def init_testing_routes(test_management_service: TestManagementService,
             current_app.logger.error(f"Error getting athlete progress: {str(e)}")
             return jsonify({"error": "Failed to fetch progress"}), 500
 
+    @testing_bp.route('/athletes/<athlete_id>/tests/<test_id>/summary', methods=['GET'])
+    def get_athlete_summary(athlete_id, test_id):
+        """Get athlete's rollup (latest, best, count, mean) for a test"""
+        try:
+            with read_repository() as repository:
+                summary = TestAnalysisService(repository).get_athlete_summary(UUID(athlete_id), UUID(test_id))
+            if not summary:
+                return jsonify({"error": "No results found"}), 404
+            return jsonify(summary)
+        except ValueError:
+            return jsonify({"error": "Invalid id"}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error getting athlete summary: {str(e)}")
+            return jsonify({"error": "Failed to fetch summary"}), 500
+
+    @testing_bp.route('/groups/<group_id>/tests/<test_id>/leaderboard', methods=['GET'])
+    def get_leaderboard(group_id, test_id):
+        """Get the top entries of a group's board for a test"""
+        try:
+            with read_repository() as repository:
+                board = TestAnalysisService(repository).get_leaderboard(
+                    UUID(group_id), UUID(test_id),
+                    limit=request.args.get('limit', 10, type=int),
+                    metric=request.args.get('metric', 'best'),
+                    higher_is_better=request.args.get('order', 'desc') != 'asc'
+                )
+            return jsonify(board)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error getting leaderboard: {str(e)}")
+            return jsonify({"error": "Failed to fetch leaderboard"}), 500
+
+    @testing_bp.route('/groups/<group_id>/tests/<test_id>/leaderboard/<athlete_id>', methods=['GET'])
+    def get_leaderboard_standing(group_id, test_id, athlete_id):
+        """Get an athlete's rank on a group's board and the entries around it"""
+        try:
+            with read_repository() as repository:
+                standing = TestAnalysisService(repository).get_leaderboard_standing(
+                    UUID(group_id), UUID(test_id), UUID(athlete_id),
+                    neighbors=request.args.get('neighbors', 2, type=int),
+                    metric=request.args.get('metric', 'best'),
+                    higher_is_better=request.args.get('order', 'desc') != 'asc'
+                )
+            if not standing:
+                return jsonify({"error": "Athlete is not on this leaderboard"}), 404
+            return jsonify(standing)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error getting leaderboard standing: {str(e)}")
+            return jsonify({"error": "Failed to fetch leaderboard standing"}), 500
+
+    @testing_bp.route('/groups/<group_id>/rankings', methods=['GET'])
+    def get_group_rankings(group_id):
+        """Rank every member of a group on the requested tests (?test_id=...&test_id=...)"""
+        try:
+            test_ids = [UUID(test_id) for test_id in request.args.getlist('test_id')]
+            with current_app.db.read_session() as session:
+                rankings = TestManagementService(
+                    SQLAlchemyTestRepository(session),
+                    group_repository=GroupRepository(session)
+                ).rank_group(UUID(group_id), test_ids)
+            return jsonify(rankings)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error ranking group: {str(e)}")
+            return jsonify({"error": "Failed to rank group"}), 500
+
+    @testing_bp.route('/results/export', methods=['GET'])
+    def export_results():
+        """Stream results as CSV or NDJSON, filtered by group, test, sport and dates"""
+        try:
+            query = ExportResultsQuery(
+                format=request.args.get('format', 'csv'),
+                group_id=UUID(request.args['group_id']) if 'group_id' in request.args else None,
+                test_id=UUID(request.args['test_id']) if 'test_id' in request.args else None,
+                sport=request.args.get('sport'),
+                start_date=datetime.fromisoformat(request.args['start_date']) if 'start_date' in request.args else None,
+                end_date=datetime.fromisoformat(request.args['end_date']) if 'end_date' in request.args else None
+            )
+            chunks = ExportResultsHandler(read_repository_factory(current_app.db)).handle(query)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return Response(
+            stream_with_context(chunks),
+            mimetype=CONTENT_TYPES[query.format],
+            headers={"Content-Disposition": f"attachment; filename=test_results.{query.format}"}
+        )
+
+    @testing_bp.route('/results/<result_id>/signals', methods=['GET'])
+    def list_signals(result_id):
+        """List the raw traces stored for a test result"""
+        try:
+            with current_app.db.read_session() as session:
+                signals = SignalRepository(session, current_app.signal_store).list(UUID(result_id))
+            return jsonify(signals)
+        except ValueError:
+            return jsonify({"error": "Invalid result id"}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error listing signals: {str(e)}")
+            return jsonify({"error": "Failed to list signals"}), 500
+
+    @testing_bp.route('/results/<result_id>/signals/<name>', methods=['PUT'])
+    def save_signal(result_id, name):
+        """
+        Store a raw trace, as JSON or as little-endian float32 bytes
+        (application/octet-stream with a sample_rate query parameter)
+        """
+        try:
+            if request.mimetype == 'application/octet-stream':
+                samples = np.frombuffer(request.get_data(), dtype='<f4')
+                sample_rate = float(request.args['sample_rate'])
+            else:
+                data = SignalUploadSchema().load(request.json)
+                samples, sample_rate = data['samples'], data['sample_rate']
+
+            repository = SignalRepository(current_app.db.session_factory(), current_app.signal_store)
+            signal = repository.save(UUID(result_id), name, samples, sample_rate)
+            return jsonify(signal), 201
+
+        except ValidationError as err:
+            return jsonify({"errors": err.messages}), 400
+        except (KeyError, ValueError) as e:
+            return jsonify({"error": f"Invalid signal: {e}"}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error saving signal: {str(e)}")
+            return jsonify({"error": "Failed to save signal"}), 500
+
+    @testing_bp.route('/results/<result_id>/signals/<name>', methods=['GET'])
+    def get_signal(result_id, name):
+        """Samples [start, stop) of a trace as little-endian float32 bytes"""
+        try:
+            repository = SignalRepository(current_app.db.session_factory(), current_app.signal_store)
+            samples = repository.read(
+                UUID(result_id),
+                name,
+                start=request.args.get('start', 0, type=int),
+                stop=request.args.get('stop', None, type=int)
+            )
+            if samples is None:
+                return jsonify({"error": "Signal not found"}), 404
+            return Response(samples.tobytes(), mimetype='application/octet-stream')
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error reading signal: {str(e)}")
+            return jsonify({"error": "Failed to read signal"}), 500
+
     @testing_bp.route('/tests/<test_id>/analysis', methods=['GET'])
     def get_test_analysis(test_id):
         """Get analysis for a specific test result"""
         try:
-            result = test_analysis_service.get_analysis(test_id)
+            result_id = UUID(test_id)
+            with read_repository() as repository:
+                result = TestManagementService(repository).get_stored_test_analysis(result_id)
+            if result is None:
+                # Not analyzed yet: run it on the primary so the analysis is stored
+                result = test_management_service.get_test_analysis(result_id)
+            if result is None:
+                return jsonify({"error": "Analysis not found"}), 404
             return jsonify(TestAnalysisSchema().dump(result))
+        except ValueError:
+            return jsonify({"error": "Invalid result id"}), 400
         except Exception as e:
             current_app.logger.error(f"Error getting test analysis: {str(e)}")
             return jsonify({"error": "Failed to fetch analysis"}), 500
@@ -101,10 +293,118 @@ def init_testing_routes(test_management_service: TestManagementService,
             
         except ValidationError as err:
             return jsonify({"errors": err.messages}), 400
+        except ValueError as err:
+            return jsonify({"error": str(err)}), 400
         except Exception as e:
             current_app.logger.error(f"Error processing batch upload: {str(e)}")
             return jsonify({"error": "Failed to process batch upload"}), 500
 
+    @testing_bp.route('/athletes/<athlete_id>/analysis/batch', methods=['POST'])
+    def analyze_test_batch(athlete_id):
+        """Analyze several of an athlete's results concurrently"""
+        try:
+            data = AnalysisBatchSchema().load(request.json)
+            analyses = current_app.db.run_async(
+                test_management_service.analyze_test_batch(UUID(athlete_id), data['results'])
+            )
+            return jsonify(analyses)
+
+        except ValidationError as err:
+            return jsonify({"errors": err.messages}), 400
+        except ValueError as err:
+            return jsonify({"error": str(err)}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error analyzing test batch: {str(e)}")
+            return jsonify({"error": "Failed to analyze test batch"}), 500
+
+    @testing_bp.route('/imtp/traces', methods=['POST'])
+    def analyze_imtp_traces():
+        """Analyze a session of raw IMTP force-time traces"""
+        try:
+            data = ForceTraceUploadSchema().load(request.json)
+            trials = data['trials']
+
+            analyses = test_management_service.analyze_imtp_traces(
+                athlete_ids=[trial['athlete_id'] for trial in trials],
+                traces=[trial['force'] for trial in trials],
+                sample_rate=data['sample_rate'],
+                body_masses=[trial.get('body_mass') for trial in trials],
+                test_date=data.get('test_date'),
+                test_id=data.get('test_id')
+            )
+
+            return jsonify(analyses)
+
+        except ValidationError as err:
+            return jsonify({"errors": err.messages}), 400
+        except ValueError as err:
+            return jsonify({"error": str(err)}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error analyzing IMTP traces: {str(e)}")
+            return jsonify({"error": "Failed to analyze IMTP traces"}), 500
+
+    @testing_bp.route('/athletes/<athlete_id>/jumps/traces', methods=['POST'])
+    def analyze_jump_traces(athlete_id):
+        """Analyze an athlete's raw CMJ, drop jump and loaded jump traces"""
+        try:
+            data = JumpTraceUploadSchema().load(request.json)
+            drop_jumps = data.get('drop_jumps', [])
+            loaded_jumps = data.get('loaded_jumps', [])
+
+            analysis = test_management_service.analyze_jump_traces(
+                sample_rate=data['sample_rate'],
+                cmj_traces=[jump['force'] for jump in data['cmj']],
+                drop_jump_traces=[jump['force'] for jump in drop_jumps],
+                drop_heights=[jump.get('drop_height') for jump in drop_jumps],
+                body_mass=data.get('body_mass'),
+                loaded_jump_traces=[jump['force'] for jump in loaded_jumps],
+                added_weights=[jump.get('added_weight') for jump in loaded_jumps],
+                test_id=data.get('test_id')
+            )
+
+            return jsonify({"athlete_id": athlete_id, **analysis})
+
+        except ValidationError as err:
+            return jsonify({"errors": err.messages}), 400
+        except ValueError as err:
+            return jsonify({"error": str(err)}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error analyzing jump traces: {str(e)}")
+            return jsonify({"error": "Failed to analyze jump traces"}), 500
+
+    @testing_bp.route('/sprints/squad', methods=['POST'])
+    def analyze_squad_sprints():
+        """Sprint profiles for a squad from each athlete's latest splits"""
+        try:
+            data = SquadSprintSchema().load(request.json)
+            analysis = test_management_service.analyze_squad_sprints(
+                athlete_ids=data['athlete_ids'],
+                test_date=data.get('test_date')
+            )
+            return jsonify(analysis)
+
+        except ValidationError as err:
+            return jsonify({"errors": err.messages}), 400
+        except ValueError as err:
+            return jsonify({"error": str(err)}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error analyzing squad sprints: {str(e)}")
+            return jsonify({"error": "Failed to analyze squad sprints"}), 500
+
+    @testing_bp.route('/results/batch/<batch_id>', methods=['GET'])
+    def get_batch_status(batch_id):
+        """Get progress and per-item errors of a batch upload"""
+        try:
+            batch = test_management_service.get_batch_status(UUID(batch_id))
+            if not batch:
+                return jsonify({"error": "Batch not found"}), 404
+            return jsonify(batch)
+        except ValueError:
+            return jsonify({"error": "Invalid batch id"}), 400
+        except Exception as e:
+            current_app.logger.error(f"Error getting batch status: {str(e)}")
+            return jsonify({"error": "Failed to fetch batch status"}), 500
+
     @testing_bp.errorhandler(Exception)
     def handle_error(error):
         """Global error handler for testing blueprint"""
@@ -114,4 +414,20 @@ def init_testing_routes(test_management_service: TestManagementService,
             "message": str(error)
         }), 500
 
-    return testing_bp
\ No newline at end of file
+    return testing_bp
+
+def setup_routes(app):
+    """
+    Build the testing services on the app's database and register the routes.
+
+    Batch analysis gets its own async session per task and a read replica
+    session per executor job, so it runs concurrently.
+    """
+    database = app.db
+    test_management_service = TestManagementService(
+        SQLAlchemyTestRepository(database.session_factory),
+        async_repository_factory=async_repository_factory(database),
+        analysis_repository_factory=read_repository_factory(database),
+        group_repository=GroupRepository(database.session_factory)
+    )
+    app.register_blueprint(init_testing_routes(test_management_service))
\ No newline at end of file
@@ -27,6 +27,17 @@ class TestAnalysisSchema(Schema):
     recommendations = fields.Dict(required=True)
     trend = fields.Dict(required=False)
 
+class AnalysisBatchItemSchema(Schema):
+    """Schema for one result in a batch analysis request"""
+    test_id = fields.UUID(required=True)
+    primary_value = fields.Float(required=True)
+    additional_values = fields.Dict(keys=fields.String(), values=fields.Float(), required=False)
+    test_date = fields.DateTime(required=False)
+
+class AnalysisBatchSchema(Schema):
+    """Schema for analyzing several of an athlete's results at once"""
+    results = fields.List(fields.Nested(AnalysisBatchItemSchema), required=True, validate=validate.Length(min=1))
+
 class GroupSchema(Schema):
     """Schema for group data validation"""
     name = fields.String(required=True)
@@ -70,4 +81,42 @@ class AnalysisRequestSchema(Schema):
     time_period = fields.Tuple((fields.DateTime(), fields.DateTime()), required=False)
     analysis_type = fields.String(required=True, 
                                 validate=validate.OneOf(['single', 'comparative', 'trend']))
-    comparison_group = fields.UUID(required=False)  # group_id for comparative analysis
\ No newline at end of file
+    comparison_group = fields.UUID(required=False)  # group_id for comparative analysis
+
+class ForceTraceSchema(Schema):
+    """Schema for one raw force-plate trial"""
+    athlete_id = fields.UUID(required=True)
+    force = fields.List(fields.Float(), required=True, validate=validate.Length(min=1))  # N
+    body_mass = fields.Float(required=False, allow_none=True)  # kg
+
+class ForceTraceUploadSchema(Schema):
+    """Schema for a session of raw force-plate trials"""
+    sample_rate = fields.Float(required=True, validate=validate.Range(min=1))  # Hz
+    test_id = fields.UUID(required=False)  # filters raw traces per the test protocol
+    test_date = fields.DateTime(required=False)
+    trials = fields.List(fields.Nested(ForceTraceSchema), required=True, validate=validate.Length(min=1))
+
+class JumpTraceSchema(Schema):
+    """Schema for one raw force-plate jump"""
+    force = fields.List(fields.Float(), required=True, validate=validate.Length(min=1))  # N
+    drop_height = fields.Float(required=False, allow_none=True)  # m, drop jumps
+    added_weight = fields.Float(required=False, allow_none=True)  # kg, loaded jumps
+
+class JumpTraceUploadSchema(Schema):
+    """Schema for one athlete's session of raw force-plate jumps"""
+    sample_rate = fields.Float(required=True, validate=validate.Range(min=1))  # Hz
+    test_id = fields.UUID(required=False)  # filters raw traces per the test protocol
+    body_mass = fields.Float(required=False, allow_none=True)  # kg
+    cmj = fields.List(fields.Nested(JumpTraceSchema), required=True, validate=validate.Length(min=1))
+    drop_jumps = fields.List(fields.Nested(JumpTraceSchema), required=False)
+    loaded_jumps = fields.List(fields.Nested(JumpTraceSchema), required=False)
+
+class SignalUploadSchema(Schema):
+    """Schema for storing a raw trace of a test result"""
+    sample_rate = fields.Float(required=True, validate=validate.Range(min=0, min_inclusive=False))  # Hz
+    samples = fields.List(fields.Float(allow_nan=True), required=True, validate=validate.Length(min=1))
+
+class SquadSprintSchema(Schema):
+    """Schema for profiling a squad from timing-gate splits"""
+    athlete_ids = fields.List(fields.UUID(), required=True, validate=validate.Length(min=1))
+    test_date = fields.DateTime(required=False)  # latest splits on or before this date
\ No newline at end of file
@@ -0,0 +1,29 @@
+import os
+import sys
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+# Application modules import each other from the src root, as src/app.py does
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+@pytest.fixture
+def sqlite_engine():
+    """In-memory SQLite database with the full schema"""
+    from infrastructure.database.models.batch import BatchOperation, BatchResult
+    from infrastructure.database.models.test import TestResult
+
+    engine = create_engine('sqlite://', poolclass=StaticPool,
+                           connect_args={'check_same_thread': False})
+    # Most models are declared on the Flask-SQLAlchemy metadata, batches on Base
+    TestResult.metadata.create_all(engine)
+    BatchOperation.metadata.create_all(engine, tables=[BatchOperation.__table__, BatchResult.__table__])
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def sqlite_session(sqlite_engine):
+    session = Session(sqlite_engine)
+    yield session
+    session.close()
\ No newline at end of file
@@ -0,0 +1,93 @@
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+import pytest
+from sqlalchemy import event
+from domain.testing.entity.test import Test
+from domain.testing.entity.value_objects import TestCategory, TestUnit
+from domain.testing.service.analysis.speed.sprint_analyzer import SprintAnalyzer
+from domain.testing.service.test_management_service import TestManagementService
+from infrastructure.database.cache import TestDefinitionCache
+from infrastructure.database.models.athlete import Athlete
+from infrastructure.database.models.test import TestDefinition
+from infrastructure.database.repositories.test_repository import SQLAlchemyTestRepository
+
+RESULT_COUNT = 25
+PAGE_SIZES = (1, 5, RESULT_COUNT)
+
+@pytest.fixture
+def history(sqlite_session):
+    """An athlete with RESULT_COUNT sprint results, each with a stored analysis"""
+    athlete_id = uuid4()
+    athlete = Athlete(id=athlete_id, first_name='Test', last_name='Athlete',
+                      birthdate=date(2008, 5, 1), gender='male', sport='football')
+    test = Test(name='20m Sprint', category=TestCategory.SPEED, primary_unit=TestUnit.SECONDS, id=uuid4())
+    sqlite_session.add_all([athlete, TestDefinition.from_entity(test)])
+    sqlite_session.flush()
+
+    # Never re-check the cache version, so definition lookups stay off the count
+    repository = SQLAlchemyTestRepository(
+        sqlite_session, definition_cache=TestDefinitionCache(check_interval=float('inf'))
+    )
+    start = datetime(2026, 1, 1)
+    results = [
+        repository.save_result(test.id, athlete_id, {'primary_value': 3.0 + day / 100},
+                               test_date=start + timedelta(days=day))
+        for day in range(RESULT_COUNT)
+    ]
+    # Stored after all results, since each new result invalidates earlier analyses
+    for result in results:
+        repository.save_analysis(result.id, {
+            "analyzer_type": SprintAnalyzer.__name__,
+            "analyzer_version": SprintAnalyzer.VERSION,
+            "payload": {"metrics": {"time": result.value}}
+        })
+    # Read back as a later request would, not from the identity map
+    sqlite_session.commit()
+    sqlite_session.expunge_all()
+    return repository, athlete_id, test.id
+
+def count_statements(engine, call) -> int:
+    """Number of SQL statements executed by call()"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        call()
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return len(statements)
+
+def test_repository_history_page_loads_results_and_analyses_together(history, sqlite_engine):
+    repository, athlete_id, test_id = history
+
+    key = (SprintAnalyzer.__name__, SprintAnalyzer.VERSION)
+
+    counts = {}
+    for limit in PAGE_SIZES:
+        pages = []
+        counts[limit] = count_statements(sqlite_engine, lambda: pages.append(
+            repository.get_athlete_history(athlete_id=athlete_id, test_id=test_id, limit=limit)))
+        assert len(pages[0]) == limit
+        assert all(key in analyses for _, analyses in pages[0])
+
+    # One query for the page of results, one for their stored analyses
+    assert set(counts.values()) == {2}, counts
+
+def test_service_history_page_query_count_does_not_grow_with_page_size(history, sqlite_engine):
+    repository, athlete_id, test_id = history
+    service = TestManagementService(repository)
+    # Load the test definition into the cache first
+    service.get_athlete_test_history(athlete_id, test_id, limit=1)
+
+    counts = {}
+    for limit in PAGE_SIZES:
+        entries = []
+        counts[limit] = count_statements(sqlite_engine, lambda: entries.extend(
+            service.get_athlete_test_history(athlete_id, test_id, limit=limit)))
+        assert len(entries) == limit
+        assert all(entry['analysis'] is not None for entry in entries)
+
+    assert len(set(counts.values())) == 1, counts
\ No newline at end of file
@@ -0,0 +1,71 @@
+from contextlib import contextmanager
+from datetime import date, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+from flask import Flask
+from sqlalchemy.orm import Session
+from domain.testing.entity.test import Test
+from domain.testing.entity.value_objects import TestCategory, TestUnit
+from domain.testing.service.test_management_service import TestManagementService
+from infrastructure.database.models.athlete import Athlete
+from infrastructure.database.models.group import Group, AthleteGroup
+from infrastructure.database.models.test import TestDefinition
+from infrastructure.database.repositories.test_repository import SQLAlchemyTestRepository
+from interfaces.web.blueprints.testing.routes import init_testing_routes
+
+SPRINT_TIMES = (3.1, 3.3, 3.5)
+
+@pytest.fixture
+def squad(sqlite_session):
+    """A group of athletes with one sprint result each"""
+    group = Group(id=uuid4(), name='U16', type='natural', sport='football', gender='male',
+                  min_age=14, max_age=15, is_custom=False)
+    test = Test(name='20m Sprint', category=TestCategory.SPEED, primary_unit=TestUnit.SECONDS, id=uuid4())
+    athletes = [Athlete(id=uuid4(), first_name='Test', last_name=str(i), birthdate=date(2011, 5, 1),
+                        gender='male', sport='football')
+                for i in range(len(SPRINT_TIMES))]
+    sqlite_session.add_all([group, TestDefinition.from_entity(test), *athletes])
+    sqlite_session.flush()
+    sqlite_session.add_all([AthleteGroup(athlete_id=athlete.id, group_id=group.id) for athlete in athletes])
+
+    repository = SQLAlchemyTestRepository(sqlite_session)
+    for athlete, time in zip(athletes, SPRINT_TIMES):
+        repository.save_result(test.id, athlete.id, {'primary_value': time}, test_date=datetime(2026, 3, 1))
+    sqlite_session.commit()
+    return group.id, test.id, [athlete.id for athlete in athletes]
+
+@pytest.fixture
+def client(sqlite_engine):
+    @contextmanager
+    def read_session():
+        session = Session(sqlite_engine)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app = Flask(__name__)
+    app.db = SimpleNamespace(read_session=read_session)
+    app.register_blueprint(init_testing_routes(TestManagementService(SQLAlchemyTestRepository(None))))
+    return app.test_client()
+
+def test_group_rankings_route_ranks_every_member(squad, client):
+    group_id, test_id, athlete_ids = squad
+
+    response = client.get(f'/api/testing/groups/{group_id}/rankings', query_string={'test_id': str(test_id)})
+
+    assert response.status_code == 200, response.get_json()
+    body = response.get_json()
+    assert body['group_id'] == str(group_id)
+    assert set(body['rankings']) == {str(athlete_id) for athlete_id in athlete_ids}
+    for athlete_id, time in zip(athlete_ids, SPRINT_TIMES):
+        assert body['rankings'][str(athlete_id)][str(test_id)]['value'] == pytest.approx(time)
+    assert body['group_statistics'][str(test_id)]['count'] == len(SPRINT_TIMES)
+
+def test_group_rankings_route_rejects_missing_tests(squad, client):
+    group_id, _, _ = squad
+
+    response = client.get(f'/api/testing/groups/{group_id}/rankings')
+
+    assert response.status_code == 400
@@ -0,0 +1,241 @@
+from datetime import date, datetime
+from uuid import uuid4
+import numpy as np
+import pytest
+from domain.athlete.entity.athlete import Athlete as AthleteEntity
+from domain.athlete.entity.value_objects import EmailAddress, Gender, Name
+from domain.testing.entity.test import Test
+from domain.testing.entity.value_objects import TestCategory, TestUnit
+from infrastructure.database.cache import TestDefinitionCache
+from infrastructure.database.models.athlete import Athlete
+from infrastructure.database.models.group import Group, AthleteGroup
+from infrastructure.database.models.test import TestResult
+from infrastructure.database.repositories.athlete_repository import SQLAlchemyAthleteRepository
+from infrastructure.database.repositories.test_repository import SQLAlchemyTestRepository
+from infrastructure.memory import InMemoryAthleteRepository, InMemoryGroupRepository, InMemoryTestRepository
+
+class MemoryBackend:
+    def __init__(self):
+        self._athletes = InMemoryAthleteRepository()
+        self._groups = InMemoryGroupRepository(self._athletes)
+        self.repository = InMemoryTestRepository(athletes=self._athletes, groups=self._groups)
+
+    def add_group_member(self, athlete_id, group_id):
+        self._athletes.save(AthleteEntity(Name('Test', str(athlete_id)), date(2010, 1, 1), Gender.MALE,
+                                          'football', id=athlete_id))
+        self._groups.add_to_group(athlete_id, group_id)
+
+class SQLiteBackend:
+    def __init__(self, session):
+        self._session = session
+        self.repository = SQLAlchemyTestRepository(session, definition_cache=TestDefinitionCache())
+
+    def add_group_member(self, athlete_id, group_id):
+        if self._session.get(Group, group_id) is None:
+            self._session.add(Group(id=group_id, name=str(group_id), type='custom',
+                                    sport='football', gender='male', is_custom=True))
+        self._session.add_all([
+            Athlete(id=athlete_id, first_name='Test', last_name=str(athlete_id),
+                    birthdate=date(2010, 1, 1), gender='male', sport='football'),
+            AthleteGroup(athlete_id=athlete_id, group_id=group_id)
+        ])
+        self._session.flush()
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def backend(request):
+    if request.param == 'memory':
+        return MemoryBackend()
+    return SQLiteBackend(request.getfixturevalue('sqlite_session'))
+
+@pytest.fixture
+def test_id(backend):
+    test = Test(name='Countermovement Jump', category=TestCategory.POWER,
+                primary_unit=TestUnit.CENTIMETERS, id=uuid4())
+    backend.repository.save(test)
+    return test.id
+
+@pytest.fixture
+def board(backend, test_id):
+    """A group of four athletes with jump heights (results in date order)"""
+    group_id = uuid4()
+    heights = [[30.0, 34.0], [36.0, 33.0], [34.0], [28.0]]
+    athlete_ids = sorted(uuid4() for _ in heights)
+    for athlete_id, values in zip(athlete_ids, heights):
+        backend.add_group_member(athlete_id, group_id)
+        for day, value in enumerate(values, 1):
+            backend.repository.save_result(test_id, athlete_id, {'primary_value': value},
+                                           test_date=datetime(2026, 2, day))
+    return group_id, athlete_ids
+
+def test_promote_variable_returns_the_slot(backend, test_id):
+    repository = backend.repository
+
+    assert repository.promote_variable(test_id, 'peak_power') == 1
+    assert repository.promote_variable(test_id, 'contact_time') == 2
+    # Promoting again keeps the slot
+    assert repository.promote_variable(test_id, 'peak_power') == 1
+
+def test_promote_variable_runs_out_of_slots(backend, test_id):
+    for slot in range(1, TestResult.PROMOTED_SLOTS + 1):
+        backend.repository.promote_variable(test_id, f'variable_{slot}')
+
+    with pytest.raises(ValueError):
+        backend.repository.promote_variable(test_id, 'one_too_many')
+
+def test_promote_variable_rejects_unknown_test(backend):
+    with pytest.raises(ValueError):
+        backend.repository.promote_variable(uuid4(), 'peak_power')
+
+def test_result_summary(backend, test_id, board):
+    _, athlete_ids = board
+
+    summary = backend.repository.get_result_summary(athlete_ids[0], test_id)
+
+    assert summary["count"] == 2
+    assert summary["mean"] == pytest.approx(32.0)
+    assert (summary["min"], summary["max"], summary["latest_value"]) == (30.0, 34.0, 34.0)
+    assert summary["latest_test_date"] == datetime(2026, 2, 2)
+
+def test_results_matrix(backend, test_id, board):
+    _, athlete_ids = board
+
+    matrix = backend.repository.get_results_matrix(athlete_ids, [test_id])
+
+    # Most recent result first along the last axis
+    assert matrix.values.shape == (4, 1, 2)
+    assert matrix.values[0, 0].tolist() == [34.0, 30.0]
+    assert matrix.mask[2, 0].tolist() == [True, False]
+    assert matrix.dates[1, 0, 0] == np.datetime64('2026-02-02')
+    assert backend.repository.get_results_matrix(athlete_ids, [test_id], max_results=1).values.shape == (4, 1, 1)
+
+def test_latest_results(backend, test_id, board):
+    _, athlete_ids = board
+
+    latest = backend.repository.get_latest_results(athlete_ids, [test_id], as_of=datetime(2026, 2, 1))
+    assert latest.values[:, 0, 0].tolist() == [30.0, 36.0, 34.0, 28.0]
+
+    nobody = backend.repository.get_latest_results([uuid4()], [test_id])
+    assert nobody.values.shape == (1, 1, 1)
+    assert not nobody.mask.any()
+
+def test_leaderboard_best(backend, test_id, board):
+    group_id, athlete_ids = board
+
+    entries = backend.repository.get_leaderboard(group_id, test_id, limit=3)
+
+    # Athletes 0 and 2 tie on 34.0 and are ordered by id
+    assert [(entry["position"], entry["athlete_id"], entry["value"]) for entry in entries] == [
+        (1, athlete_ids[1], 36.0),
+        (2, athlete_ids[0], 34.0),
+        (3, athlete_ids[2], 34.0)
+    ]
+
+def test_leaderboard_latest_lower_is_better(backend, test_id, board):
+    group_id, athlete_ids = board
+
+    entries = backend.repository.get_leaderboard(group_id, test_id, metric='latest', higher_is_better=False)
+
+    assert [entry["athlete_id"] for entry in entries] == [athlete_ids[3], athlete_ids[1],
+                                                         athlete_ids[0], athlete_ids[2]]
+    assert entries[0]["latest_test_date"] == datetime(2026, 2, 1)
+
+def test_leaderboard_standing(backend, test_id, board):
+    group_id, athlete_ids = board
+
+    standing = backend.repository.get_leaderboard_standing(group_id, test_id, athlete_ids[2], neighbors=1)
+
+    # Shares rank 2 with athlete 0 but is placed after it
+    assert (standing["rank"], standing["position"], standing["board_size"]) == (2, 3, 4)
+    assert standing["value"] == 34.0
+    assert [(entry["position"], entry["athlete_id"]) for entry in standing["above"]] == [(2, athlete_ids[0])]
+    assert [(entry["position"], entry["athlete_id"]) for entry in standing["below"]] == [(4, athlete_ids[3])]
+
+def test_leaderboard_standing_off_the_board(backend, test_id, board):
+    group_id, _ = board
+
+    assert backend.repository.get_leaderboard_standing(group_id, test_id, uuid4()) is None
+
+def test_leaderboard_rejects_unknown_metric(backend, test_id, board):
+    group_id, _ = board
+
+    with pytest.raises(ValueError):
+        backend.repository.get_leaderboard(group_id, test_id, metric='average')
+
+
+# Athlete repositories
+
+AS_OF = date(2026, 9, 1)
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def athletes(request):
+    if request.param == 'memory':
+        return InMemoryAthleteRepository()
+    return SQLAlchemyAthleteRepository(request.getfixturevalue('sqlite_session'))
+
+@pytest.fixture
+def roster(athletes):
+    """Athletes born either side of the U14 and 20+ bracket edges on AS_OF"""
+    births = {
+        'turns_13': date(2013, 9, 1),
+        'still_12': date(2013, 9, 2),
+        'still_14': date(2011, 9, 2),
+        'turns_15': date(2011, 9, 1),
+        'still_20': date(2005, 9, 2),
+        'turns_21': date(2005, 9, 1)
+    }
+    saved = {key: athletes.save(AthleteEntity(Name('Test', key), birthdate, Gender.MALE, 'football', id=uuid4()))
+             for key, birthdate in births.items()}
+    saved['plays_up'] = athletes.save(AthleteEntity(Name('Test', 'plays_up'), date(2016, 1, 1), Gender.FEMALE,
+                                                    'football', custom_team='U14', id=uuid4()))
+    return {key: athlete.id for key, athlete in saved.items()}
+
+def _found(athletes, **criteria):
+    return {athlete.id for athlete in athletes.find_by_criteria(as_of=AS_OF, **criteria)}
+
+def test_age_group_bracket_edges(athletes, roster):
+    assert _found(athletes, age_group='U14') == {roster['turns_13'], roster['still_14'], roster['plays_up']}
+    assert _found(athletes, age_group='U12') == {roster['still_12']}
+    assert _found(athletes, age_group='U16') == {roster['turns_15']}
+
+def test_open_ended_age_group(athletes, roster):
+    assert _found(athletes, age_group='U20') == {roster['still_20']}
+    assert _found(athletes, age_group='20+') == {roster['turns_21']}
+
+def test_age_group_with_other_criteria(athletes, roster):
+    assert _found(athletes, age_group='U14', gender=Gender.FEMALE) == {roster['plays_up']}
+    assert _found(athletes, age_group='U14', gender=Gender.MALE) == {roster['turns_13'], roster['still_14']}
+
+def test_athlete_round_trip(athletes):
+    athlete = AthleteEntity(Name('Ada', 'Stone'), date(2012, 3, 4), Gender.FEMALE, 'hockey',
+                            email=EmailAddress('ada@example.com'), custom_team='U14', id=uuid4())
+    athletes.save(athlete)
+
+    found = athletes.get(athlete.id)
+    assert (found.name, found.birthdate, found.sport, found.custom_team) == (
+        Name('Ada', 'Stone'), date(2012, 3, 4), 'hockey', 'U14')
+    assert Gender(found.gender) == Gender.FEMALE
+    assert found.email.value == 'ada@example.com'
+    assert athletes.get(uuid4()) is None
+
+def test_athlete_lookups(athletes, roster):
+    athletes.save(AthleteEntity(Name('Ada', 'Stone'), date(2012, 3, 4), Gender.FEMALE, 'hockey',
+                                email=EmailAddress('ada@example.com'), id=uuid4()))
+
+    assert athletes.find_by_name(Name('Test', 'still_20')).id == roster['still_20']
+    assert athletes.find_by_name(Name('Test', 'nobody')) is None
+    assert athletes.find_by_email('ada@example.com').name == Name('Ada', 'Stone')
+    assert athletes.find_by_email('nobody@example.com') is None
+
+def test_athlete_criteria(athletes, roster):
+    athletes.save(AthleteEntity(Name('Ada', 'Stone'), date(2012, 3, 4), Gender.FEMALE, 'hockey', id=uuid4()))
+
+    assert _found(athletes, sport='football') == set(roster.values())
+    assert _found(athletes, sport='football', gender=Gender.FEMALE) == {roster['plays_up']}
+    assert _found(athletes, custom_team='U14') == {roster['plays_up']}
+
+def test_athlete_delete(athletes, roster):
+    athletes.delete(roster['plays_up'])
+    athletes.delete(uuid4())
+
+    assert athletes.get(roster['plays_up']) is None
+    assert _found(athletes, custom_team='U14') == set()
@@ -0,0 +1,48 @@
+from datetime import datetime
+from uuid import uuid4
+import pytest
+from domain.testing.entity.test import Test
+from domain.testing.entity.value_objects import TestCategory, TestUnit
+from infrastructure.database.models.test import TestDefinition
+from infrastructure.database.repositories.test_repository import SQLAlchemyTestRepository
+
+@pytest.fixture
+def sprint(sqlite_session):
+    test = Test(name='20m Sprint', category=TestCategory.SPEED, primary_unit=TestUnit.SECONDS, id=uuid4())
+    sqlite_session.add(TestDefinition.from_entity(test))
+    sqlite_session.flush()
+    return SQLAlchemyTestRepository(sqlite_session), test.id
+
+def test_results_without_primary_value_stay_out_of_summaries(sprint):
+    repository, test_id = sprint
+    athlete_id = uuid4()
+
+    batch = repository.save_results_bulk([
+        {'item_index': i, 'test_id': test_id, 'athlete_id': athlete_id,
+         'values': values, 'test_date': datetime(2026, 1, i + 1)}
+        for i, values in enumerate([{'primary_value': 3.2}, {}, {'primary_value': 3.0}])
+    ])
+
+    assert (batch['saved_items'], batch['failed_items']) == (2, 1)
+    summary = repository.get_result_summary(athlete_id, test_id)
+    assert summary['count'] == 2
+    assert (summary['min'], summary['max'], summary['latest_value']) == (3.0, 3.2, 3.0)
+    assert summary['mean'] == pytest.approx(3.1)
+
+def test_merging_none_values_skips_them(sprint):
+    repository, test_id = sprint
+    athlete_id = uuid4()
+    row = {'athlete_id': athlete_id, 'test_definition_id': test_id}
+
+    repository._merge_result_summaries([
+        {**row, 'primary_value': None, 'test_date': datetime(2026, 1, 3)},
+        {**row, 'primary_value': 3.4, 'test_date': datetime(2026, 1, 1)},
+        {**row, 'primary_value': 3.3, 'test_date': datetime(2026, 1, 2)}
+    ])
+    repository._merge_result_summaries([{**row, 'primary_value': None, 'test_date': datetime(2026, 1, 4)}])
+
+    summary = repository.get_result_summary(athlete_id, test_id)
+    assert summary['count'] == 2
+    assert (summary['min'], summary['max'], summary['latest_value']) == (3.3, 3.4, 3.3)
+    assert summary['latest_test_date'] == datetime(2026, 1, 2)
+    assert repository.get_result_summary(uuid4(), test_id) is None
@@ -0,0 +1,25 @@
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import select
+from domain.testing.entity.test import Test
+from domain.testing.entity.value_objects import TestCategory, TestUnit
+from infrastructure.database.models.test import TestDefinition, TestResult
+from infrastructure.database.repositories.test_repository import SQLAlchemyTestRepository
+
+def test_single_and_bulk_inserts_get_timestamps(sqlite_session):
+    test = Test(name='20m Sprint', category=TestCategory.SPEED, primary_unit=TestUnit.SECONDS, id=uuid4())
+    sqlite_session.add(TestDefinition.from_entity(test))
+    sqlite_session.flush()
+    repository = SQLAlchemyTestRepository(sqlite_session)
+
+    repository.save_result(test.id, uuid4(), {'primary_value': 3.1}, test_date=datetime(2026, 1, 1))
+    batch = repository.save_results_bulk([
+        {'item_index': i, 'test_id': test.id, 'athlete_id': uuid4(),
+         'values': {'primary_value': 3.0 + i / 10}, 'test_date': datetime(2026, 1, 2)}
+        for i in range(3)
+    ])
+
+    assert batch['saved_items'] == 3
+    stamps = sqlite_session.execute(select(TestResult.created_at, TestResult.updated_at)).all()
+    assert len(stamps) == 4
+    assert all(created_at and updated_at for created_at, updated_at in stamps)
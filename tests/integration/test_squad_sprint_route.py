@@ -0,0 +1,58 @@
+from datetime import datetime
+from uuid import uuid4
+import pytest
+from flask import Flask
+from domain.testing.entity.test import Test
+from domain.testing.entity.value_objects import TestCategory, TestUnit
+from domain.testing.service.analysis.speed.sprint_analyzer import SPRINT_TEST_NAMES
+from domain.testing.service.test_management_service import TestManagementService
+from infrastructure.memory import InMemoryTestRepository
+from interfaces.web.blueprints.testing.routes import init_testing_routes
+
+# 10m, 20m and flying 10m times per athlete
+SPLITS = [(1.85, 3.10, 1.20), (1.95, 3.30, None)]
+
+@pytest.fixture
+def squad():
+    """Repository with sprint splits for two athletes and an athlete with none"""
+    repository = InMemoryTestRepository()
+    tests = [repository.save(Test(name=name, category=TestCategory.SPEED,
+                                  primary_unit=TestUnit.SECONDS, id=uuid4()))
+             for name in SPRINT_TEST_NAMES]
+    athlete_ids = [uuid4() for _ in SPLITS]
+    for athlete_id, times in zip(athlete_ids, SPLITS):
+        for test, time in zip(tests, times):
+            if time is not None:
+                repository.save_result(test.id, athlete_id, {'primary_value': time},
+                                       test_date=datetime(2026, 4, 1))
+    return repository, athlete_ids, uuid4()
+
+@pytest.fixture
+def client(squad):
+    repository, _, _ = squad
+    app = Flask(__name__)
+    app.register_blueprint(init_testing_routes(TestManagementService(repository)))
+    return app.test_client()
+
+def test_squad_sprint_profiles_serialize(squad, client):
+    _, athlete_ids, untested_id = squad
+
+    response = client.post('/api/testing/sprints/squad', json={
+        'athlete_ids': [str(athlete_id) for athlete_id in [*athlete_ids, untested_id]]
+    })
+
+    assert response.status_code == 200, response.get_json()
+    body = response.get_json()
+    assert set(body['profiles']) == {str(athlete_id) for athlete_id in athlete_ids}
+    assert body['incomplete'] == [str(untested_id)]
+
+    fast, slow = (body['profiles'][str(athlete_id)] for athlete_id in athlete_ids)
+    assert fast['sprint_times'] == {'10m': 1.85, '20m': 3.10, 'flying_10m': 1.20}
+    assert 'max_speed' in fast
+    assert slow['sprint_times']['flying_10m'] is None
+    assert 'max_speed' not in slow
+
+def test_squad_sprint_route_validates_input(client):
+    response = client.post('/api/testing/sprints/squad', json={'athlete_ids': []})
+
+    assert response.status_code == 400